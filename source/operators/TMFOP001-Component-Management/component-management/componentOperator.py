@@ -16,7 +16,9 @@ import traceback
 from kubernetes.client.rest import ApiException
 import os
 import asyncio
+import copy
 from log_wrapper import LogWrapper, logwrapper
+import k8s_async
 import re
 
 # Setup logging
@@ -43,6 +45,21 @@ logger.info(f"Monitoring namespace %s", component_namespace)
 
 componentname_label = os.getenv("COMPONENTNAME_LABEL", "oda.tmforum.org/componentName")
 
+# "perHandler" (default): kopf runs each component segment handler in its own processing cycle and status patch.
+# "coalesced": all segment handlers run in one processing cycle and their results are written with a single status patch.
+reconcile_mode = os.getenv("COMPONENT_RECONCILE_MODE", "perHandler")
+logger.info(f"Reconcile mode %s", reconcile_mode)
+
+# resources of the same component created within this interval (seconds) are adopted together
+ADOPTION_BATCH_INTERVAL = float(os.getenv("ADOPTION_BATCH_INTERVAL", "0.2"))
+pending_adoptions = {}  # (namespace, component name) -> queued resources to adopt
+adoption_metrics = {
+    "owner_index_hits": 0,
+    "owner_lookups": 0,
+    "batches": 0,
+    "adopted": 0,
+}
+
 # Constants
 HTTP_CONFLICT = 409
 HTTP_NOT_FOUND = 404
@@ -112,6 +129,11 @@ SEGMENT_CONFIG = {
 @kopf.on.startup()
 def configure(settings: kopf.OperatorSettings, **_):
     settings.watching.server_timeout = 1 * 60
+    if reconcile_mode == "coalesced":
+        # coreAPIs, managementAPIs, ..., subscribedEvents are all triggered by the same event.
+        # Running them at once merges their results into one status patch, which triggers summary only once.
+        settings.execution.lifecycle = kopf.lifecycles.all_at_once
+
 
 @kopf.on.resume(GROUP, VERSION, COMPONENTS_PLURAL, retries=5)
 @kopf.on.create(GROUP, VERSION, COMPONENTS_PLURAL, retries=5)
@@ -499,9 +521,9 @@ async def identityConfig(
         identityConfigName = name
         identityConfig = None
 
-        custom_objects_api = kubernetes.client.CustomObjectsApi()
+        custom_objects_api = k8s_async.custom_objects_api()
         try:
-            identityConfig = custom_objects_api.get_namespaced_custom_object(
+            identityConfig = await custom_objects_api.get_namespaced_custom_object(
                 group=IDENTITYCONFIG_GROUP,
                 version=IDENTITYCONFIG_VERSION,
                 namespace=namespace,
@@ -559,13 +581,15 @@ async def identityConfig(
 
             if resourceChanged:
                 try:
-                    identityConfig = custom_objects_api.patch_namespaced_custom_object(
-                        group=IDENTITYCONFIG_GROUP,
-                        version=IDENTITYCONFIG_VERSION,
-                        namespace=namespace,
-                        plural=IDENTITYCONFIG_PLURAL,
-                        name=identityConfigName,
-                        body=identityConfig,
+                    identityConfig = (
+                        await custom_objects_api.patch_namespaced_custom_object(
+                            group=IDENTITYCONFIG_GROUP,
+                            version=IDENTITYCONFIG_VERSION,
+                            namespace=namespace,
+                            plural=IDENTITYCONFIG_PLURAL,
+                            name=identityConfigName,
+                            body=identityConfig,
+                        )
                     )
                     logw.info(f"IdentityConfig resource patched")
                     logw.debug(f"IdentityConfig resource {identityConfig}")
@@ -860,9 +884,9 @@ async def deleteExposedAPI(
     """
 
     logw.info(f"Deleting API {deleteExposedAPIName}")
-    custom_objects_api = kubernetes.client.CustomObjectsApi()
+    custom_objects_api = k8s_async.custom_objects_api()
     try:
-        api_response = custom_objects_api.delete_namespaced_custom_object(
+        api_response = await custom_objects_api.delete_namespaced_custom_object(
             group=GROUP,
             version=VERSION,
             namespace=namespace,
@@ -897,14 +921,16 @@ async def deleteDependentAPI(
 
     logw.info(f"Deleting DependentAPI {dependentAPIName}")
 
-    custom_objects_api = kubernetes.client.CustomObjectsApi()
+    custom_objects_api = k8s_async.custom_objects_api()
     try:
-        dependentapi_response = custom_objects_api.delete_namespaced_custom_object(
-            group=GROUP,
-            version=DEPENDENTAPI_VERSION,
-            namespace=namespace,
-            plural=DEPENDENTAPI_PLURAL,
-            name=dependentAPIName,
+        dependentapi_response = (
+            await custom_objects_api.delete_namespaced_custom_object(
+                group=GROUP,
+                version=DEPENDENTAPI_VERSION,
+                namespace=namespace,
+                plural=DEPENDENTAPI_PLURAL,
+                name=dependentAPIName,
+            )
         )
         logw.debug(f"DependentAPI response {dependentapi_response}")
     except ApiException as e:
@@ -933,14 +959,16 @@ async def deleteSecretsManagement(
     """
 
     logw.info(f"Deleting SecretsManagement {secretsManagementName}")
-    custom_objects_api = kubernetes.client.CustomObjectsApi()
+    custom_objects_api = k8s_async.custom_objects_api()
     try:
-        secretsmanagement_response = custom_objects_api.delete_namespaced_custom_object(
-            group=GROUP,
-            version=SECRETSMANAGEMENT_VERSION,
-            namespace=namespace,
-            plural=SECRETSMANAGEMENT_PLURAL,
-            name=secretsManagementName,
+        secretsmanagement_response = (
+            await custom_objects_api.delete_namespaced_custom_object(
+                group=GROUP,
+                version=SECRETSMANAGEMENT_VERSION,
+                namespace=namespace,
+                plural=SECRETSMANAGEMENT_PLURAL,
+                name=secretsManagementName,
+            )
         )
         logw.debug(f"SecretsManagement response {secretsmanagement_response}")
     except ApiException as e:
@@ -969,14 +997,16 @@ async def deleteIdentityConfig(
     """
 
     logw.info(f"Deleting IdentityConfig {identityConfigName}")
-    custom_objects_api = kubernetes.client.CustomObjectsApi()
+    custom_objects_api = k8s_async.custom_objects_api()
     try:
-        identityconfig_response = custom_objects_api.delete_namespaced_custom_object(
-            group=GROUP,
-            version=IDENTITYCONFIG_VERSION,
-            namespace=namespace,
-            plural=IDENTITYCONFIG_PLURAL,
-            name=identityConfigName,
+        identityconfig_response = (
+            await custom_objects_api.delete_namespaced_custom_object(
+                group=GROUP,
+                version=IDENTITYCONFIG_VERSION,
+                namespace=namespace,
+                plural=IDENTITYCONFIG_PLURAL,
+                name=identityConfigName,
+            )
         )
         logw.debug(f"IdentityConfig response {identityconfig_response}")
     except ApiException as e:
@@ -1621,11 +1651,11 @@ async def patchAPIResource(
     returnAPIObject = {}
 
     try:
-        custom_objects_api = kubernetes.client.CustomObjectsApi()
+        custom_objects_api = k8s_async.custom_objects_api()
         # only patch if the API resource spec has changed
 
         # get current api resource and compare it to APIResource
-        apiObj = custom_objects_api.get_namespaced_custom_object(
+        apiObj = await custom_objects_api.get_namespaced_custom_object(
             group=GROUP,
             version=VERSION,
             namespace=namespace,
@@ -1638,7 +1668,7 @@ async def patchAPIResource(
             logw.debug(f"Comparing old API {APIResource['spec']}")
             logw.debug(f"Comparing new API {apiObj['spec']}")
 
-            apiObj = custom_objects_api.patch_namespaced_custom_object(
+            apiObj = await custom_objects_api.patch_namespaced_custom_object(
                 group=GROUP,
                 version=VERSION,
                 namespace=namespace,
@@ -1697,10 +1727,10 @@ async def createAPIResource(
     returnAPIObject = {}
 
     try:
-        custom_objects_api = kubernetes.client.CustomObjectsApi()
+        custom_objects_api = k8s_async.custom_objects_api()
         logw.info(f"Creating ExposedAPI Custom Object {APIResource}")
 
-        apiObj = custom_objects_api.create_namespaced_custom_object(
+        apiObj = await custom_objects_api.create_namespaced_custom_object(
             group=GROUP,
             version=VERSION,
             namespace=namespace,
@@ -1758,10 +1788,10 @@ async def createDependentAPIResource(
     returnDependentAPIObject = {}
 
     try:
-        custom_objects_api = kubernetes.client.CustomObjectsApi()
+        custom_objects_api = k8s_async.custom_objects_api()
         logw.info(f"Creating DependentAPI Custom Object {DependentAPIResource}")
 
-        dependentAPIObj = custom_objects_api.create_namespaced_custom_object(
+        dependentAPIObj = await custom_objects_api.create_namespaced_custom_object(
             group=GROUP,
             version=DEPENDENTAPI_VERSION,
             namespace=namespace,
@@ -1785,13 +1815,15 @@ async def createDependentAPIResource(
             # Conflict = try updating existing cr
             logw.info(f"DependentAPI already exists {DependentAPIResource}")
             try:
-                dependentAPIObj = custom_objects_api.patch_namespaced_custom_object(
-                    group=GROUP,
-                    version=DEPENDENTAPI_VERSION,
-                    namespace=namespace,
-                    plural=DEPENDENTAPI_PLURAL,
-                    name=cr_name,
-                    body=DependentAPIResource,
+                dependentAPIObj = (
+                    await custom_objects_api.patch_namespaced_custom_object(
+                        group=GROUP,
+                        version=DEPENDENTAPI_VERSION,
+                        namespace=namespace,
+                        plural=DEPENDENTAPI_PLURAL,
+                        name=cr_name,
+                        body=DependentAPIResource,
+                    )
                 )
                 logw.debugInfo(
                     f"DependentAPI Resource updated {DependentAPIResource["metadata"]["name"]}",
@@ -1840,12 +1872,12 @@ async def createSecretsManagementResource(
     returnSecretsManagementObject = {}
 
     try:
-        custom_objects_api = kubernetes.client.CustomObjectsApi()
+        custom_objects_api = k8s_async.custom_objects_api()
         logw.info(
             f"Creating SecretsManagement Custom Object {SecretsManagementResource}"
         )
 
-        secretsManagementObj = custom_objects_api.create_namespaced_custom_object(
+        secretsManagementObj = await custom_objects_api.create_namespaced_custom_object(
             group=GROUP,
             version=SECRETSMANAGEMENT_VERSION,
             namespace=namespace,
@@ -1897,10 +1929,10 @@ async def createIdentityConfigResource(logw: LogWrapper, inIdentityConfig, names
     returnIdentityConfigObject = {}
 
     try:
-        custom_objects_api = kubernetes.client.CustomObjectsApi()
+        custom_objects_api = k8s_async.custom_objects_api()
         logw.info(f"Creating IdentityConfig Custom Object {IdentityConfigResource}")
 
-        identityConfigObj = custom_objects_api.create_namespaced_custom_object(
+        identityConfigObj = await custom_objects_api.create_namespaced_custom_object(
             group=GROUP,
             version=IDENTITYCONFIG_VERSION,
             namespace=namespace,
@@ -1937,128 +1969,236 @@ async def createIdentityConfigResource(logw: LogWrapper, inIdentityConfig, names
 
 @kopf.on.resume("", "v1", "services", retries=5)
 @kopf.on.create("", "v1", "services", retries=5)
-async def adopt_service(meta, spec, body, namespace, labels, name, **kwargs):
+async def adopt_service(
+    meta, spec, body, namespace, labels, name, component_owners, **kwargs
+):
     # del unused-arguments for linting
     del kwargs
 
-    return adopt_kubernetesResource(
-        meta, spec, body, namespace, labels, name, "service"
+    return await adopt_kubernetesResource(
+        meta, spec, body, namespace, labels, name, "service", component_owners
     )
 
 
 @kopf.on.resume("apps", "v1", "deployments", retries=5)
 @kopf.on.create("apps", "v1", "deployments", retries=5)
-async def adopt_deployment(meta, spec, body, namespace, labels, name, **kwargs):
+async def adopt_deployment(
+    meta, spec, body, namespace, labels, name, component_owners, **kwargs
+):
     # del unused-arguments for linting
     del kwargs
 
-    return adopt_kubernetesResource(
-        meta, spec, body, namespace, labels, name, "deployment"
+    return await adopt_kubernetesResource(
+        meta, spec, body, namespace, labels, name, "deployment", component_owners
     )
 
 
 @kopf.on.resume("", "v1", "persistentvolumeclaims", retries=5)
 @kopf.on.create("", "v1", "persistentvolumeclaims", retries=5)
 async def adopt_persistentvolumeclaim(
-    meta, spec, body, namespace, labels, name, **kwargs
+    meta, spec, body, namespace, labels, name, component_owners, **kwargs
 ):
     # del unused-arguments for linting
     del kwargs
 
-    return adopt_kubernetesResource(
-        meta, spec, body, namespace, labels, name, "persistentvolumeclaim"
+    return await adopt_kubernetesResource(
+        meta,
+        spec,
+        body,
+        namespace,
+        labels,
+        name,
+        "persistentvolumeclaim",
+        component_owners,
     )
 
 
 @kopf.on.resume("batch", "v1", "jobs", retries=5)
 @kopf.on.create("batch", "v1", "jobs", retries=5)
-async def adopt_job(meta, spec, body, namespace, labels, name, **kwargs):
+async def adopt_job(
+    meta, spec, body, namespace, labels, name, component_owners, **kwargs
+):
     # del unused-arguments for linting
     del kwargs
 
-    return adopt_kubernetesResource(meta, spec, body, namespace, labels, name, "job")
+    return await adopt_kubernetesResource(
+        meta, spec, body, namespace, labels, name, "job", component_owners
+    )
 
 
 @kopf.on.resume("batch", "v1", "cronjobs", retries=5)
 @kopf.on.create("batch", "v1", "cronjobs", retries=5)
-async def adopt_cronjob(meta, spec, body, namespace, labels, name, **kwargs):
+async def adopt_cronjob(
+    meta, spec, body, namespace, labels, name, component_owners, **kwargs
+):
     # del unused-arguments for linting
     del kwargs
 
-    return adopt_kubernetesResource(
-        meta, spec, body, namespace, labels, name, "cronjob"
+    return await adopt_kubernetesResource(
+        meta, spec, body, namespace, labels, name, "cronjob", component_owners
     )
 
 
 @kopf.on.resume("apps", "v1", "statefulsets", retries=5)
 @kopf.on.create("apps", "v1", "statefulsets", retries=5)
-async def adopt_statefulset(meta, spec, body, namespace, labels, name, **kwargs):
+async def adopt_statefulset(
+    meta, spec, body, namespace, labels, name, component_owners, **kwargs
+):
     # del unused-arguments for linting
     del kwargs
 
-    return adopt_kubernetesResource(
-        meta, spec, body, namespace, labels, name, "statefulset"
+    return await adopt_kubernetesResource(
+        meta, spec, body, namespace, labels, name, "statefulset", component_owners
     )
 
 
 @kopf.on.resume("", "v1", "configmap", retries=5)
 @kopf.on.create("", "v1", "configmap", retries=5)
-async def adopt_configmap(meta, spec, body, namespace, labels, name, **kwargs):
+async def adopt_configmap(
+    meta, spec, body, namespace, labels, name, component_owners, **kwargs
+):
     # del unused-arguments for linting
     del kwargs
 
-    return adopt_kubernetesResource(
-        meta, spec, body, namespace, labels, name, "configmap"
+    return await adopt_kubernetesResource(
+        meta, spec, body, namespace, labels, name, "configmap", component_owners
     )
 
 
 @kopf.on.resume("", "v1", "secret", retries=5)
 @kopf.on.create("", "v1", "secret", retries=5)
-async def adopt_secret(meta, spec, body, namespace, labels, name, **kwargs):
+async def adopt_secret(
+    meta, spec, body, namespace, labels, name, component_owners, **kwargs
+):
     # del unused-arguments for linting
     del kwargs
 
-    return adopt_kubernetesResource(meta, spec, body, namespace, labels, name, "secret")
+    return await adopt_kubernetesResource(
+        meta, spec, body, namespace, labels, name, "secret", component_owners
+    )
 
 
 @kopf.on.resume("", "v1", "serviceaccount", retries=5)
 @kopf.on.create("", "v1", "serviceaccount", retries=5)
-async def adopt_serviceaccount(meta, spec, body, namespace, labels, name, **kwargs):
+async def adopt_serviceaccount(
+    meta, spec, body, namespace, labels, name, component_owners, **kwargs
+):
     # del unused-arguments for linting
     del kwargs
 
-    return adopt_kubernetesResource(
-        meta, spec, body, namespace, labels, name, "serviceaccount"
+    return await adopt_kubernetesResource(
+        meta, spec, body, namespace, labels, name, "serviceaccount", component_owners
     )
 
 
 @kopf.on.resume("rbac.authorization.k8s.io", "v1", "role", retries=5)
 @kopf.on.create("rbac.authorization.k8s.io", "v1", "role", retries=5)
-async def adopt_role(meta, spec, body, namespace, labels, name, **kwargs):
+async def adopt_role(
+    meta, spec, body, namespace, labels, name, component_owners, **kwargs
+):
     # del unused-arguments for linting
     del kwargs
 
-    return adopt_kubernetesResource(meta, spec, body, namespace, labels, name, "role")
+    return await adopt_kubernetesResource(
+        meta, spec, body, namespace, labels, name, "role", component_owners
+    )
 
 
 @kopf.on.resume("rbac.authorization.k8s.io", "v1", "rolebinding", retries=5)
 @kopf.on.create("rbac.authorization.k8s.io", "v1", "rolebinding", retries=5)
-async def adopt_rolebinding(meta, spec, body, namespace, labels, name, **kwargs):
+async def adopt_rolebinding(
+    meta, spec, body, namespace, labels, name, component_owners, **kwargs
+):
     # del unused-arguments for linting
     del kwargs
 
-    return adopt_kubernetesResource(
-        meta, spec, body, namespace, labels, name, "rolebinding"
+    return await adopt_kubernetesResource(
+        meta, spec, body, namespace, labels, name, "rolebinding", component_owners
     )
 
 
-def adopt_kubernetesResource(meta, spec, body, namespace, labels, name, resourceType):
+# Patch method of the kubernetes client for each adoptable resource type: resourceType -> (api factory, method name)
+ADOPT_PATCH_METHODS = {
+    "service": (k8s_async.core_v1_api, "patch_namespaced_service"),
+    "persistentvolumeclaim": (
+        k8s_async.core_v1_api,
+        "patch_namespaced_persistent_volume_claim",
+    ),
+    "deployment": (k8s_async.apps_v1_api, "patch_namespaced_deployment"),
+    "configmap": (k8s_async.core_v1_api, "patch_namespaced_config_map"),
+    "secret": (k8s_async.core_v1_api, "patch_namespaced_secret"),
+    "job": (k8s_async.batch_v1_api, "patch_namespaced_job"),
+    "cronjob": (k8s_async.batch_v1_api, "patch_namespaced_cron_job"),
+    "statefulset": (k8s_async.apps_v1_api, "patch_namespaced_stateful_set"),
+    "role": (k8s_async.rbac_authorization_v1_api, "patch_namespaced_role"),
+    "rolebinding": (
+        k8s_async.rbac_authorization_v1_api,
+        "patch_namespaced_role_binding",
+    ),
+    "serviceaccount": (k8s_async.core_v1_api, "patch_namespaced_service_account"),
+}
+
+
+@kopf.index(GROUP, VERSION, COMPONENTS_PLURAL)
+def component_owners(namespace, name, uid, **kwargs):
+    """Index of the components, with the fields needed to build owner references.
+
+    kopf keeps the index up to date from its watch on components, so the adopt handlers can set the
+    owner reference without reading the parent component from the API server.
+
+    :meta private:
+    """
+    return {
+        (namespace, name): {
+            "apiVersion": f"{GROUP}/{VERSION}",
+            "kind": "Component",
+            "metadata": {"name": name, "uid": uid},
+        }
+    }
+
+
+async def get_component_owner(namespace, component_name, owner_index, logw):
+    """Helper function to get the component that is the owner of adopted resources.
+
+    The component is taken from the component_owners index. If it is not in the index (e.g. the
+    component was created in the same chart and the watch event has not arrived yet), it is read from
+    the API server.
+
+    :meta private:
+    """
+    if owner_index is not None:
+        for owner in owner_index.get((namespace, component_name), []):
+            adoption_metrics["owner_index_hits"] += 1
+            return owner
+    adoption_metrics["owner_lookups"] += 1
+    try:
+        return await k8s_async.custom_objects_api().get_namespaced_custom_object(
+            GROUP, VERSION, namespace, COMPONENTS_PLURAL, component_name
+        )
+    except ApiException as e:
+        # Cant find parent component (if component in same chart as other kubernetes resources it may not be created yet)
+        if e.status == HTTP_NOT_FOUND:
+            raise kopf.TemporaryError("Cannot find parent component " + component_name)
+        logw.debug(
+            f"Exception when calling custom_objects_api.get_namespaced_custom_object {e}"
+        )
+        raise kopf.TemporaryError(
+            "Error reading parent component " + component_name
+        ) from e
+
+
+async def adopt_kubernetesResource(
+    meta, spec, body, namespace, labels, name, resourceType, owner_index=None
+):
     """Helper function for adopting any kubernetes resource
 
     If the resource has an oda.tmforum.org/componentName label, it makes the resource a child of the named component.
     This can help with navigating around the different resources that belong to the component. It also ensures that the kubernetes garbage collection
     will delete these resources automatically if the component is deleted.
 
+    Resources of the same component that are created within ADOPTION_BATCH_INTERVAL seconds (e.g. by one Helm install) are
+    adopted together: the parent component is looked up once and the resources are patched concurrently.
+
     Args:
         * meta (Dict): The metadata from the yaml resource definition
         * spec (Dict): The spec from the yaml resource definition showing the intent (or desired state)
@@ -2067,6 +2207,7 @@ def adopt_kubernetesResource(meta, spec, body, namespace, labels, name, resource
         * labels (Dict): The labels attached to the resource. All ODA Components (and their children) should have a oda.tmforum.org/componentName label
         * name (String): The name of the resource
         * resourceType (String): The type of resource (e.g. service, deployment, persistentvolumeclaim, job, cronjob, statefulset, configmap, secret, serviceaccount, role, rolebinding)
+        * owner_index (kopf.Index): The component_owners index (optional)
 
     Returns:
         No return value.
@@ -2093,122 +2234,141 @@ def adopt_kubernetesResource(meta, spec, body, namespace, labels, name, resource
         )
         logw.debugInfo("adopt_" + resourceType + " handler called", body)
 
-        try:
-            parent_component = (
-                kubernetes.client.CustomObjectsApi().get_namespaced_custom_object(
-                    GROUP, VERSION, namespace, COMPONENTS_PLURAL, component_name
-                )
+        if resourceType not in ADOPT_PATCH_METHODS:
+            logw.error(f"Unsupported resource type {resourceType}")
+
+            raise kopf.PermanentError(
+                "Error adopting - unsupported resource type " + resourceType
             )
-        except ApiException as e:
-            # Cant find parent component (if component in same chart as other kubernetes resources it may not be created yet)
-            if e.status == HTTP_NOT_FOUND:
-                raise kopf.TemporaryError(
-                    "Cannot find parent component " + component_name
-                )
-            else:
-                logw.debug(
-                    f"Exception when calling custom_objects_api.get_namespaced_custom_object {e}"
-                )
 
-        newBody = dict(body)  # cast the service body to a dict
-        kopf.append_owner_reference(newBody, owner=parent_component)
-        try:
-            if resourceType == "service":
-                api_response = kubernetes.client.CoreV1Api().patch_namespaced_service(
-                    newBody["metadata"]["name"],
-                    newBody["metadata"]["namespace"],
-                    newBody,
-                )
-            elif resourceType == "persistentvolumeclaim":
-                api_response = kubernetes.client.CoreV1Api().patch_namespaced_persistent_volume_claim(
-                    newBody["metadata"]["name"],
-                    newBody["metadata"]["namespace"],
-                    newBody,
-                )
-            elif resourceType == "deployment":
-                api_response = (
-                    kubernetes.client.AppsV1Api().patch_namespaced_deployment(
-                        newBody["metadata"]["name"],
-                        newBody["metadata"]["namespace"],
-                        newBody,
-                    )
-                )
-            elif resourceType == "configmap":
-                api_response = (
-                    kubernetes.client.CoreV1Api().patch_namespaced_config_map(
-                        newBody["metadata"]["name"],
-                        newBody["metadata"]["namespace"],
-                        newBody,
-                    )
-                )
-            elif resourceType == "secret":
-                api_response = kubernetes.client.CoreV1Api().patch_namespaced_secret(
-                    newBody["metadata"]["name"],
-                    newBody["metadata"]["namespace"],
-                    newBody,
-                )
-            elif resourceType == "job":
-                api_response = kubernetes.client.BatchV1Api().patch_namespaced_job(
-                    newBody["metadata"]["name"],
-                    newBody["metadata"]["namespace"],
-                    newBody,
-                )
-            elif resourceType == "cronjob":
-                api_response = kubernetes.client.BatchV1Api().patch_namespaced_cron_job(
-                    newBody["metadata"]["name"],
-                    newBody["metadata"]["namespace"],
-                    newBody,
-                )
-            elif resourceType == "statefulset":
-                api_response = (
-                    kubernetes.client.AppsV1Api().patch_namespaced_stateful_set(
-                        newBody["metadata"]["name"],
-                        newBody["metadata"]["namespace"],
-                        newBody,
-                    )
-                )
-            elif resourceType == "role":
-                api_response = (
-                    kubernetes.client.RbacAuthorizationV1Api().patch_namespaced_role(
-                        newBody["metadata"]["name"],
-                        newBody["metadata"]["namespace"],
-                        newBody,
-                    )
-                )
-            elif resourceType == "rolebinding":
-                api_response = kubernetes.client.RbacAuthorizationV1Api().patch_namespaced_role_binding(
-                    newBody["metadata"]["name"],
-                    newBody["metadata"]["namespace"],
-                    newBody,
-                )
-            elif resourceType == "serviceaccount":
-                api_response = (
-                    kubernetes.client.CoreV1Api().patch_namespaced_service_account(
-                        newBody["metadata"]["name"],
-                        newBody["metadata"]["namespace"],
-                        newBody,
-                    )
-                )
-            else:
-                logw.error(f"Unsupported resource type {resourceType}")
+        key = (namespace, component_name)
+        batch = pending_adoptions.get(key)
+        if batch is None:
+            batch = {"children": []}
+            pending_adoptions[key] = batch
+            asyncio.create_task(flush_adoptions(key, owner_index, logw))
+        child_done = asyncio.get_running_loop().create_future()
+        batch["children"].append(
+            (resourceType, name, list(meta.get("ownerReferences", [])), child_done)
+        )
+        await asyncio.shield(child_done)
 
-                raise kopf.PermanentError(
-                    "Error adopting - unsupported resource type " + resourceType
-                )
-            logw.debugInfo(
-                f"Adding component as parent of {resourceType}", api_response
-            )
 
-        except ApiException as e:
-            if e.status == HTTP_CONFLICT:  # Conflict = try again
-                raise kopf.TemporaryError("Conflict updating " + resourceType + ".")
+async def flush_adoptions(key, owner_index, logw):
+    """Helper function to adopt the queued resources of one component after the batch interval.
+
+    :meta private:
+    """
+    await asyncio.sleep(ADOPTION_BATCH_INTERVAL)
+    batch = pending_adoptions.pop(key)
+    namespace, component_name = key
+    children = batch["children"]
+    adoption_metrics["batches"] += 1
+    try:
+        parent_component = await get_component_owner(
+            namespace, component_name, owner_index, logw
+        )
+    except Exception as e:
+        for _, _, _, child_done in children:
+            child_done.set_exception(e)
+        return
+
+    owner_reference = kopf.build_owner_reference(parent_component)
+    results = await asyncio.gather(
+        *[
+            adopt_child(
+                namespace, resourceType, name, owner_references, owner_reference
+            )
+            for resourceType, name, owner_references, _ in children
+        ],
+        return_exceptions=True,
+    )
+    for (resourceType, name, _, child_done), result in zip(children, results):
+        if isinstance(result, ApiException):
+            if result.status == HTTP_CONFLICT:  # Conflict = try again
+                result = kopf.TemporaryError("Conflict updating " + resourceType + ".")
             else:
                 logw.warning(f"Exception when calling patch {resourceType}")
+                result = None
+        if isinstance(result, BaseException):
+            child_done.set_exception(result)
+        else:
+            adoption_metrics["adopted"] += 1
+            child_done.set_result(None)
+    logger.debug(f"Adoption metrics {adoption_metrics}")
+
+
+async def adopt_child(namespace, resourceType, name, owner_references, owner_reference):
+    """Helper function to add the owner reference to one resource.
+
+    Only metadata.ownerReferences is patched (the existing references plus the component), instead of the whole resource.
+
+    :meta private:
+    """
+    api_factory, method_name = ADOPT_PATCH_METHODS[resourceType]
+    patch_body = {"metadata": {"ownerReferences": owner_references + [owner_reference]}}
+    api_response = await getattr(api_factory(), method_name)(
+        name, namespace, patch_body
+    )
+    LogWrapper(
+        handler_name="adopt_" + resourceType, function_name="adopt_child"
+    ).debugInfo(f"Adding component as parent of {resourceType}", api_response)
+
+
+# Status arrays that are summarised by the summary handler: status key -> (summary key, has developerUI)
+SUMMARY_SEGMENTS = {
+    "coreAPIs": ("coreAPIsummary", True),
+    "managementAPIs": ("managementAPIsummary", True),
+    "securityAPIs": ("securityAPIsummary", True),
+    "coreDependentAPIs": ("coreDependentAPIsummary", False),
+    "managementDependentAPIs": ("managementDependentAPIsummary", False),
+    "securityDependentAPIs": ("securityDependentAPIsummary", False),
+}
+
+
+def render_summary_segment(entries, with_developer_ui):
+    """Helper function to render the summary of one status array (e.g. coreAPIs).
+
+    Args:
+        * entries (List): The status entries of the segment
+        * with_developer_ui (Boolean): True to also collect the developerUI urls
+
+    Returns:
+        Dict: url summary, developerUI summary, count of desired and count of complete entries.
+
+    :meta private:
+    """
+    urls = []
+    developerUIs = []
+    complete = 0
+    for entry in entries:
+        if "url" in entry.keys():
+            urls.append(entry["url"] + " ")
+            if with_developer_ui and "developerUI" in entry.keys():
+                developerUIs.append(entry["developerUI"] + " ")
+            if entry.get("ready") == True:
+                complete = complete + 1
+    return {
+        "summary": "".join(urls),
+        "developerUI": "".join(developerUIs),
+        "desired": len(entries),
+        "complete": complete,
+    }
 
 
 # When Component status changes, update status summary
 @kopf.on.field(GROUP, VERSION, COMPONENTS_PLURAL, field="status", retries=5)
-async def summary(meta, spec, status, body, namespace, labels, name, **kwargs):
+async def summary(
+    meta, spec, status, body, namespace, labels, name, memo: kopf.Memo, **kwargs
+):
+    """Handler function for changes in the Component status.
+
+    Renders the status summary. The rendered segments are kept in the per-component memo,
+    so only the status arrays that changed since the last call are rendered again.
+    If the rendered summary equals the current one, the status is not patched.
+
+    :meta public:
+    """
 
     logw = LogWrapper(handler_name="summary", function_name="summary")
     logw.set(
@@ -2220,64 +2380,46 @@ async def summary(meta, spec, status, body, namespace, labels, name, **kwargs):
     # del unused-arguments for linting
     del meta, spec, namespace, labels, name, kwargs
 
-    coreAPIsummary = ""
-    coreDependentAPIsummary = ""
-    managementDependentAPIsummary = ""
-    securityDependentAPIsummary = ""
-    securitySecretsManagementSummary = ""
-    managementAPIsummary = ""
-    securityAPIsummary = ""
-    developerUIsummary = ""
+    segment_cache = memo.get("summary_segments")
+    if segment_cache is None:
+        segment_cache = {}
+        memo.summary_segments = segment_cache
+
+    segments = {}
+    for status_key, (summary_key, with_developer_ui) in SUMMARY_SEGMENTS.items():
+        entries = safe_get([], status, status_key)
+        cached = segment_cache.get(status_key)
+        if cached is None or cached[0] != entries:
+            logw.debug(f"Rendering summary of changed {status_key}")
+            cached = (
+                copy.deepcopy(entries),
+                render_summary_segment(entries, with_developer_ui),
+            )
+            segment_cache[status_key] = cached
+        segments[status_key] = cached[1]
+
     countOfCompleteAPIs = 0
     countOfDesiredAPIs = 0
+    for status_key in ["coreAPIs", "managementAPIs", "securityAPIs"]:
+        countOfDesiredAPIs = countOfDesiredAPIs + segments[status_key]["desired"]
+        countOfCompleteAPIs = countOfCompleteAPIs + segments[status_key]["complete"]
     countOfDesiredDependentAPIs = 0
     countOfCompleteDependentAPIs = 0
-    countOfDesiredSecretsManagements = 0
-    countOfCompleteSecretsManagements = 0
-    if "coreAPIs" in status.keys():
-        countOfDesiredAPIs = countOfDesiredAPIs + len(status["coreAPIs"])
-        for api in status["coreAPIs"]:
-            if "url" in api.keys():
-                coreAPIsummary = coreAPIsummary + api["url"] + " "
-                if "developerUI" in api.keys():
-                    developerUIsummary = developerUIsummary + api["developerUI"] + " "
-                if "ready" in api.keys():
-                    if api["ready"] == True:
-                        countOfCompleteAPIs = countOfCompleteAPIs + 1
-    if "coreDependentAPIs" in status.keys():
-        countOfDesiredDependentAPIs = countOfDesiredDependentAPIs + len(
-            status["coreDependentAPIs"]
+    for status_key in [
+        "coreDependentAPIs",
+        "managementDependentAPIs",
+        "securityDependentAPIs",
+    ]:
+        countOfDesiredDependentAPIs = (
+            countOfDesiredDependentAPIs + segments[status_key]["desired"]
         )
-        for depapi in status["coreDependentAPIs"]:
-            if "url" in depapi.keys():
-                coreDependentAPIsummary = coreDependentAPIsummary + depapi["url"] + " "
-                if "ready" in depapi.keys():
-                    if depapi["ready"] == True:
-                        countOfCompleteDependentAPIs = countOfCompleteDependentAPIs + 1
-    if "managementDependentAPIs" in status.keys():
-        countOfDesiredDependentAPIs = countOfDesiredDependentAPIs + len(
-            status["managementDependentAPIs"]
+        countOfCompleteDependentAPIs = (
+            countOfCompleteDependentAPIs + segments[status_key]["complete"]
         )
-        for depapi in status["managementDependentAPIs"]:
-            if "url" in depapi.keys():
-                managementDependentAPIsummary = (
-                    managementDependentAPIsummary + depapi["url"] + " "
-                )
-                if "ready" in depapi.keys():
-                    if depapi["ready"] == True:
-                        countOfCompleteDependentAPIs = countOfCompleteDependentAPIs + 1
-    if "securityDependentAPIs" in status.keys():
-        countOfDesiredDependentAPIs = countOfDesiredDependentAPIs + len(
-            status["securityDependentAPIs"]
-        )
-        for depapi in status["securityDependentAPIs"]:
-            if "url" in depapi.keys():
-                securityDependentAPIsummary = (
-                    securityDependentAPIsummary + depapi["url"] + " "
-                )
-                if "ready" in depapi.keys():
-                    if depapi["ready"] == True:
-                        countOfCompleteDependentAPIs = countOfCompleteDependentAPIs + 1
+
+    securitySecretsManagementSummary = ""
+    countOfDesiredSecretsManagements = 0
+    countOfCompleteSecretsManagements = 0
     if "securitySecretsManagement" in status.keys():
         sman = status["securitySecretsManagement"]
         if sman != {}:
@@ -2289,38 +2431,17 @@ async def summary(meta, spec, status, body, namespace, labels, name, **kwargs):
                         countOfCompleteSecretsManagements + 1
                     )
                     securitySecretsManagementSummary = "ready"
-    if "managementAPIs" in status.keys():
-        countOfDesiredAPIs = countOfDesiredAPIs + len(status["managementAPIs"])
-        for api in status["managementAPIs"]:
-            if "url" in api.keys():
-                managementAPIsummary = managementAPIsummary + api["url"] + " "
-                if "developerUI" in api.keys():
-                    developerUIsummary = developerUIsummary + api["developerUI"] + " "
-                if "ready" in api.keys():
-                    if api["ready"] == True:
-                        countOfCompleteAPIs = countOfCompleteAPIs + 1
-    if "securityAPIs" in status.keys():
-        countOfDesiredAPIs = countOfDesiredAPIs + len(status["securityAPIs"])
-        for api in status["securityAPIs"]:
-            if "url" in api.keys():
-                securityAPIsummary = securityAPIsummary + api["url"] + " "
-                if "developerUI" in api.keys():
-                    developerUIsummary = developerUIsummary + api["developerUI"] + " "
-                if "ready" in api.keys():
-                    if api["ready"] == True:
-                        countOfCompleteAPIs = countOfCompleteAPIs + 1
 
     status_summary = {}
-    status_summary["coreAPIsummary"] = coreAPIsummary
-    status_summary["coreDependentAPIsummary"] = coreDependentAPIsummary
-    status_summary["managementDependentAPIsummary"] = managementDependentAPIsummary
-    status_summary["securityDependentAPIsummary"] = securityDependentAPIsummary
+    for status_key, (summary_key, with_developer_ui) in SUMMARY_SEGMENTS.items():
+        status_summary[summary_key] = segments[status_key]["summary"]
     status_summary["securitySecretsManagementSummary"] = (
         securitySecretsManagementSummary
     )
-    status_summary["managementAPIsummary"] = managementAPIsummary
-    status_summary["securityAPIsummary"] = securityAPIsummary
-    status_summary["developerUIsummary"] = developerUIsummary
+    status_summary["developerUIsummary"] = "".join(
+        segments[status_key]["developerUI"]
+        for status_key in ["coreAPIs", "managementAPIs", "securityAPIs"]
+    )
     logw.info(
         f"Creating summary - completed API count{str(countOfCompleteAPIs)}/{str(countOfDesiredAPIs)}"
     )
@@ -2340,6 +2461,10 @@ async def summary(meta, spec, status, body, namespace, labels, name, **kwargs):
         f"Creating summary - deployment status {status_summary['deployment_status']}"
     )
 
+    if safe_get(None, status, "summary") == status_summary:
+        logw.debug("Summary unchanged, skipping patch")
+        return None
+
     return status_summary
 
 
@@ -2384,10 +2509,10 @@ async def createPublishedNotificationResource(
     returnPublishedNotificationObject = {}
 
     try:
-        custom_objects_api = kubernetes.client.CustomObjectsApi()
+        custom_objects_api = k8s_async.custom_objects_api()
 
         try:
-            custom_objects_api.get_namespaced_custom_object(
+            await custom_objects_api.get_namespaced_custom_object(
                 group=GROUP,
                 version=VERSION,
                 namespace=namespace,
@@ -2396,7 +2521,7 @@ async def createPublishedNotificationResource(
             )
         except ApiException as e:
             if e.status == HTTP_NOT_FOUND:
-                apiObj = custom_objects_api.create_namespaced_custom_object(
+                apiObj = await custom_objects_api.create_namespaced_custom_object(
                     group=GROUP,
                     version=VERSION,
                     namespace=namespace,
@@ -2405,7 +2530,7 @@ async def createPublishedNotificationResource(
                 )
 
                 logw.info(f"PublishedNotification created {name}")
-                custom_objects_api.patch_namespaced_custom_object_status(
+                await custom_objects_api.patch_namespaced_custom_object_status(
                     group=GROUP,
                     version=VERSION,
                     namespace=namespace,
@@ -2475,10 +2600,10 @@ async def createSubscribedNotificationResource(
     returnSubscribedNotificationObject = {}
 
     try:
-        custom_objects_api = kubernetes.client.CustomObjectsApi()
+        custom_objects_api = k8s_async.custom_objects_api()
 
         try:
-            custom_objects_api.get_namespaced_custom_object(
+            await custom_objects_api.get_namespaced_custom_object(
                 group=GROUP,
                 version=VERSION,
                 namespace=namespace,
@@ -2487,7 +2612,7 @@ async def createSubscribedNotificationResource(
             )
         except ApiException as e:
             if e.status == HTTP_NOT_FOUND:
-                apiObj = custom_objects_api.create_namespaced_custom_object(
+                apiObj = await custom_objects_api.create_namespaced_custom_object(
                     group=GROUP,
                     version=VERSION,
                     namespace=namespace,
@@ -2495,7 +2620,7 @@ async def createSubscribedNotificationResource(
                     body=SubscribedNotificationResource,
                 )
 
-                custom_objects_api.patch_namespaced_custom_object_status(
+                await custom_objects_api.patch_namespaced_custom_object_status(
                     group=GROUP,
                     version=VERSION,
                     namespace=namespace,
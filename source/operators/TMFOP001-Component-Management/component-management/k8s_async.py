@@ -0,0 +1,90 @@
+"""Non-blocking access to the kubernetes python client for async kopf handlers.
+
+The kubernetes python client is synchronous: every call blocks for a full HTTP round trip.
+Called directly from an ``async def`` handler it blocks the kopf event loop, so all other
+handlers wait. The helpers in this module run the calls on a bounded thread pool and share
+one pooled ``ApiClient`` (keep-alive connections) instead of creating a new one per call.
+
+Usage::
+
+    custom_objects_api = k8s_async.custom_objects_api()
+    component = await custom_objects_api.get_namespaced_custom_object(...)
+
+The number of worker threads (and pooled connections) is set with the environment
+variable ``K8S_CLIENT_WORKERS`` (default 10).
+"""
+
+import asyncio
+import functools
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import kubernetes.client
+
+K8S_CLIENT_WORKERS = int(os.getenv("K8S_CLIENT_WORKERS", "10"))
+
+_executor = None
+_api_client = None
+
+
+def api_client():
+    """Return the shared ApiClient, created on first use (after kopf has loaded the kube config)."""
+    global _api_client
+    if _api_client is None:
+        configuration = kubernetes.client.Configuration.get_default_copy()
+        configuration.connection_pool_maxsize = K8S_CLIENT_WORKERS
+        _api_client = kubernetes.client.ApiClient(configuration)
+    return _api_client
+
+
+async def run_blocking(func, *args, **kwargs):
+    """Run a blocking function on the bounded kubernetes client thread pool and await its result."""
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(
+            max_workers=K8S_CLIENT_WORKERS, thread_name_prefix="k8s-client"
+        )
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _executor, functools.partial(func, *args, **kwargs)
+    )
+
+
+class AsyncApi:
+    """Wraps a kubernetes.client API object, so that its methods return awaitables.
+
+    Every method call is executed with `run_blocking`.
+    """
+
+    __slots__ = ("_api",)
+
+    def __init__(self, api):
+        self._api = api
+
+    def __getattr__(self, name):
+        method = getattr(self._api, name)
+
+        async def call(*args, **kwargs):
+            return await run_blocking(method, *args, **kwargs)
+
+        return call
+
+
+def custom_objects_api():
+    return AsyncApi(kubernetes.client.CustomObjectsApi(api_client()))
+
+
+def core_v1_api():
+    return AsyncApi(kubernetes.client.CoreV1Api(api_client()))
+
+
+def apps_v1_api():
+    return AsyncApi(kubernetes.client.AppsV1Api(api_client()))
+
+
+def batch_v1_api():
+    return AsyncApi(kubernetes.client.BatchV1Api(api_client()))
+
+
+def rbac_authorization_v1_api():
+    return AsyncApi(kubernetes.client.RbacAuthorizationV1Api(api_client()))
@@ -21,6 +21,11 @@ import logging
 from kubernetes.client.rest import ApiException
 import os
 import requests
+import collections
+import copy
+import hashlib
+import json
+import threading
 
 logging_level = os.environ.get("LOGGING", logging.INFO)
 print("Logging set to ", logging_level)
@@ -42,6 +47,24 @@ plural = (
     "apisixroutes"  # The plural name of the Apisix route CRD - ApisixRoute resource
 )
 
+# The ApisixRoute and ApisixPluginConfig carry a hash of their desired state in this annotation,
+# they are only written when the hash changes.
+DESIRED_STATE_ANNOTATION = "oda.tmforum.org/desired-state-hash"
+gateway_write_metrics = {"writes": 0, "skipped": 0}
+
+# Plugin templates are cached by URL and revalidated with conditional GETs (ETag / Last-Modified),
+# at most TEMPLATE_CACHE_SIZE templates are kept (least recently used are dropped first).
+TEMPLATE_CACHE_SIZE = int(os.getenv("TEMPLATE_CACHE_SIZE", "64"))
+TEMPLATE_REQUEST_TIMEOUT = float(os.getenv("TEMPLATE_REQUEST_TIMEOUT", "30"))
+
+template_session = requests.Session()
+template_cache = (
+    collections.OrderedDict()
+)  # url -> (etag, last_modified, digest, plugins)
+template_cache_lock = threading.Lock()
+template_url_locks = {}
+template_metrics = {"downloads": 0, "not_modified": 0, "parses": 0, "errors": 0}
+
 # long-lived API realted timeouts mcp/a2a/sse for APISIX
 DEFAULT_CONNECT_TIMEOUT = "60"  # in seconds
 DEFAULT_READ_TIMEOUT = "900"  # in seconds
@@ -103,9 +126,9 @@ def manage_api_lifecycle(spec, name, namespace, status, meta, logger, **kwargs):
     Description:
     - First, attempts to create or update an ApisixRoute based on the provided 'spec', 'name', 'namespace', and 'meta'.
     - If the ApisixRoute cannot be created or updated, it logs a failure message and the function returns early.
-    - Checks if a template URL is provided in 'spec' and verifies its validity.
-    - If valid, attempts to apply plugins based on the template. Logs the success or failure of this operation.
+    - Applies the plugins from the template URL in 'spec' (if any) and the policies. Logs the success or failure of this operation.
     - If plugins are successfully applied, updates the ApisixRoute with the plugin configuration.
+    - Resources whose desired state hash is unchanged are not written again.
     - Throughout the function, various informational and error logs are generated based on the operations performed.
 
     """
@@ -118,10 +141,6 @@ def manage_api_lifecycle(spec, name, namespace, status, meta, logger, **kwargs):
         return
 
     template_url = spec.get("template", "")
-    if template_url:
-        if not check_url(template_url):
-            logger.error(f"Invalid or inaccessible URL in template: {template_url}")
-
     applied_plugins = apply_plugins_from_template(namespace, name, spec, template_url)
     if applied_plugins:
         logger.info(f"Plugins applied: {applied_plugins}")
@@ -130,6 +149,41 @@ def manage_api_lifecycle(spec, name, namespace, status, meta, logger, **kwargs):
         )
     else:
         logger.error("Failed to apply plugins from template.")
+    logger.debug(f"Gateway write metrics: {gateway_write_metrics}")
+
+
+def desired_state_hash(manifest):
+    """
+    Returns a hash over the desired state of a manifest (everything except metadata.annotations and metadata.resourceVersion).
+    """
+    desired_state = dict(manifest)
+    desired_state["metadata"] = {
+        key: value
+        for key, value in manifest["metadata"].items()
+        if key not in ("annotations", "resourceVersion")
+    }
+    return hashlib.sha256(
+        json.dumps(desired_state, sort_keys=True).encode()
+    ).hexdigest()
+
+
+def set_desired_state_hash(manifest):
+    """
+    Adds the desired state hash annotation to a manifest and returns the hash.
+    """
+    state_hash = desired_state_hash(manifest)
+    manifest["metadata"].setdefault("annotations", {})[
+        DESIRED_STATE_ANNOTATION
+    ] = state_hash
+    return state_hash
+
+
+def has_desired_state(existing, state_hash):
+    """
+    True if an existing resource was written from the same desired state.
+    """
+    annotations = existing.get("metadata", {}).get("annotations") or {}
+    return annotations.get(DESIRED_STATE_ANNOTATION) == state_hash
 
 
 def create_or_update_ingress(spec, name, namespace, meta, **kwargs):
@@ -149,7 +203,7 @@ def create_or_update_ingress(spec, name, namespace, meta, **kwargs):
     Description:
     - Checks if the implementation status is 'ready'. If not, logs a message and skips ingress creation or update.
     - Constructs an ApisixRoute manifests using provided 'spec' details like path, backend service information.
-    - Tries to find an existing ApisixRoute. If found, it updates the route using the existing 'resourceVersion'.
+    - Tries to find an existing ApisixRoute. If found and its desired state hash differs, it updates the route using the existing 'resourceVersion'.
     - If no existing route is found and it's a case of a missing resource, it tries to create a new ApisixRoute and logs the outcome.
     - Catches and logs any API exceptions during the process, providing feedback on the success or failure of the operation.
 
@@ -237,6 +291,7 @@ def create_or_update_ingress(spec, name, namespace, meta, **kwargs):
         # Kopf adoption is disabled as referencegrant is still pending for apisix api gateway. will enable adoption once this api gaetway feature enabled for apisix.
         # kopf.adopt(apisixroute_manifest)
 
+        state_hash = set_desired_state_hash(apisixroute_manifest)
         try:
             existing_route = api_instance.get_namespaced_custom_object(
                 group=group,
@@ -245,8 +300,24 @@ def create_or_update_ingress(spec, name, namespace, meta, **kwargs):
                 plural=plural,
                 name=ingress_name,
             )
+            if has_desired_state(existing_route, state_hash):
+                gateway_write_metrics["skipped"] += 1
+                logger.info(
+                    f"ApisixRoute '{ingress_name}' is unchanged in namespace '{namespace}'."
+                )
+                return True
             resource_version = existing_route["metadata"]["resourceVersion"]
             apisixroute_manifest["metadata"]["resourceVersion"] = resource_version
+            # keep the plugin config reference set by patch_apisixroute_with_plugin_config
+            for http_block, existing_block in zip(
+                apisixroute_manifest["spec"]["http"],
+                existing_route.get("spec", {}).get("http", []),
+            ):
+                if "plugin_config_name" in existing_block:
+                    http_block["plugin_config_name"] = existing_block[
+                        "plugin_config_name"
+                    ]
+            gateway_write_metrics["writes"] += 1
             response = api_instance.replace_namespaced_custom_object(
                 group=group,
                 version=version,
@@ -261,6 +332,7 @@ def create_or_update_ingress(spec, name, namespace, meta, **kwargs):
             return True
         except ApiException as e:
             if e.status == 404:
+                gateway_write_metrics["writes"] += 1
                 response = api_instance.create_namespaced_custom_object(
                     group=group,
                     version=version,
@@ -502,31 +574,88 @@ def create_api_key_verification_policy(spec):
     return None
 
 
-def check_url(url):
+def template_url_lock(url):
+    """
+    Returns the lock serialising the downloads of one template URL.
+    """
+    with template_cache_lock:
+        return template_url_locks.setdefault(url, threading.Lock())
+
+
+def store_template(url, entry):
+    """
+    Stores a template in the cache and drops the least recently used ones above TEMPLATE_CACHE_SIZE.
+    """
+    with template_cache_lock:
+        template_cache[url] = entry
+        template_cache.move_to_end(url)
+        while len(template_cache) > TEMPLATE_CACHE_SIZE:
+            evicted_url, _ = template_cache.popitem(last=False)
+            template_url_locks.pop(evicted_url, None)
+
+
+def download_template_plugins(url):
     """
-    Checks the accessibility of a URL by making a HEAD request.
+    Downloads the plugins of an ApisixPluginConfig template, using the template cache.
 
     Args:
-    url (str): The URL to be checked.
+    url (str): The URL from where to download the plugin configurations.
 
     Returns:
-    bool: True if the URL is accessible, False if any error occurs.
+    list or None: The plugins of the template (a copy, the caller may modify it), or None if an error occurs.
 
     Description:
-    - Attempts to make a HEAD request to the specified URL to check its accessibility.
-    - Raises an HTTP error if the request returns an unsuccessful status code, indicating that the URL is not reachable or valid.
-    - If an exception occurs during the request, logs an error message detailing the issue and returns False.
-
-    Note:
-    - This function is used to validate URLs in scenarios where URLs are required for further processing, such as downloading content or validating links in configurations.
+    - A cached template is revalidated with a conditional GET (If-None-Match / If-Modified-Since).
+    - A template that is not modified, or whose content is unchanged, is not parsed again.
+    - Downloads of the same URL are serialised, so concurrent reconciles share one download.
     """
-    try:
-        response = requests.head(url)
-        response.raise_for_status()  # This Raising HTTPError if the HTTP request returned an unsuccessful
-        return True
-    except requests.RequestException as e:
-        logger.error(f"Failed to reach the given URL in CR template: {url}. Error: {e}")
-        return False
+    with template_url_lock(url):
+        with template_cache_lock:
+            cached = template_cache.get(url)
+        headers = {}
+        if cached:
+            etag, last_modified, _, _ = cached
+            if etag:
+                headers["If-None-Match"] = etag
+            if last_modified:
+                headers["If-Modified-Since"] = last_modified
+        if not headers:
+            headers = {"Cache-Control": "no-cache", "Pragma": "no-cache"}
+        try:
+            response = template_session.get(
+                url, headers=headers, timeout=TEMPLATE_REQUEST_TIMEOUT
+            )
+            response.raise_for_status()
+            if cached and response.status_code == 304:
+                template_metrics["not_modified"] += 1
+                store_template(url, cached)
+                plugins = cached[3]
+            else:
+                template_metrics["downloads"] += 1
+                digest = hashlib.sha256(response.content).hexdigest()
+                if cached and cached[2] == digest:
+                    plugins = cached[3]
+                else:
+                    template_metrics["parses"] += 1
+                    content = yaml.safe_load(response.text)
+                    plugins = content.get("spec", {}).get("plugins", [])
+                store_template(
+                    url,
+                    (
+                        response.headers.get("ETag"),
+                        response.headers.get("Last-Modified"),
+                        digest,
+                        plugins,
+                    ),
+                )
+        except requests.RequestException as e:
+            template_metrics["errors"] += 1
+            logger.error(
+                f"Failed to download or parse the ApisixPluginConfig from URL: {url}. Error: {e}"
+            )
+            return None
+    logger.debug(f"Template cache metrics: {template_metrics}")
+    return copy.deepcopy(plugins)
 
 
 def download_and_append_plugin_names(url, plugin_names):
@@ -541,33 +670,24 @@ def download_and_append_plugin_names(url, plugin_names):
     tuple: A tuple containing the updated list of plugin names and the downloaded plugins, or (None, None) if an error occurs.
 
     Description:
-    - Makes a request to the specified URL with caching disabled to download plugin configurations.
-    - Parses the response as YAML to extract plugin details.
-    - Appends the names of the plugins to the provided list and prints the updated list and the combined plugin details.
+    - Gets the plugin configurations of the URL with `download_template_plugins` (cached, revalidated with a conditional GET).
+    - Appends the names of the plugins to the provided list.
     - Returns the updated list of plugin names and the list of plugins.
-    - If an error occurs during the download or parsing, logs an error and returns (None, None).
+    - If an error occurs during the download or parsing, returns (None, None).
 
     Note:
     - This function is useful for dynamically configuring API gateways by downloading and integrating external plugin configurations.
     """
-    try:
-        headers = {"Cache-Control": "no-cache", "Pragma": "no-cache"}
-        response = requests.get(url, headers=headers)
-        response.raise_for_status()
-        content = yaml.safe_load(response.text)
-        plugins = content.get("spec", {}).get("plugins", [])
-
-        for plugin in plugins:
-            if "name" in plugin:
-                plugin_names.append(plugin["name"])
-
-        return plugin_names, plugins
-    except requests.RequestException as e:
-        logger.error(
-            f"Failed to download or parse the ApisixPluginConfig from URL: {url}. Error: {e}"
-        )
+    plugins = download_template_plugins(url)
+    if plugins is None:
         return None, None
 
+    for plugin in plugins:
+        if "name" in plugin:
+            plugin_names.append(plugin["name"])
+
+    return plugin_names, plugins
+
 
 def combine_all_policies_with_plugins(spec, plugin_names, plugins):
     """
@@ -643,6 +763,7 @@ def apply_plugins_from_template(namespace, api_name, spec, url):
     - If a URL is provided, downloads and appends additional plugin configurations.
     - Combines these plugins with CRD-based policies using the `combine_all_policies_with_plugins` function.
     - Constructs an `ApisixPluginConfig` Kubernetes custom object and attempts to either create or update it in the specified namespace.
+    - An existing plugin configuration with the same desired state hash is not updated.
     - Handles Kubernetes API exceptions by logging errors and providing feedback on the success or failure of the operation.
 
     Note:
@@ -681,12 +802,20 @@ def apply_plugins_from_template(namespace, api_name, spec, url):
     group, version = plugin_config["apiVersion"].split("/")
     plural = "apisixpluginconfigs"
 
+    state_hash = set_desired_state_hash(plugin_config)
     try:
         existing_plugin = api_instance.get_namespaced_custom_object(
             group, version, namespace, plural, name=modified_name
         )
+        if has_desired_state(existing_plugin, state_hash):
+            gateway_write_metrics["skipped"] += 1
+            logger.info(
+                f"Plugin config '{modified_name}' is unchanged in namespace '{namespace}'."
+            )
+            return [modified_name]
         resource_version = existing_plugin["metadata"]["resourceVersion"]
         plugin_config["metadata"]["resourceVersion"] = resource_version
+        gateway_write_metrics["writes"] += 1
         api_instance.replace_namespaced_custom_object(
             group, version, namespace, plural, name=modified_name, body=plugin_config
         )
@@ -696,6 +825,7 @@ def apply_plugins_from_template(namespace, api_name, spec, url):
         return [modified_name]
     except kubernetes.client.exceptions.ApiException as e:
         if e.status == 404:
+            gateway_write_metrics["writes"] += 1
             api_instance.create_namespaced_custom_object(
                 group, version, namespace, plural, body=plugin_config
             )
@@ -725,6 +855,7 @@ def patch_apisixroute_with_plugin_config(
     Description:
     - Connects to the Kubernetes API and attempts to fetch the existing ApisixRoute specified by `apisixroute_name`.
     - If the route is successfully retrieved, it updates the 'plugin_config_name' within the 'http' blocks of the route's specification.
+    - If all 'http' blocks already reference the plugin configuration, the route is not patched.
     - Applies the updated configuration using a strategic merge patch to the existing ApisixRoute.
     - Logs informational messages regarding the successful patching of the route, or error messages if any part of the process fails.
 
@@ -753,6 +884,15 @@ def patch_apisixroute_with_plugin_config(
 
     # Updating the plugin_config_name in the existing http block
     try:
+        if all(
+            http_block.get("plugin_config_name") == plugin_config_name
+            for http_block in existing_route["spec"].get("http", [])
+        ):
+            gateway_write_metrics["skipped"] += 1
+            logger.info(
+                f"ApisixRoute '{apisixroute_name}' already uses plugin config '{plugin_config_name}'."
+            )
+            return
         if "http" in existing_route["spec"]:
             for http_block in existing_route["spec"]["http"]:
                 http_block["plugin_config_name"] = plugin_config_name
@@ -762,6 +902,7 @@ def patch_apisixroute_with_plugin_config(
 
     # Using patch_namespaced_custom_object to apply a strategic merge patch
     try:
+        gateway_write_metrics["writes"] += 1
         api_instance.patch_namespaced_custom_object(
             group=group,
             version=version,
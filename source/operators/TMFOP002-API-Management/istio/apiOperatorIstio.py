@@ -16,9 +16,17 @@ import kopf
 import kubernetes.client
 import logging
 import json
+import hashlib
+import fnmatch
 from kubernetes.client.rest import ApiException
 import os
 import re
+import time
+import asyncio
+import threading
+import kubernetes.watch
+from concurrent.futures import ThreadPoolExecutor
+import k8s_async
 
 # Setup logging
 logging_level = os.environ.get("LOGGING", logging.INFO)
@@ -38,11 +46,16 @@ if GIT_COMMIT_SHA:
 # get namespace to monitor
 component_namespace = os.environ.get("COMPONENT_NAMESPACE", "components")
 logger.info(f"Monitoring namespace %s", component_namespace)
+# comma separated namespaces and glob patterns, as passed to kopf run -n
+component_namespace_patterns = [
+    pattern.strip() for pattern in component_namespace.split(",") if pattern.strip()
+]
 
 HTTP_SCHEME = "https://"
 HTTP_K8s_LABELS = ["http", "http2"]
 HTTP_STANDARD_PORTS = [80, 443]
 HTTP_NOT_FOUND = 404
+HTTP_CONFLICT = 409
 GROUP = "oda.tmforum.org"
 VERSION = "v1"
 APIS_PLURAL = "exposedapis"
@@ -52,6 +65,35 @@ VIRTUAL_SERVICE_GROUP = "networking.istio.io"
 VIRTUAL_SERVICE_VERSION = "v1alpha3"
 VIRTUAL_SERVICE_PLURAL = "virtualservices"
 
+SERVICE_MONITOR_GROUP = "monitoring.coreos.com"
+SERVICE_MONITOR_VERSION = "v1"
+SERVICE_MONITOR_PLURAL = "servicemonitors"
+SERVICE_MONITOR_KIND = "ServiceMonitor"
+
+# The VirtualServices and ServiceMonitors carry a hash of their desired state in this annotation,
+# they are only written when the hash differs from the live object (kept by the *_desired_state indexes).
+DESIRED_STATE_ANNOTATION = "oda.tmforum.org/desired-state-hash"
+desired_state_metrics = {"writes": 0, "skipped": 0}
+
+# the VirtualServices of all namespaces are watched (cluster wide, kopf only watches the component namespaces)
+# and their routes kept for check_vs_conflict.
+VIRTUAL_SERVICE_WATCH_SECONDS = int(
+    os.environ.get("VIRTUAL_SERVICE_WATCH_SECONDS", "300")
+)  # server side timeout of one watch request before it is restarted
+vs_route_cache = {
+    "routes": None,
+    "thread": None,
+}  # routes is None until the first list, (namespace, name) -> (gateway, host, path prefix)
+vs_route_lock = threading.Lock()
+# hits are lookups answered from the route cache, fallbacks are full cluster lists before the first list of the watch.
+vs_index_metrics = {
+    "hits": 0,
+    "fallbacks": 0,
+    "conflicts": 0,
+    "lists": 0,
+    "last_event": None,
+}
+
 # get environment variables
 OPENMETRICS_IMPLEMENTATION = os.environ.get(
     "OPENMETRICS_IMPLEMENTATION", "ServiceMonitor"
@@ -81,10 +123,60 @@ if APIOPERATORISTIO_PUBLICHOSTNAME:
         }
 
 
+# child API status changes for the same component are merged over this window (seconds) and applied with one patch
+COMPONENT_PATCH_DEBOUNCE = float(os.environ.get("COMPONENT_PATCH_DEBOUNCE", "0.5"))
+COMPONENT_PATCH_RETRIES = 5
+pending_component_updates = {}  # (namespace, component name) -> queued updates
+component_patch_metrics = {"patches": 0, "merged_updates": 0, "conflict_retries": 0}
+
+# the istio ingress gateway service is watched (cluster wide) and its status shared by every API status build
+ISTIO_INGRESSGATEWAY_LABEL = "istio=ingressgateway"
+INGRESS_GATEWAY_WATCH_SECONDS = int(
+    os.environ.get("INGRESS_GATEWAY_WATCH_SECONDS", "300")
+)  # server side timeout of one watch request before it is restarted
+ingress_gateway_cache = {
+    "services": None,
+    "key": None,
+    "thread": None,
+}  # services is None until the first list
+ingress_gateway_lock = threading.Lock()
+ingress_gateway_metrics = {"hits": 0, "lists": 0, "changes": 0, "restatus": 0}
+
+# pods behind an implementation service are annotated concurrently with at most this many patch requests in flight
+POD_PATCH_CONCURRENCY = int(os.environ.get("POD_PATCH_CONCURRENCY", "5"))
+# hits are services resolved from the service/pod indexes, fallbacks are API reads; skipped pods already had the annotations
+pod_annotation_metrics = {"hits": 0, "fallbacks": 0, "patched": 0, "skipped": 0}
+
+# EndpointSlice events for the same service are merged over this window (seconds), the API resources are only
+# updated when the ready state of the service implementation flips.
+IMPLEMENTATION_STATUS_DEBOUNCE = float(
+    os.environ.get("IMPLEMENTATION_STATUS_DEBOUNCE", "1")
+)
+implementation_ready = {}  # (namespace, service name) -> last applied ready state
+pending_implementation_status = {}  # (namespace, service name) -> queued endpoints
+implementation_status_metrics = {"events": 0, "merged": 0, "applied": 0, "unchanged": 0}
+
+
+# EndpointSlices inherit the labels of their Service, only the slices of ODA Component services are watched.
+# kopf evaluates the labels filter of a handler in the operator, only settings.watching.label_selectors
+# (newer kopf) filters on the API server.
+ENDPOINTSLICE_SELECTOR = "oda.tmforum.org/componentName"
+ENDPOINTSLICE_WATCH_SELECTOR_SUPPORTED = hasattr(
+    kopf.OperatorSettings().watching, "label_selectors"
+)
+
+
 # try to recover from broken watchers https://github.com/nolar/kopf/issues/1036
 @kopf.on.startup()
 def configure(settings: kopf.OperatorSettings, **_):
     settings.watching.server_timeout = 1 * 60
+    if ENDPOINTSLICE_WATCH_SELECTOR_SUPPORTED:
+        # the API server only sends the EndpointSlices of component services
+        settings.watching.label_selectors[
+            "discovery.k8s.io", "v1", "endpointslices"
+        ] = ENDPOINTSLICE_SELECTOR
+    # the synchronous handlers run in kopf's thread pool, bound it like the async kubernetes client
+    settings.execution.max_workers = k8s_async.K8S_CLIENT_WORKERS
 
 
 # ------ HELPER METHODS ------ #
@@ -119,6 +211,27 @@ def safe_get(default_value, dictionary, *paths):
     return result
 
 
+def isWatchedNamespace(namespace):
+    """Helper function to check whether a namespace is watched by the operator.
+
+    Args:
+        * namespace (String): The namespace to check
+
+    Returns:
+        Boolean, True if the namespace matches one of the COMPONENT_NAMESPACE patterns (e.g. `odacompns-*`) and no exclusion (e.g. `!odacompns-test`).
+
+    :meta private:
+    """
+    watched = False
+    for pattern in component_namespace_patterns:
+        if pattern.startswith("!"):
+            if fnmatch.fnmatchcase(namespace, pattern[1:]):
+                return False
+        elif fnmatch.fnmatchcase(namespace, pattern):
+            watched = True
+    return watched
+
+
 # ------ END HELPER METHODS ------ #
 
 
@@ -201,10 +314,24 @@ def apiStatus(meta, spec, status, namespace, labels, name, **kwargs):
                                 "Prometheus Service Monitor",
                             )
                             createOrPatchObservability(
-                                True, spec, namespace, name, "apiStatus", componentName
+                                True,
+                                spec,
+                                namespace,
+                                name,
+                                "apiStatus",
+                                componentName,
+                                kwargs.get("service_selectors"),
+                                kwargs.get("pods_by_namespace"),
+                                kwargs.get("servicemonitor_desired_state"),
                             )
                     return createOrPatchVirtualService(
-                        True, spec, namespace, name, "apiStatus", componentName
+                        True,
+                        spec,
+                        namespace,
+                        name,
+                        "apiStatus",
+                        componentName,
+                        kwargs.get("virtualservice_desired_state"),
                     )
 
         # if we get here then we are creating a new API
@@ -231,10 +358,24 @@ def apiStatus(meta, spec, status, namespace, labels, name, **kwargs):
                     "Prometheus Service Monitor",
                 )
                 createOrPatchObservability(
-                    False, spec, namespace, name, "apiStatus", componentName
+                    False,
+                    spec,
+                    namespace,
+                    name,
+                    "apiStatus",
+                    componentName,
+                    kwargs.get("service_selectors"),
+                    kwargs.get("pods_by_namespace"),
+                    kwargs.get("servicemonitor_desired_state"),
                 )
         return createOrPatchVirtualService(
-            False, spec, namespace, name, "apiStatus", componentName
+            False,
+            spec,
+            namespace,
+            name,
+            "apiStatus",
+            componentName,
+            kwargs.get("virtualservice_desired_state"),
         )
     except kopf.TemporaryError as e:
         raise kopf.TemporaryError(e)  # allow the operator to retry
@@ -242,7 +383,152 @@ def apiStatus(meta, spec, status, namespace, labels, name, **kwargs):
         logWrapper.error(f"Unhandled exception {e}: {traceback.format_exc()}")
 
 
-def createOrPatchObservability(patch, spec, namespace, name, inHandler, componentName):
+def service_selectors(namespace, name, spec, **kwargs):
+    """Indexing function for Service resources.
+
+    Keeps the pod selector of every Service in the watched namespaces, so that the observability annotations can find
+    the pods behind an API implementation without reading the Service.
+
+    Returns:
+        Dict: {(namespace, name): selector}
+
+    :meta private:
+    """
+    selector = spec.get("selector")
+    if not selector:
+        return None
+    return {(namespace, name): dict(selector)}
+
+
+def pods_by_namespace(namespace, name, labels, annotations, spec, **kwargs):
+    """Indexing function for Pod resources.
+
+    Only the annotations set by the pod annotation patterns are kept, see `observabilityAnnotations`.
+
+    Returns:
+        Dict: {namespace: (name, labels, annotations, name of the first container)}
+
+    :meta private:
+    """
+    return {
+        namespace: (
+            name,
+            dict(labels),
+            observabilityAnnotations(annotations),
+            safe_get(None, spec, "containers", 0, "name"),
+        )
+    }
+
+
+def observabilityAnnotations(annotations):
+    """Helper function to select the pod annotations that the Prometheus and DataDog annotation patterns set.
+
+    :meta private:
+    """
+    return {
+        key: value
+        for key, value in annotations.items()
+        if key == "prometheus.io/scrape"
+        or (key.startswith("ad.datadoghq.com/") and key.endswith(".checks"))
+    }
+
+
+# Services and Pods are only watched by the pod annotation patterns
+if OPENMETRICS_IMPLEMENTATION in ("PrometheusAnnotation", "DataDogAnnotation"):
+    kopf.index("", "v1", "services")(service_selectors)
+    kopf.index("", "v1", "pods")(pods_by_namespace)
+
+
+def getServicePods(serviceName, namespace, service_index=None, pod_index=None):
+    """Helper function to find the pods selected by a Kubernetes Service.
+
+    Args:
+        * serviceName (String): The name of the Kubernetes Service that implements the API
+        * namespace (String): The namespace of the Service
+        * service_index (kopf.Index): optional `service_selectors` index
+        * pod_index (kopf.Index): optional `pods_by_namespace` index
+
+    Returns:
+        List of (name, labels, annotations, name of the first container) for the pods matching the Service selector.
+
+    :meta private:
+    """
+    if service_index is not None and pod_index is not None:
+        for selector in service_index.get((namespace, serviceName), []):
+            pod_annotation_metrics["hits"] += 1
+            return [
+                pod
+                for pod in pod_index.get(namespace, [])
+                if all(pod[1].get(key) == value for key, value in selector.items())
+            ]
+
+    # not indexed (yet) - read the service and list its pods
+    pod_annotation_metrics["fallbacks"] += 1
+    core_api = kubernetes.client.CoreV1Api()
+    service = core_api.read_namespaced_service(serviceName, namespace)
+    selector = service.spec.selector or {}
+    if not selector:
+        return []
+    selectorQuery = ",".join(key + "=" + value for key, value in selector.items())
+    pod_list = core_api.list_namespaced_pod(namespace, label_selector=selectorQuery)
+    return [
+        (
+            pod.metadata.name,
+            pod.metadata.labels or {},
+            pod.metadata.annotations or {},
+            pod.spec.containers[0].name if pod.spec.containers else None,
+        )
+        for pod in pod_list.items
+    ]
+
+
+def annotatePods(pods, namespace, annotationsFor):
+    """Helper function to add annotations to pods, skipping the pods that already carry them.
+
+    Args:
+        * pods (List): The pods as returned by `getServicePods`
+        * namespace (String): The namespace of the pods
+        * annotationsFor (Function): Returns the annotations (Dict) wanted on a pod
+
+    Returns:
+        List of the names of the patched pods.
+
+    :meta private:
+    """
+    patches = []
+    for pod in pods:
+        annotations = annotationsFor(pod)
+        if all(pod[2].get(key) == value for key, value in annotations.items()):
+            pod_annotation_metrics["skipped"] += 1
+        else:
+            patches.append((pod[0], {"metadata": {"annotations": annotations}}))
+    if len(patches) > 0:
+        core_api = kubernetes.client.CoreV1Api()
+        with ThreadPoolExecutor(
+            max_workers=min(POD_PATCH_CONCURRENCY, len(patches))
+        ) as executor:
+            futures = [
+                executor.submit(core_api.patch_namespaced_pod, podName, namespace, body)
+                for podName, body in patches
+            ]
+            for future in futures:
+                future.result()
+        pod_annotation_metrics["patched"] += len(patches)
+    logger.debug(f"pod annotation metrics {pod_annotation_metrics}")
+    return [podName for podName, body in patches]
+
+
+def createOrPatchObservability(
+    patch,
+    spec,
+    namespace,
+    name,
+    inHandler,
+    componentName,
+    service_index=None,
+    pod_index=None,
+    sm_index=None,
+):
     """Helper function to switch between the different patterns for scraping Prometheus APIs.
 
     Args:
@@ -252,21 +538,38 @@ def createOrPatchObservability(patch, spec, namespace, name, inHandler, componen
         * name (String): The name of the API Custom Resource
         * inHandler (String): The name of the handler function calling this function
         * componentName (String): The name of the ODA Component that the API is part of
+        * service_index (kopf.Index): optional `service_selectors` index used by the pod annotation patterns
+        * pod_index (kopf.Index): optional `pods_by_namespace` index used by the pod annotation patterns
+        * sm_index (kopf.Index): optional `servicemonitor_desired_state` index used by the ServiceMonitor pattern
 
     Returns:
         nothing
     """
     if OPENMETRICS_IMPLEMENTATION == "ServiceMonitor":
         createOrPatchServiceMonitor(
-            patch, spec, namespace, name, inHandler, componentName
+            patch, spec, namespace, name, inHandler, componentName, sm_index
         )
     elif OPENMETRICS_IMPLEMENTATION == "PrometheusAnnotation":
         createOrPatchPrometheusAnnotation(
-            patch, spec, namespace, name, inHandler, componentName
+            patch,
+            spec,
+            namespace,
+            name,
+            inHandler,
+            componentName,
+            service_index,
+            pod_index,
         )
     elif OPENMETRICS_IMPLEMENTATION == "DataDogAnnotation":
         createOrPatchDataDogAnnotation(
-            patch, spec, namespace, name, inHandler, componentName
+            patch,
+            spec,
+            namespace,
+            name,
+            inHandler,
+            componentName,
+            service_index,
+            pod_index,
         )
     else:
         logWrapper(
@@ -281,7 +584,14 @@ def createOrPatchObservability(patch, spec, namespace, name, inHandler, componen
 
 
 def createOrPatchPrometheusAnnotation(
-    patch, spec, namespace, name, inHandler, componentName
+    patch,
+    spec,
+    namespace,
+    name,
+    inHandler,
+    componentName,
+    service_index=None,
+    pod_index=None,
 ):
     """Helper function to get API details for a prometheus metrics API and patch the corresponding kubernetes pod with Prometheus annotations.
 
@@ -292,6 +602,8 @@ def createOrPatchPrometheusAnnotation(
         * name (String): The name of the API Custom Resource
         * inHandler (String): The name of the handler function calling this function
         * componentName (String): The name of the ODA Component that the API is part of
+        * service_index (kopf.Index): optional `service_selectors` index. If not given, the Service is read.
+        * pod_index (kopf.Index): optional `pods_by_namespace` index. If not given, the pods are listed.
 
     Returns:
         nothing
@@ -306,75 +618,27 @@ def createOrPatchPrometheusAnnotation(
         "Prometheus Pod Annotation",
     )
 
-    client = kubernetes.client
     try:
-        # get the service
-        core_api = client.CoreV1Api()
-        service = core_api.read_namespaced_service(spec["implementation"], namespace)
-        selector = service.spec.selector
-        serviceName = service.metadata.name
-
-        logWrapper(
-            logging.INFO,
-            "createOrPatchPrometheusAnnotation",
-            inHandler,
-            "api/" + name,
-            componentName,
-            "createOrPatchPrometheusAnnotation selector=",
-            selector,
-        )
-        # get the pod using the selector
-        key, value = next(iter(selector.items()))
-        selectorQuery = key + "=" + value
-        logWrapper(
-            logging.INFO,
-            "createOrPatchPrometheusAnnotation",
-            inHandler,
-            "api/" + name,
-            componentName,
-            "createOrPatchPrometheusAnnotation selectorQuery=",
-            selectorQuery,
-        )
-
-        pod_list = core_api.list_namespaced_pod(namespace, label_selector=selectorQuery)
-        pod = pod_list.items[0]
-        podName = pod.metadata.name
-        logWrapper(
-            logging.INFO,
-            "createOrPatchPrometheusAnnotation",
-            inHandler,
-            "api/" + name,
-            componentName,
-            "createOrPatchPrometheusAnnotation podName=",
-            podName,
+        # get the pods behind the implementation service
+        pods = getServicePods(
+            spec["implementation"], namespace, service_index, pod_index
         )
+        if len(pods) == 0:
+            raise kopf.TemporaryError(
+                "No pods found for service " + spec["implementation"], delay=30
+            )
 
-        # prepare the annotation
-        if not pod.metadata.annotations:
-            pod.metadata.annotations = {}
-
-        pod.metadata.annotations["prometheus.io/scrape"] = "true"
-
-        logWrapper(
-            logging.INFO,
-            "createOrPatchPrometheusAnnotation",
-            inHandler,
-            "api/" + name,
-            componentName,
-            "createOrPatchPrometheusAnnotation patching pod with annotations=",
-            pod.metadata.annotations,
+        patched = annotatePods(
+            pods, namespace, lambda pod: {"prometheus.io/scrape": "true"}
         )
-
-        core_api.patch_namespaced_pod(podName, namespace, pod)
-
         logWrapper(
             logging.INFO,
             "createOrPatchPrometheusAnnotation",
             inHandler,
             "api/" + name,
             componentName,
-            "createOrPatchPrometheusAnnotation pod patched with annotations=",
-            pod.metadata.annotations,
+            "createOrPatchPrometheusAnnotation pods patched with annotations=",
+            patched,
         )
 
     except ApiException as e:
@@ -400,7 +664,14 @@ def createOrPatchPrometheusAnnotation(
 
 
 def createOrPatchDataDogAnnotation(
-    patch, spec, namespace, name, inHandler, componentName
+    patch,
+    spec,
+    namespace,
+    name,
+    inHandler,
+    componentName,
+    service_index=None,
+    pod_index=None,
 ):
     """Helper function to get API details for a prometheus metrics API and patch the corresponding kubernetes pod.
 
@@ -411,6 +682,8 @@ def createOrPatchDataDogAnnotation(
         * name (String): The name of the API Custom Resource
         * inHandler (String): The name of the handler function calling this function
         * componentName (String): The name of the ODA Component that the API is part of
+        * service_index (kopf.Index): optional `service_selectors` index. If not given, the Service is read.
+        * pod_index (kopf.Index): optional `pods_by_namespace` index. If not given, the pods are listed.
 
     Returns:
         nothing
@@ -428,68 +701,17 @@ def createOrPatchDataDogAnnotation(
     # To get the pod name for the implementation, follow these steps:
     # 1. The API has an 'implementation' field which is the name of the service that exposes the API.
     # 2. The service will include a spec.selector which allows you to find the pod that implements the API.
-    # 3. Get the pod and amend the annotation
+    # 3. Get the pods and amend their annotation
 
-    client = kubernetes.client
     try:
-        # get the service
-        core_api = client.CoreV1Api()
-        service = core_api.read_namespaced_service(spec["implementation"], namespace)
-        selector = service.spec.selector
-        serviceName = service.metadata.name
-
-        logWrapper(
-            logging.INFO,
-            "createOrPatchDataDogAnnotation",
-            inHandler,
-            "api/" + name,
-            componentName,
-            "createOrPatchDataDogAnnotation selector=",
-            selector,
-        )
-        # get the pod using the selector
-        key, value = next(
-            iter(selector.items())
-        )  # get the first key/value pair - we don't have a way to handle multiple selectors
-        selectorQuery = key + "=" + value
-        logWrapper(
-            logging.INFO,
-            "createOrPatchDataDogAnnotation",
-            inHandler,
-            "api/" + name,
-            componentName,
-            "createOrPatchDataDogAnnotation selectorQuery=",
-            selectorQuery,
-        )
-
-        pod_list = core_api.list_namespaced_pod(namespace, label_selector=selectorQuery)
-        # get the first pod
-        pod = pod_list.items[0]
-        podName = pod.metadata.name
-        logWrapper(
-            logging.INFO,
-            "createOrPatchDataDogAnnotation",
-            inHandler,
-            "api/" + name,
-            componentName,
-            "createOrPatchDataDogAnnotation podName=",
-            podName,
-        )
-
-        podContainers = pod.spec.containers
-        for container in podContainers:
-            logWrapper(
-                logging.INFO,
-                "createOrPatchDataDogAnnotation",
-                inHandler,
-                "api/" + name,
-                componentName,
-                "createOrPatchDataDogAnnotation container=",
-                container.name,
+        # get the pods behind the implementation service
+        serviceName = spec["implementation"]
+        pods = getServicePods(serviceName, namespace, service_index, pod_index)
+        if len(pods) == 0:
+            raise kopf.TemporaryError(
+                "No pods found for service " + serviceName, delay=30
             )
 
-        targetContainerName = podContainers[0].name  # default to the first container
-
         # prepare the annotation
         path = None
         if "path" in spec.keys():
@@ -523,27 +745,24 @@ def createOrPatchDataDogAnnotation(
             inHandler,
             "api/" + name,
             componentName,
-            "createOrPatchDataDogAnnotation patching pod with annotation=",
+            "createOrPatchDataDogAnnotation patching pods with annotation=",
             annotation,
         )
 
-        if not pod.metadata.annotations:
-            pod.metadata.annotations = {}
-
-        pod.metadata.annotations[
-            "ad.datadoghq.com/" + targetContainerName + ".checks"
-        ] = annotation
-        # patch the pod
-        core_api.patch_namespaced_pod(podName, namespace, pod)
-
+        # the annotation targets the first container of each pod
+        patched = annotatePods(
+            pods,
+            namespace,
+            lambda pod: {"ad.datadoghq.com/" + pod[3] + ".checks": annotation},
+        )
         logWrapper(
             logging.INFO,
             "createOrPatchDataDogAnnotation",
             inHandler,
             "api/" + name,
             componentName,
-            "createOrPatchDataDogAnnotation pod patched with annotation=",
-            annotation,
+            "createOrPatchDataDogAnnotation pods patched with annotation=",
+            patched,
         )
 
     except ApiException as e:
@@ -568,7 +787,76 @@ def createOrPatchDataDogAnnotation(
         raise kopf.TemporaryError("Exception in createOrPatchDataDogAnnotation.")
 
 
-def createOrPatchServiceMonitor(patch, spec, namespace, name, inHandler, componentName):
+def desired_state_hash(manifest):
+    """
+    Returns a hash over the desired state of a manifest (everything except metadata.annotations and metadata.resourceVersion).
+    """
+    desired_state = dict(manifest)
+    desired_state["metadata"] = {
+        key: value
+        for key, value in manifest["metadata"].items()
+        if key not in ("annotations", "resourceVersion")
+    }
+    return hashlib.sha256(
+        json.dumps(desired_state, sort_keys=True).encode()
+    ).hexdigest()
+
+
+def set_desired_state_hash(manifest):
+    """
+    Adds the desired state hash annotation to a manifest and returns the hash.
+    """
+    state_hash = desired_state_hash(manifest)
+    manifest["metadata"].setdefault("annotations", {})[
+        DESIRED_STATE_ANNOTATION
+    ] = state_hash
+    return state_hash
+
+
+def live_desired_state(state_index, namespace, name):
+    """
+    Returns (desired state hash, uid) of the live resource from a *_desired_state index, (None, None) if it is not known.
+    """
+    if state_index is None:
+        return None, None
+    for live in state_index.get((namespace, name), []):
+        return live
+    return None, None
+
+
+@kopf.index(VIRTUAL_SERVICE_GROUP, VIRTUAL_SERVICE_VERSION, VIRTUAL_SERVICE_PLURAL)
+def virtualservice_desired_state(namespace, name, annotations, uid, **kwargs):
+    """Indexing function for the desired state hash of VirtualService resources.
+
+    Returns:
+        Dict: {(namespace, name): (desired state hash, uid)}
+
+    :meta private:
+    """
+    return {(namespace, name): (annotations.get(DESIRED_STATE_ANNOTATION), uid)}
+
+
+def servicemonitor_desired_state(namespace, name, annotations, uid, **kwargs):
+    """Indexing function for the desired state hash of ServiceMonitor resources.
+
+    Returns:
+        Dict: {(namespace, name): (desired state hash, uid)}
+
+    :meta private:
+    """
+    return {(namespace, name): (annotations.get(DESIRED_STATE_ANNOTATION), uid)}
+
+
+# ServiceMonitors are only watched when they are used (the CRD is not installed otherwise)
+if OPENMETRICS_IMPLEMENTATION == "ServiceMonitor":
+    kopf.index(SERVICE_MONITOR_GROUP, SERVICE_MONITOR_VERSION, SERVICE_MONITOR_PLURAL)(
+        servicemonitor_desired_state
+    )
+
+
+def createOrPatchServiceMonitor(
+    patch, spec, namespace, name, inHandler, componentName, state_index=None
+):
     """Helper function to get API details for a prometheus metrics API and create or patch ServiceMonitor resource.
 
     Args:
@@ -578,6 +866,7 @@ def createOrPatchServiceMonitor(patch, spec, namespace, name, inHandler, compone
         * name (String): The name of the API Custom Resource
         * inHandler (String): The name of the handler function calling this function
         * componentName (String): The name of the ODA Component that the API is part of
+        * state_index (kopf.Index): Optional `servicemonitor_desired_state` index. If the live ServiceMonitor has the same desired state it is not written.
 
     Returns:
         nothing
@@ -591,11 +880,6 @@ def createOrPatchServiceMonitor(patch, spec, namespace, name, inHandler, compone
         if "hostname" in spec.keys():
             hostname = spec["hostname"]
 
-        SERVICE_MONITOR_GROUP = "monitoring.coreos.com"
-        SERVICE_MONITOR_VERSION = "v1"
-        SERVICE_MONITOR_PLURAL = "servicemonitors"
-        SERVICE_MONITOR_KIND = "ServiceMonitor"
-
         # FIX required to optionally add hostname instead of ["*"]
         body = {
             "apiVersion": SERVICE_MONITOR_GROUP + "/" + SERVICE_MONITOR_VERSION,
@@ -629,6 +913,23 @@ def createOrPatchServiceMonitor(patch, spec, namespace, name, inHandler, compone
             body,
         )
 
+        state_hash = set_desired_state_hash(body)
+        live_hash, live_uid = live_desired_state(state_index, namespace, name)
+        if live_hash == state_hash:
+            desired_state_metrics["skipped"] += 1
+            logWrapper(
+                logging.INFO,
+                "createOrPatchServiceMonitor",
+                inHandler,
+                "api/" + name,
+                componentName,
+                "Service Monitor unchanged",
+                name,
+            )
+            return
+        desired_state_metrics["writes"] += 1
+        logger.debug(f"Desired state write metrics: {desired_state_metrics}")
+
         if patch == True:
             # patch the resource
             serviceMonitorResource = custom_objects_api.patch_namespaced_custom_object(
@@ -708,6 +1009,95 @@ def createOrPatchServiceMonitor(patch, spec, namespace, name, inHandler, compone
         raise kopf.TemporaryError("Exception creating ServiceMonitor.")
 
 
+def vs_route_key(spec):
+    """
+    build the (gateway, host, path prefix) key of the first route of a VirtualService spec.
+    """
+    return (
+        safe_get(None, spec, "gateways", 0),
+        safe_get(None, spec, "hosts", 0),
+        safe_get(None, spec, "http", 0, "match", 0, "uri", "prefix"),
+    )
+
+
+def watchVirtualServices():
+    """Keep vs_route_cache up to date with a watch on the VirtualServices of all namespaces.
+
+    A kopf index only covers the namespaces watched by the operator, a conflicting route can be in any namespace.
+
+    :meta private:
+    """
+    custom_objects_api = kubernetes.client.CustomObjectsApi()
+    routes = {}
+    resourceVersion = None
+    while True:
+        try:
+            if resourceVersion is None:
+                api_response = get_virtualservices()
+                vs_index_metrics["lists"] += 1
+                routes = {
+                    (
+                        safe_get(None, virt_svc, "metadata", "namespace"),
+                        safe_get(None, virt_svc, "metadata", "name"),
+                    ): vs_route_key(safe_get(None, virt_svc, "spec"))
+                    for virt_svc in safe_get([], api_response, "items")
+                }
+                resourceVersion = safe_get(
+                    None, api_response, "metadata", "resourceVersion"
+                )
+                with vs_route_lock:
+                    vs_route_cache["routes"] = routes
+                vs_index_metrics["last_event"] = time.monotonic()
+            for event in kubernetes.watch.Watch().stream(
+                custom_objects_api.list_cluster_custom_object,
+                VIRTUAL_SERVICE_GROUP,
+                VIRTUAL_SERVICE_VERSION,
+                VIRTUAL_SERVICE_PLURAL,
+                resource_version=resourceVersion,
+                timeout_seconds=VIRTUAL_SERVICE_WATCH_SECONDS,
+            ):
+                virt_svc = event["object"]
+                key = (
+                    safe_get(None, virt_svc, "metadata", "namespace"),
+                    safe_get(None, virt_svc, "metadata", "name"),
+                )
+                with vs_route_lock:
+                    if event["type"] == "DELETED":
+                        routes.pop(key, None)
+                    else:
+                        routes[key] = vs_route_key(safe_get(None, virt_svc, "spec"))
+                resourceVersion = safe_get(
+                    resourceVersion, virt_svc, "metadata", "resourceVersion"
+                )
+                vs_index_metrics["last_event"] = time.monotonic()
+        except ApiException as e:
+            if (
+                e.status != 410
+            ):  # anything but an expired resourceVersion is retried after a pause
+                logger.warning(f"VirtualService watch failed: {e.reason}")
+                time.sleep(5)
+            resourceVersion = None
+        except Exception as e:
+            logger.warning(f"VirtualService watch failed: {e}")
+            time.sleep(5)
+            resourceVersion = None
+
+
+def ensureVirtualServiceWatch():
+    """Start the VirtualService watch thread on first use (the kubernetes configuration is loaded by then).
+
+    :meta private:
+    """
+    with vs_route_lock:
+        if vs_route_cache["thread"] is not None:
+            return
+        thread = threading.Thread(
+            target=watchVirtualServices, name="virtualservice-watch", daemon=True
+        )
+        vs_route_cache["thread"] = thread
+    thread.start()
+
+
 def get_virtualservices():
     """
     retrieve list of all VirtualServices in all namespaces
@@ -742,32 +1132,63 @@ def check_vs_conflict(vs_namespace, vs_name, gateway, hostname, path):
         * hostname
         * path
 
+    The routes of all VirtualServices in the cluster are served from the watch (see `watchVirtualServices`),
+    only before its first list the VirtualServices are listed here.
+
     if there is a conflict, raise an error
     """
-    virt_svcs = get_virtualservices()
-    for virt_svc in virt_svcs["items"]:
-        other_namespace = safe_get(None, virt_svc, "metadata", "namespace")
-        other_name = safe_get(None, virt_svc, "metadata", "name")
+    ensureVirtualServiceWatch()
+    with vs_route_lock:
+        routes = vs_route_cache["routes"]
+        if routes is not None:
+            others = [
+                other
+                for other, route in routes.items()
+                if route == (gateway, hostname, path)
+            ]
+    if routes is not None:
+        vs_index_metrics["hits"] += 1
+    else:
+        # the watch has not listed the VirtualServices yet
+        vs_index_metrics["fallbacks"] += 1
+        others = []
+        for virt_svc in get_virtualservices()["items"]:
+            if vs_route_key(safe_get(None, virt_svc, "spec")) == (
+                gateway,
+                hostname,
+                path,
+            ):
+                others.append(
+                    (
+                        safe_get(None, virt_svc, "metadata", "namespace"),
+                        safe_get(None, virt_svc, "metadata", "name"),
+                    )
+                )
 
+    last_event = vs_index_metrics["last_event"]
+    logger.debug(
+        "VirtualService index metrics: hits=%s fallbacks=%s conflicts=%s staleness=%s",
+        vs_index_metrics["hits"],
+        vs_index_metrics["fallbacks"],
+        vs_index_metrics["conflicts"],
+        None if last_event is None else round(time.monotonic() - last_event, 1),
+    )
+
+    for other_namespace, other_name in others:
         if other_namespace == vs_namespace and other_name == vs_name:
             continue
-        other_gateway = safe_get(None, virt_svc, "spec", "gateways", 0)
-        other_hostname = safe_get(None, virt_svc, "spec", "hosts", 0)
-        other_path = safe_get(
-            None, virt_svc, "spec", "http", 0, "match", 0, "uri", "prefix"
-        )
-        if (
-            other_gateway == gateway
-            and other_hostname == hostname
-            and other_path == path
-        ):
-            raise ValueError(
-                f"conflicting VirtualService '{other_name}.{other_namespace}'"
-            )
+        vs_index_metrics["conflicts"] += 1
+        raise ValueError(f"conflicting VirtualService '{other_name}.{other_namespace}'")
 
 
 def createOrPatchVirtualService(
-    patch, spec, namespace, inAPIName, inHandler, componentName
+    patch,
+    spec,
+    namespace,
+    inAPIName,
+    inHandler,
+    componentName,
+    state_index=None,
 ):
     """Helper function to get API details and create or patch VirtualService.
 
@@ -778,6 +1199,7 @@ def createOrPatchVirtualService(
         * inAPIName (String): The name of the API Custom Resource
         * inHandler (String): The name of the handler calling this function
         * componentName (String): The name of the component that owns the API resource
+        * state_index (kopf.Index): Optional `virtualservice_desired_state` index. If the live VirtualService has the same desired state it is not written.
 
     Returns:
         Dict: The updated apiStatus that will be put into the status field of the API resource.
@@ -833,7 +1255,22 @@ def createOrPatchVirtualService(
             body,
         )
 
-        if patch == True:
+        state_hash = set_desired_state_hash(body)
+        live_hash, live_uid = live_desired_state(state_index, namespace, inAPIName)
+        if live_hash == state_hash:
+            # the live VirtualService is already in the desired state, only the apiStatus is rebuilt
+            desired_state_metrics["skipped"] += 1
+            virtualServiceResource = {"metadata": {"uid": live_uid}}
+            logWrapper(
+                logging.INFO,
+                "createOrPatchVirtualService",
+                inHandler,
+                "api/" + inAPIName,
+                componentName,
+                "Virtual Service unchanged",
+                inAPIName,
+            )
+        elif patch == True:
             # patch the resource
             virtualServiceResource = custom_objects_api.patch_namespaced_custom_object(
                 VIRTUAL_SERVICE_GROUP,
@@ -843,6 +1280,7 @@ def createOrPatchVirtualService(
                 inAPIName,
                 body,
             )
+            desired_state_metrics["writes"] += 1
             logWrapper(
                 logging.DEBUG,
                 "createOrPatchVirtualService",
@@ -861,49 +1299,6 @@ def createOrPatchVirtualService(
                 "Virtual Service patched",
                 inAPIName,
             )
-            updateImplementationStatus(
-                namespace, spec["implementation"], inHandler, componentName
-            )
-            # update parent apiStatus
-            istioStatus = getIstioIngressStatus(
-                inHandler, "api/" + inAPIName, componentName
-            )
-            loadBalancer = istioStatus["loadBalancer"]
-            ports = istioStatus["ports"]
-            apistatus = {
-                "apiStatus": {
-                    "name": inAPIName,
-                    "uid": virtualServiceResource["metadata"]["uid"],
-                    "path": spec["path"],
-                    "port": spec["port"],
-                    "implementation": spec["implementation"],
-                }
-            }
-            if "ingress" in loadBalancer.keys():
-                ingress = loadBalancer["ingress"]
-                if isinstance(ingress, list):
-                    if len(ingress) > 0:
-                        ingressTarget = ingress[0]
-                        apistatus = buildAPIStatus(
-                            spec,
-                            apistatus,
-                            ingressTarget,
-                            ports,
-                            inAPIName,
-                            inHandler,
-                            componentName,
-                        )
-                        logWrapper(
-                            logging.DEBUG,
-                            "createOrPatchVirtualService",
-                            inHandler,
-                            "api/" + inAPIName,
-                            componentName,
-                            "apiStatus",
-                            apistatus,
-                        )
-
-            return apistatus["apiStatus"]
         else:
             # create the resource
             virtualServiceResource = custom_objects_api.create_namespaced_custom_object(
@@ -913,6 +1308,7 @@ def createOrPatchVirtualService(
                 VIRTUAL_SERVICE_PLURAL,
                 body,
             )
+            desired_state_metrics["writes"] += 1
             logWrapper(
                 logging.DEBUG,
                 "createOrPatchVirtualService",
@@ -931,48 +1327,49 @@ def createOrPatchVirtualService(
                 "Virtual Service created",
                 inAPIName,
             )
-            updateImplementationStatus(
-                namespace, spec["implementation"], inHandler, componentName
-            )
-            # update parent apiStatus
-            istioStatus = getIstioIngressStatus(
-                inHandler, "api/" + inAPIName, componentName
-            )
-            loadBalancer = istioStatus["loadBalancer"]
-            ports = istioStatus["ports"]
-            apistatus = {
-                "apiStatus": {
-                    "name": inAPIName,
-                    "uid": virtualServiceResource["metadata"]["uid"],
-                    "path": spec["path"],
-                    "port": spec["port"],
-                    "implementation": spec["implementation"],
-                }
+        updateImplementationStatus(
+            namespace, spec["implementation"], inHandler, componentName
+        )
+        logger.debug(f"Desired state write metrics: {desired_state_metrics}")
+        # update parent apiStatus
+        istioStatus = getIstioIngressStatus(
+            inHandler, "api/" + inAPIName, componentName
+        )
+        loadBalancer = istioStatus["loadBalancer"]
+        ports = istioStatus["ports"]
+        apistatus = {
+            "apiStatus": {
+                "name": inAPIName,
+                "uid": virtualServiceResource["metadata"]["uid"],
+                "path": spec["path"],
+                "port": spec["port"],
+                "implementation": spec["implementation"],
             }
-            if "ingress" in loadBalancer.keys():
-                ingress = loadBalancer["ingress"]
-                if isinstance(ingress, list):
-                    if len(ingress) > 0:
-                        ingressTarget = ingress[0]
-                        apistatus = buildAPIStatus(
-                            spec,
-                            apistatus,
-                            ingressTarget,
-                            ports,
-                            inAPIName,
-                            inHandler,
-                            componentName,
-                        )
-                        logWrapper(
-                            logging.DEBUG,
-                            "createOrPatchVirtualService",
-                            inHandler,
-                            "api/" + inAPIName,
-                            componentName,
-                            "apiStatus",
-                            apistatus,
-                        )
-            return apistatus["apiStatus"]
+        }
+        if "ingress" in loadBalancer.keys():
+            ingress = loadBalancer["ingress"]
+            if isinstance(ingress, list):
+                if len(ingress) > 0:
+                    ingressTarget = ingress[0]
+                    apistatus = buildAPIStatus(
+                        spec,
+                        apistatus,
+                        ingressTarget,
+                        ports,
+                        inAPIName,
+                        inHandler,
+                        componentName,
+                    )
+                    logWrapper(
+                        logging.DEBUG,
+                        "createOrPatchVirtualService",
+                        inHandler,
+                        "api/" + inAPIName,
+                        componentName,
+                        "apiStatus",
+                        apistatus,
+                    )
+        return apistatus["apiStatus"]
     except ApiException as e:
         logWrapper(
             logging.DEBUG,
@@ -1064,20 +1461,247 @@ def updateImplementationStatus(namespace, name, inHandler, componentName):
 
 
 # helper function to get Istio Ingress status
-def getIstioIngressStatus(inHandler, name, componentName):
-    # get ip or hostname where ingress is exposed from the istio-ingressgateway service
-    core_api_instance = kubernetes.client.CoreV1Api()
-    ISTIO_INGRESSGATEWAY_LABEL = "istio=ingressgateway"
+def ingressGatewayStatus(services):
+    """Helper function to build the ingress status from the istio ingress gateway services.
+
+    Args:
+        * services (List): The V1Service resources labelled istio=ingressgateway
+
+    Returns:
+        Dict with the loadBalancer (Dict) and ports (List of V1ServicePort) of the first gateway, or None if there is no gateway.
+
+    :meta private:
+    """
+    if len(services) == 0:
+        return None
+    serviceStatus = services[0].status
+    serviceSpec = services[0].spec
+    loadBalancer = None
+    if serviceStatus.load_balancer is not None:
+        loadBalancer = serviceStatus.load_balancer.to_dict()
+    ports = serviceSpec.ports
+    if publichostname_loadBalancer:
+        loadBalancer = publichostname_loadBalancer
+    return {"loadBalancer": loadBalancer, "ports": ports}
+
+
+def ingressGatewayKey(status):
+    """Helper function to get a comparable key for an ingress status (the address and ports that end up in the API status).
+
+    :meta private:
+    """
+    if status is None:
+        return None
+    ports = [port.to_dict() for port in status["ports"] or []]
+    return json.dumps([status["loadBalancer"], ports], sort_keys=True, default=str)
+
 
-    ## should get this by label (as this is what the gareway defines)
+def updateIngressGatewayCache(services):
+    """Helper function to store the watched ingress gateway services and re-status the ExposedAPIs when the gateway address or ports change.
+
+    Args:
+        * services (Dict): The V1Service resources labelled istio=ingressgateway keyed by (namespace, name)
+
+    Returns:
+        No return value.
+
+    :meta private:
+    """
+    # keep the order of list_service_for_all_namespaces (namespace, then name)
+    ordered = [services[key] for key in sorted(services.keys())]
+    status = ingressGatewayStatus(ordered)
+    key = ingressGatewayKey(status)
+    with ingress_gateway_lock:
+        previousKey = ingress_gateway_cache["key"]
+        ingress_gateway_cache["services"] = ordered
+        ingress_gateway_cache["key"] = key
+    if key is None or previousKey is None or key == previousKey:
+        return
+    ingress_gateway_metrics["changes"] += 1
+    logWrapper(
+        logging.INFO,
+        "updateIngressGatewayCache",
+        "watchIngressGateway",
+        "service/" + ISTIO_INGRESSGATEWAY_LABEL,
+        "",
+        "Istio Ingress Gateway",
+        "Address or ports changed - updating API status",
+    )
+    restatusExposedAPIs(status)
+
+
+def restatusExposedAPIs(istioStatus):
+    """Helper function to rebuild the apiStatus of the ExposedAPIs after the ingress gateway changed. Only APIs whose status changes are patched.
+
+    The ExposedAPIs are listed cluster-wide and filtered to the namespaces watched by the operator, each API is patched in its own namespace.
+
+    Args:
+        * istioStatus (Dict): The ingress status with loadBalancer and ports
+
+    Returns:
+        No return value.
+
+    :meta private:
+    """
+    ingress = safe_get([], istioStatus["loadBalancer"], "ingress")
+    if not isinstance(ingress, list) or len(ingress) == 0:
+        return
+    custom_objects_api = kubernetes.client.CustomObjectsApi()
     try:
-        # get the istio-ingressgateway service by label 'istio: ingressgateway'
-        api_response = core_api_instance.list_service_for_all_namespaces(
-            label_selector=ISTIO_INGRESSGATEWAY_LABEL
+        api_response = custom_objects_api.list_cluster_custom_object(
+            GROUP, VERSION, APIS_PLURAL
+        )
+    except ApiException as e:
+        logWrapper(
+            logging.WARNING,
+            "restatusExposedAPIs",
+            "watchIngressGateway",
+            "api/*",
+            "",
+            "ApiException",
+            " calling list_cluster_custom_object",
+        )
+        return
+    for api in api_response["items"]:
+        apiName = api["metadata"]["name"]
+        apiNamespace = api["metadata"]["namespace"]
+        if not isWatchedNamespace(apiNamespace):
+            continue
+        componentName = safe_get(
+            "", api["metadata"], "labels", "oda.tmforum.org/componentName"
+        )
+        oldStatus = safe_get(None, api, "status", "apiStatus")
+        if not oldStatus or "url" not in oldStatus:
+            continue  # status not built yet, the create/update handler will do it
+        try:
+            apistatus = buildAPIStatus(
+                api["spec"],
+                {"apiStatus": dict(oldStatus)},
+                ingress[0],
+                istioStatus["ports"],
+                apiName,
+                "restatusExposedAPIs",
+                componentName,
+            )
+            if apistatus["apiStatus"] == oldStatus:
+                continue
+            custom_objects_api.patch_namespaced_custom_object(
+                GROUP,
+                VERSION,
+                apiNamespace,
+                APIS_PLURAL,
+                apiName,
+                {"status": {"apiStatus": apistatus["apiStatus"]}},
+            )
+            ingress_gateway_metrics["restatus"] += 1
+            logWrapper(
+                logging.INFO,
+                "restatusExposedAPIs",
+                "watchIngressGateway",
+                "api/" + apiName,
+                componentName,
+                "Updated apiStatus",
+                apistatus["apiStatus"]["url"],
+            )
+        except (ApiException, kopf.TemporaryError) as e:
+            logWrapper(
+                logging.WARNING,
+                "restatusExposedAPIs",
+                "watchIngressGateway",
+                "api/" + apiName,
+                componentName,
+                "Exception updating apiStatus",
+                str(e),
+            )
+
+
+def watchIngressGateway():
+    """Keep ingress_gateway_cache up to date with a watch on the istio ingress gateway services.
+
+    The operator only watches the component namespace, so the gateway is watched here rather than with a kopf index.
+
+    :meta private:
+    """
+    core_api_instance = kubernetes.client.CoreV1Api()
+    services = {}
+    resourceVersion = None
+    while True:
+        try:
+            if resourceVersion is None:
+                api_response = core_api_instance.list_service_for_all_namespaces(
+                    label_selector=ISTIO_INGRESSGATEWAY_LABEL
+                )
+                ingress_gateway_metrics["lists"] += 1
+                services = {
+                    (service.metadata.namespace, service.metadata.name): service
+                    for service in api_response.items
+                }
+                resourceVersion = api_response.metadata.resource_version
+                updateIngressGatewayCache(services)
+            for event in kubernetes.watch.Watch().stream(
+                core_api_instance.list_service_for_all_namespaces,
+                label_selector=ISTIO_INGRESSGATEWAY_LABEL,
+                resource_version=resourceVersion,
+                timeout_seconds=INGRESS_GATEWAY_WATCH_SECONDS,
+            ):
+                service = event["object"]
+                key = (service.metadata.namespace, service.metadata.name)
+                if event["type"] == "DELETED":
+                    services.pop(key, None)
+                else:
+                    services[key] = service
+                resourceVersion = service.metadata.resource_version
+                updateIngressGatewayCache(services)
+                logger.debug(f"ingress gateway metrics {ingress_gateway_metrics}")
+        except ApiException as e:
+            if (
+                e.status != 410
+            ):  # anything but an expired resourceVersion is retried after a pause
+                logger.warning(f"ingress gateway watch failed: {e.reason}")
+                time.sleep(5)
+            resourceVersion = None
+        except Exception as e:
+            logger.warning(f"ingress gateway watch failed: {e}")
+            time.sleep(5)
+            resourceVersion = None
+
+
+def ensureIngressGatewayWatch():
+    """Start the ingress gateway watch thread on first use (the kubernetes configuration is loaded by then).
+
+    :meta private:
+    """
+    with ingress_gateway_lock:
+        if ingress_gateway_cache["thread"] is not None:
+            return
+        thread = threading.Thread(
+            target=watchIngressGateway, name="ingress-gateway-watch", daemon=True
         )
+        ingress_gateway_cache["thread"] = thread
+    thread.start()
+
+
+def getIstioIngressStatus(inHandler, name, componentName):
+    # get ip or hostname where ingress is exposed from the istio-ingressgateway service
+    ensureIngressGatewayWatch()
+    with ingress_gateway_lock:
+        services = ingress_gateway_cache["services"]
+    try:
+        if services is not None:
+            # served from the watch
+            ingress_gateway_metrics["hits"] += 1
+        else:
+            # the watch has not listed the gateway yet
+            core_api_instance = kubernetes.client.CoreV1Api()
+            # get the istio-ingressgateway service by label 'istio: ingressgateway'
+            api_response = core_api_instance.list_service_for_all_namespaces(
+                label_selector=ISTIO_INGRESSGATEWAY_LABEL
+            )
+            ingress_gateway_metrics["lists"] += 1
+            services = api_response.items
 
-        # api_response = core_api_instance.read_namespaced_service(ISTIO_INGRESSGATEWAY, ISTIO_NAMESPACE)
-        if len(api_response.items) == 0:
+        response = ingressGatewayStatus(services)
+        if response is None:
             logWrapper(
                 logging.WARNING,
                 "getIstioIngressStatus",
@@ -1088,16 +1712,6 @@ def getIstioIngressStatus(inHandler, name, componentName):
                 "Istio Ingress Gateway",
             )
             raise kopf.TemporaryError("Can not find Istio Ingress Gateway.")
-
-        serviceStatus = api_response.items[0].status
-        serviceSpec = api_response.items[0].spec
-        loadBalancer = None
-        if serviceStatus.load_balancer is not None:
-            loadBalancer = serviceStatus.load_balancer.to_dict()
-        ports = serviceSpec.ports
-        if publichostname_loadBalancer:
-            loadBalancer = publichostname_loadBalancer
-        response = {"loadBalancer": loadBalancer, "ports": ports}
         logWrapper(
             logging.INFO,
             "getIstioIngressStatus",
@@ -1227,13 +1841,29 @@ def buildAPIStatus(
 
 
 # When service where implementation is ready, update parent API object
-@kopf.on.create("discovery.k8s.io", "v1", "endpointslice", retries=5)
-@kopf.on.update("discovery.k8s.io", "v1", "endpointslice", retries=5)
-def implementation_status(meta, spec, status, body, namespace, labels, name, **kwargs):
+# EndpointSlices inherit the labels of their Service, only the slices of ODA Component services are handled
+@kopf.on.create(
+    "discovery.k8s.io",
+    "v1",
+    "endpointslice",
+    labels={"oda.tmforum.org/componentName": kopf.PRESENT},
+    retries=5,
+)
+@kopf.on.update(
+    "discovery.k8s.io",
+    "v1",
+    "endpointslice",
+    labels={"oda.tmforum.org/componentName": kopf.PRESENT},
+    retries=5,
+)
+async def implementation_status(
+    meta, spec, status, body, namespace, labels, name, **kwargs
+):
     """Handler function to register for status changes in EndPointSlide resources.
 
     The EndPointSlide resources show the implementation of an API linked the the API implementations Service Resource.
     When EndPointSlide updates the ready-status of the implementation, update parent API object.
+    Events for the same service are debounced, see `queueImplementationStatus`.
 
     Args:
         * meta (Dict): The metadata from the EndPointSlide Resource
@@ -1251,11 +1881,10 @@ def implementation_status(meta, spec, status, body, namespace, labels, name, **k
     """
     try:
         componentName = labels["oda.tmforum.org/componentName"]
-        createAPIImplementationStatus(
-            meta["ownerReferences"][0]["name"],
-            body["endpoints"],
+        await queueImplementationStatus(
             namespace,
-            "implementation_status",
+            meta["ownerReferences"][0]["name"],
+            body.get("endpoints"),
             componentName,
         )
     except Exception as e:
@@ -1271,6 +1900,91 @@ def implementation_status(meta, spec, status, body, namespace, labels, name, **k
         raise kopf.TemporaryError("Exception handling implementation_status.")
 
 
+def endpointsReady(endpointsArray):
+    """Helper function to check if any endpoint of an EndpointSlice is ready.
+
+    Args:
+        * endpointsArray (Array): The endpoints of the EndpointSlice, as objects or dictionaries
+
+    Returns:
+        Boolean: True if at least one endpoint is ready.
+
+    :meta private:
+    """
+    for endpoint in endpointsArray or []:
+        # endpoint could be an object or a dictionary
+        if isinstance(endpoint, dict):
+            ready = safe_get(None, endpoint, "conditions", "ready")
+        else:
+            ready = endpoint.conditions.ready
+        if ready == True:
+            return True
+    return False
+
+
+async def queueImplementationStatus(
+    namespace, serviceName, endpointsArray, componentName
+):
+    """Helper function to queue the implementation ready state of a service.
+
+    Events for the same service that arrive within IMPLEMENTATION_STATUS_DEBOUNCE seconds are merged, only the last
+    one is applied. The caller waits until it is applied, so that errors are raised in the calling handler and kopf
+    can retry it.
+
+    Args:
+        * namespace (String): The namespace for the Kubernetes Service that implements the API
+        * serviceName (String): The name of the Kubernetes Service that implements the API
+        * endpointsArray (Array): The endpoints of the EndpointSlice
+        * componentName (String): The name of the ODA Component that the API resource is owned by
+
+    Returns:
+        No return value.
+
+    :meta private:
+    """
+    key = (namespace, serviceName)
+    implementation_status_metrics["events"] += 1
+    batch = pending_implementation_status.get(key)
+    if batch is None:
+        batch = {"done": asyncio.get_running_loop().create_future()}
+        pending_implementation_status[key] = batch
+        asyncio.create_task(flushImplementationStatus(key))
+    else:
+        implementation_status_metrics["merged"] += 1
+    batch["endpoints"] = endpointsArray
+    batch["componentName"] = componentName
+    await asyncio.shield(batch["done"])
+
+
+async def flushImplementationStatus(key):
+    """Helper function to apply the queued ready state of a service after the debounce window, if it flipped.
+
+    :meta private:
+    """
+    await asyncio.sleep(IMPLEMENTATION_STATUS_DEBOUNCE)
+    batch = pending_implementation_status.pop(key)
+    namespace, serviceName = key
+    ready = endpointsReady(batch["endpoints"])
+    try:
+        if implementation_ready.get(key) == ready:
+            implementation_status_metrics["unchanged"] += 1
+        else:
+            await k8s_async.run_blocking(
+                createAPIImplementationStatus,
+                serviceName,
+                batch["endpoints"],
+                namespace,
+                "implementation_status",
+                batch["componentName"],
+            )
+            implementation_ready[key] = ready
+            implementation_status_metrics["applied"] += 1
+        logger.debug(f"implementation status metrics {implementation_status_metrics}")
+        batch["done"].set_result(None)
+    except Exception as e:
+        batch["done"].set_exception(e)
+
+
 def createAPIImplementationStatus(
     serviceName, endpointsArray, namespace, inHandler, componentName
 ):
@@ -1288,58 +2002,51 @@ def createAPIImplementationStatus(
 
     :meta private:
     """
-    anyEndpointReady = False
-    if endpointsArray != None:
-        for endpoint in endpointsArray:
-            # endpoint could be an object or a dictionary
-            ready = False
-            if isinstance(endpoint, dict):
-                ready = endpoint["conditions"]["ready"]
-            else:
-                ready = endpoint.conditions.ready
-            if ready == True:
-                anyEndpointReady = True
-                # find the corresponding API resource and update status
-                # query for api with spec.implementation equal to service name
-                api_instance = kubernetes.client.CustomObjectsApi()
-                api_response = api_instance.list_namespaced_custom_object(
-                    GROUP, VERSION, namespace, APIS_PLURAL
+    anyEndpointReady = endpointsReady(endpointsArray)
+    if anyEndpointReady:
+        # find the corresponding API resource and update status
+        # query for api with spec.implementation equal to service name
+        api_instance = kubernetes.client.CustomObjectsApi()
+        api_response = api_instance.list_namespaced_custom_object(
+            GROUP, VERSION, namespace, APIS_PLURAL
+        )
+        found = False
+        for api in api_response["items"]:
+            if api["spec"]["implementation"] == serviceName:
+                found = True
+                if safe_get(None, api, "status", "implementation", "ready"):
+                    continue  # already ready, nothing to patch
+                if not ("status" in api.keys()):
+                    api["status"] = {}
+                api["status"]["implementation"] = {"ready": True}
+                api_response = api_instance.patch_namespaced_custom_object(
+                    GROUP,
+                    VERSION,
+                    namespace,
+                    APIS_PLURAL,
+                    api["metadata"]["name"],
+                    api,
+                )
+                logWrapper(
+                    logging.INFO,
+                    "createAPIImplementationStatus",
+                    inHandler,
+                    "endpointslice/" + api["metadata"]["name"],
+                    componentName,
+                    "Added implementation ready status",
+                    anyEndpointReady,
                 )
-                found = False
-                for api in api_response["items"]:
-                    if api["spec"]["implementation"] == serviceName:
-                        found = True
-                        if not ("status" in api.keys()):
-                            api["status"] = {}
-                        api["status"]["implementation"] = {"ready": True}
-                        api_response = api_instance.patch_namespaced_custom_object(
-                            GROUP,
-                            VERSION,
-                            namespace,
-                            APIS_PLURAL,
-                            api["metadata"]["name"],
-                            api,
-                        )
-                        logWrapper(
-                            logging.INFO,
-                            "createAPIImplementationStatus",
-                            inHandler,
-                            "endpointslice/" + api["metadata"]["name"],
-                            componentName,
-                            "Added implementation ready status",
-                            anyEndpointReady,
-                        )
 
-                if found == False:
-                    logWrapper(
-                        logging.INFO,
-                        "createAPIImplementationStatus",
-                        inHandler,
-                        "service/" + serviceName,
-                        componentName,
-                        "Can't find API resource",
-                        serviceName,
-                    )
+        if found == False:
+            logWrapper(
+                logging.INFO,
+                "createAPIImplementationStatus",
+                inHandler,
+                "service/" + serviceName,
+                componentName,
+                "Can't find API resource",
+                serviceName,
+            )
 
 
 # When api adds url address of where api is exposed, update parent Component object
@@ -1371,117 +2078,24 @@ async def updateAPIStatus(meta, status, namespace, name, **kwargs):
                     # str | the custom object's name
                     parent_component_name = meta["ownerReferences"][0]["name"]
 
-                    try:
-                        custom_objects_api = kubernetes.client.CustomObjectsApi()
-                        parent_component = (
-                            custom_objects_api.get_namespaced_custom_object(
-                                group=GROUP,
-                                version=VERSION,
-                                namespace=namespace,
-                                plural=COMPONENTS_PLURAL,
-                                name=parent_component_name,
-                            )
-                        )
-                    except ApiException as e:
-                        # Cant find parent component (if component in same chart as other kubernetes resources it may not be created yet)
-                        if e.status == HTTP_NOT_FOUND:
-                            raise kopf.TemporaryError(
-                                "Cannot find parent component " + parent_component_name
-                            )
-                        else:
-                            logger.error(
-                                "Exception when calling custom_objects_api.get_namespaced_custom_object: %s",
-                                e,
-                            )
-
                     logWrapper(
                         logging.DEBUG,
                         "updateAPIStatus",
                         "updateAPIStatus",
                         "api/" + name,
-                        parent_component["metadata"]["name"],
+                        parent_component_name,
                         "Handler called",
                         "",
                     )
 
-                    # find the correct array entry to update either in coreAPIs, managementAPIs or securityAPIs
-                    if "coreAPIs" in parent_component["status"].keys():
-                        for key in range(len(parent_component["status"]["coreAPIs"])):
-                            if (
-                                parent_component["status"]["coreAPIs"][key]["uid"]
-                                == meta["uid"]
-                            ):
-                                parent_component["status"]["coreAPIs"][key]["url"] = (
-                                    status["apiStatus"]["url"]
-                                )
-                                logWrapper(
-                                    logging.INFO,
-                                    "updateAPIStatus",
-                                    "updateAPIStatus",
-                                    "api/" + name,
-                                    parent_component["metadata"]["name"],
-                                    "Updating parent component coreAPIs APIs with url",
-                                    status["apiStatus"]["url"],
-                                )
-                                if "developerUI" in status["apiStatus"].keys():
-                                    parent_component["status"]["coreAPIs"][key][
-                                        "developerUI"
-                                    ] = status["apiStatus"]["developerUI"]
-
-                    if "managementAPIs" in parent_component["status"].keys():
-                        for key in range(
-                            len(parent_component["status"]["managementAPIs"])
-                        ):
-                            if (
-                                parent_component["status"]["managementAPIs"][key]["uid"]
-                                == meta["uid"]
-                            ):
-                                parent_component["status"]["managementAPIs"][key][
-                                    "url"
-                                ] = status["apiStatus"]["url"]
-                                logWrapper(
-                                    logging.INFO,
-                                    "updateAPIStatus",
-                                    "updateAPIStatus",
-                                    "api/" + name,
-                                    parent_component["metadata"]["name"],
-                                    "Updating parent component managementAPIs APIs with url",
-                                    status["apiStatus"]["url"],
-                                )
-                                if "developerUI" in status["apiStatus"].keys():
-                                    parent_component["status"]["managementAPIs"][key][
-                                        "developerUI"
-                                    ] = status["apiStatus"]["developerUI"]
-
-                    if "securityAPIs" in parent_component["status"].keys():
-                        for key in range(
-                            len(parent_component["status"]["securityAPIs"])
-                        ):
-                            if (
-                                parent_component["status"]["securityAPIs"][key]["uid"]
-                                == meta["uid"]
-                            ):
-                                parent_component["status"]["securityAPIs"][key][
-                                    "url"
-                                ] = status["apiStatus"]["url"]
-                                logWrapper(
-                                    logging.INFO,
-                                    "updateAPIStatus",
-                                    "updateAPIStatus",
-                                    "api/" + name,
-                                    parent_component["metadata"]["name"],
-                                    "Updating parent component securityAPIs APIs with url",
-                                    status["apiStatus"]["url"],
-                                )
-                                if "developerUI" in status["apiStatus"].keys():
-                                    parent_component["status"]["securityAPIs"][key][
-                                        "developerUI"
-                                    ] = status["apiStatus"]["developerUI"]
-
-                    await patchComponent(
+                    fields = {"url": status["apiStatus"]["url"]}
+                    if "developerUI" in status["apiStatus"].keys():
+                        fields["developerUI"] = status["apiStatus"]["developerUI"]
+                    await queueComponentUpdate(
                         namespace,
                         parent_component_name,
-                        parent_component,
+                        meta["uid"],
+                        fields,
                         "updateAPIStatus",
                     )
         return None
@@ -1519,110 +2133,23 @@ async def updateAPIReady(meta, status, namespace, name, **kwargs):
                     # str | the custom object's name
                     parent_component_name = meta["ownerReferences"][0]["name"]
 
-                    try:
-                        custom_objects_api = kubernetes.client.CustomObjectsApi()
-                        parent_component = (
-                            custom_objects_api.get_namespaced_custom_object(
-                                GROUP,
-                                VERSION,
-                                namespace,
-                                COMPONENTS_PLURAL,
-                                parent_component_name,
-                            )
-                        )
-                    except ApiException as e:
-                        # Cant find parent component (if component in same chart as other kubernetes resources it may not be created yet)
-                        if e.status == HTTP_NOT_FOUND:
-                            raise kopf.TemporaryError(
-                                "Cannot find parent component " + parent_component_name
-                            )
-                        else:
-                            logger.error(
-                                "Exception when calling custom_objects_api.get_namespaced_custom_object: %s",
-                                e,
-                            )
-
                     logWrapper(
                         logging.DEBUG,
                         "updateAPIReady",
                         "updateAPIReady",
                         "api/" + name,
-                        parent_component["metadata"]["name"],
+                        parent_component_name,
                         "Handler called",
                         "",
                     )
 
-                    # find the correct array entry to update either in coreAPIs, managementAPIs or securityAPIs
-                    for key in range(len(parent_component["status"]["coreAPIs"])):
-                        if (
-                            parent_component["status"]["coreAPIs"][key]["uid"]
-                            == meta["uid"]
-                        ):
-                            parent_component["status"]["coreAPIs"][key]["ready"] = True
-                            logWrapper(
-                                logging.INFO,
-                                "updateAPIReady",
-                                "updateAPIReady",
-                                "api/" + name,
-                                parent_component["metadata"]["name"],
-                                "Updating component coreAPIs status",
-                                status["implementation"]["ready"],
-                            )
-                            await patchComponent(
-                                namespace,
-                                parent_component_name,
-                                parent_component,
-                                "updateAPIReady",
-                            )
-                            return None
-                    for key in range(len(parent_component["status"]["managementAPIs"])):
-                        if (
-                            parent_component["status"]["managementAPIs"][key]["uid"]
-                            == meta["uid"]
-                        ):
-                            parent_component["status"]["managementAPIs"][key][
-                                "ready"
-                            ] = True
-                            logWrapper(
-                                logging.INFO,
-                                "updateAPIReady",
-                                "updateAPIReady",
-                                "api/" + name,
-                                parent_component["metadata"]["name"],
-                                "Updating component managementAPIs status",
-                                status["implementation"]["ready"],
-                            )
-                            await patchComponent(
-                                namespace,
-                                parent_component_name,
-                                parent_component,
-                                "updateAPIReady",
-                            )
-                            return None
-                    for key in range(len(parent_component["status"]["securityAPIs"])):
-                        if (
-                            parent_component["status"]["securityAPIs"][key]["uid"]
-                            == meta["uid"]
-                        ):
-                            parent_component["status"]["securityAPIs"][key][
-                                "ready"
-                            ] = True
-                            logWrapper(
-                                logging.INFO,
-                                "updateAPIReady",
-                                "updateAPIReady",
-                                "api/" + name,
-                                parent_component["metadata"]["name"],
-                                "Updating component securityAPIs status",
-                                status["implementation"]["ready"],
-                            )
-                            await patchComponent(
-                                namespace,
-                                parent_component_name,
-                                parent_component,
-                                "updateAPIReady",
-                            )
-                            return None
+                    await queueComponentUpdate(
+                        namespace,
+                        parent_component_name,
+                        meta["uid"],
+                        {"ready": True},
+                        "updateAPIReady",
+                    )
         return None
 
     except kopf.TemporaryError as e:
@@ -1631,57 +2158,176 @@ async def updateAPIReady(meta, status, namespace, name, **kwargs):
         logWrapper.error(f"Unhandled exception {e}: {traceback.format_exc()}")
 
 
-async def patchComponent(namespace, name, component, inHandler):
-    """Helper function to patch a component.
+async def queueComponentUpdate(namespace, componentName, uid, fields, inHandler):
+    """Helper function to queue an update of a child API entry in the parent component status.
+
+    Updates for the same component that arrive within COMPONENT_PATCH_DEBOUNCE seconds are merged and
+    applied with a single patch. The caller waits until its update is applied, so that errors are
+    raised in the calling handler and kopf can retry it.
 
     Args:
         * namespace (String): The namespace for the Component resource
-        * name (String): The name of the Component resource
-        * component (Dict): The component object.
+        * componentName (String): The name of the Component resource
+        * uid (String): The uid of the child API resource
+        * fields (Dict): The fields to set in the API entry of the component status e.g. {"ready": True}
+        * inHandler (String): The name of the handler calling this function
 
     Returns:
         No return value.
 
     :meta private:
     """
+    key = (namespace, componentName)
+    batch = pending_component_updates.get(key)
+    if batch is None:
+        batch = {
+            "updates": {},
+            "done": asyncio.get_running_loop().create_future(),
+        }
+        pending_component_updates[key] = batch
+        asyncio.create_task(flushComponentUpdates(key, inHandler))
+    else:
+        component_patch_metrics["merged_updates"] += 1
+    batch["updates"].setdefault(uid, {}).update(fields)
+    await asyncio.shield(batch["done"])
+
+
+async def flushComponentUpdates(key, inHandler):
+    """Helper function to apply the queued updates for one component after the debounce window.
+
+    :meta private:
+    """
+    await asyncio.sleep(COMPONENT_PATCH_DEBOUNCE)
+    batch = pending_component_updates.pop(key)
+    namespace, componentName = key
     try:
-        custom_objects_api = kubernetes.client.CustomObjectsApi()
-        api_response = custom_objects_api.patch_namespaced_custom_object(
-            GROUP, VERSION, namespace, COMPONENTS_PLURAL, name, component
-        )
-        logWrapper(
-            logging.DEBUG,
-            "patchComponent",
-            inHandler,
-            "api/" + name,
-            component["metadata"]["name"],
-            "custom_objects_api.patch_namespaced_custom_object response",
-            api_response,
-        )
-    except ApiException as e:
-        logWrapper(
-            logging.DEBUG,
-            "patchComponent",
-            inHandler,
-            "api/" + name,
-            component["metadata"]["name"],
-            "Exception when calling api_instance.patch_namespaced_custom_object",
-            e,
-        )
-        logWrapper(
-            logging.INFO,
-            "patchComponent",
-            inHandler,
-            "api/" + name,
-            component["metadata"]["name"],
-            "Exception when calling api_instance.patch_namespaced_custom_object - will retry",
-            "",
-        )
+        await patchComponent(namespace, componentName, batch["updates"], inHandler)
+        batch["done"].set_result(None)
+    except Exception as e:
+        batch["done"].set_exception(e)
 
-        raise kopf.TemporaryError(
-            "Exception when calling api_instance.patch_namespaced_custom_object for component "
-            + name
-        )
+
+async def patchComponent(namespace, name, updates, inHandler):
+    """Helper function to apply API entry updates to a component with one merge patch.
+
+    The patch contains the resourceVersion that was read, so concurrent changes of the component
+    lead to a conflict. On conflict the component is read again and the patch retried.
+
+    Args:
+        * namespace (String): The namespace for the Component resource
+        * name (String): The name of the Component resource
+        * updates (Dict): The fields to set per child API uid, e.g. {uid: {"url": ..., "ready": True}}
+        * inHandler (String): The name of the handler calling this function
+
+    Returns:
+        No return value.
+
+    :meta private:
+    """
+    custom_objects_api = k8s_async.custom_objects_api()
+    for attempt in range(COMPONENT_PATCH_RETRIES):
+        try:
+            parent_component = await custom_objects_api.get_namespaced_custom_object(
+                GROUP, VERSION, namespace, COMPONENTS_PLURAL, name
+            )
+        except ApiException as e:
+            # Cant find parent component (if component in same chart as other kubernetes resources it may not be created yet)
+            if e.status == HTTP_NOT_FOUND:
+                raise kopf.TemporaryError("Cannot find parent component " + name)
+            logger.error(
+                "Exception when calling custom_objects_api.get_namespaced_custom_object: %s",
+                e,
+            )
+            raise kopf.TemporaryError("Exception reading parent component " + name)
+
+        # find the correct array entries to update in coreAPIs, managementAPIs or securityAPIs
+        changedSegments = {}
+        for segment in ["coreAPIs", "managementAPIs", "securityAPIs"]:
+            entries = safe_get([], parent_component, "status", segment)
+            for entry in entries:
+                for field, value in updates.get(entry.get("uid"), {}).items():
+                    if entry.get(field) != value:
+                        entry[field] = value
+                        changedSegments[segment] = entries
+                        logWrapper(
+                            logging.INFO,
+                            "patchComponent",
+                            inHandler,
+                            "api/" + safe_get("", entry, "name"),
+                            name,
+                            f"Updating parent component {segment} {field}",
+                            value,
+                        )
+        if not changedSegments:
+            return
+
+        patch = {
+            "metadata": {
+                "resourceVersion": parent_component["metadata"]["resourceVersion"]
+            },
+            "status": changedSegments,
+        }
+        try:
+            api_response = await custom_objects_api.patch_namespaced_custom_object(
+                GROUP, VERSION, namespace, COMPONENTS_PLURAL, name, patch
+            )
+            component_patch_metrics["patches"] += 1
+            logWrapper(
+                logging.DEBUG,
+                "patchComponent",
+                inHandler,
+                "component/" + name,
+                name,
+                "custom_objects_api.patch_namespaced_custom_object response",
+                api_response,
+            )
+            logWrapper(
+                logging.DEBUG,
+                "patchComponent",
+                inHandler,
+                "component/" + name,
+                name,
+                "Component patch metrics",
+                component_patch_metrics,
+            )
+            return
+        except ApiException as e:
+            if e.status == HTTP_CONFLICT:
+                component_patch_metrics["conflict_retries"] += 1
+                logWrapper(
+                    logging.INFO,
+                    "patchComponent",
+                    inHandler,
+                    "component/" + name,
+                    name,
+                    "Conflict patching component - retrying",
+                    attempt + 1,
+                )
+                continue
+            logWrapper(
+                logging.DEBUG,
+                "patchComponent",
+                inHandler,
+                "component/" + name,
+                name,
+                "Exception when calling api_instance.patch_namespaced_custom_object",
+                e,
+            )
+            break
+
+    logWrapper(
+        logging.INFO,
+        "patchComponent",
+        inHandler,
+        "component/" + name,
+        name,
+        "Exception when calling api_instance.patch_namespaced_custom_object - will retry",
+        "",
+    )
+    raise kopf.TemporaryError(
+        "Exception when calling api_instance.patch_namespaced_custom_object for component "
+        + name
+    )
 
 
 def logWrapper(
@@ -0,0 +1,63 @@
+import os
+import sys
+
+import kubernetes.client
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import apiOperatorIstio
+
+
+def exposed_api(namespace, name, ip):
+    return {
+        "metadata": {
+            "namespace": namespace,
+            "name": name,
+            "labels": {"oda.tmforum.org/componentName": name},
+        },
+        "spec": {"path": f"/{name}"},
+        "status": {"apiStatus": {"url": f"https://{ip}/{name}", "ip": ip}},
+    }
+
+
+class FakeCustomObjectsApi:
+    """Serves ExposedAPIs in several namespaces and records the status patches."""
+
+    apis = []
+    patches = []
+
+    def list_cluster_custom_object(self, group, version, plural):
+        return {"items": self.apis}
+
+    def patch_namespaced_custom_object(
+        self, group, version, namespace, plural, name, body
+    ):
+        self.patches.append((namespace, name, body["status"]["apiStatus"]["url"]))
+
+
+def test_restatus_patches_apis_in_all_watched_namespaces(monkeypatch):
+    FakeCustomObjectsApi.apis = [
+        exposed_api("components", "a", "10.0.0.1"),
+        exposed_api("odacompns-1", "b", "10.0.0.1"),
+        exposed_api("odacompns-2", "c", "10.0.0.2"),
+        exposed_api("odacompns-test", "d", "10.0.0.1"),
+        exposed_api("other", "e", "10.0.0.1"),
+    ]
+    FakeCustomObjectsApi.patches = []
+    monkeypatch.setattr(kubernetes.client, "CustomObjectsApi", FakeCustomObjectsApi)
+    monkeypatch.setattr(
+        apiOperatorIstio,
+        "component_namespace_patterns",
+        ["components", "odacompns-*", "!odacompns-test"],
+    )
+    apiOperatorIstio.restatusExposedAPIs(
+        {
+            "loadBalancer": {"ingress": [{"ip": "10.0.0.2"}]},
+            "ports": [kubernetes.client.V1ServicePort(name="http", port=80)],
+        }
+    )
+    # c already has the new address, d and e are not watched
+    assert FakeCustomObjectsApi.patches == [
+        ("components", "a", "https://10.0.0.2/a"),
+        ("odacompns-1", "b", "https://10.0.0.2/b"),
+    ]
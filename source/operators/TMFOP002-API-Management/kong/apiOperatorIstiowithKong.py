@@ -16,9 +16,11 @@ import kopf
 import kubernetes.client
 import logging
 import json
+import hashlib
 from kubernetes.client.rest import ApiException
 import os
 import re
+import asyncio
 
 # Setup logging
 logging_level = os.environ.get("LOGGING", logging.INFO)
@@ -53,6 +55,16 @@ VIRTUAL_SERVICE_GROUP = "networking.istio.io"
 VIRTUAL_SERVICE_VERSION = "v1alpha3"
 VIRTUAL_SERVICE_PLURAL = "virtualservices"
 
+SERVICE_MONITOR_GROUP = "monitoring.coreos.com"
+SERVICE_MONITOR_VERSION = "v1"
+SERVICE_MONITOR_PLURAL = "servicemonitors"
+SERVICE_MONITOR_KIND = "ServiceMonitor"
+
+# The VirtualServices and ServiceMonitors carry a hash of their desired state in this annotation,
+# they are only written when the hash differs from the live object (kept by the *_desired_state indexes).
+DESIRED_STATE_ANNOTATION = "oda.tmforum.org/desired-state-hash"
+desired_state_metrics = {"writes": 0, "skipped": 0}
+
 # get environment variables
 OPENMETRICS_IMPLEMENTATION = os.environ.get(
     "OPENMETRICS_IMPLEMENTATION", "ServiceMonitor"
@@ -81,11 +93,34 @@ if APIOPERATORISTIO_PUBLICHOSTNAME:
             "ingress": [{"hostname": APIOPERATORISTIO_PUBLICHOSTNAME}]
         }
 
+# EndpointSlice events for the same service are merged over this window (seconds), the API resources are only
+# updated when the ready state of the service implementation flips.
+IMPLEMENTATION_STATUS_DEBOUNCE = float(
+    os.environ.get("IMPLEMENTATION_STATUS_DEBOUNCE", "1")
+)
+implementation_ready = {}  # (namespace, service name) -> last applied ready state
+pending_implementation_status = {}  # (namespace, service name) -> queued endpoints
+implementation_status_metrics = {"events": 0, "merged": 0, "applied": 0, "unchanged": 0}
+
+
+# EndpointSlices inherit the labels of their Service, only the slices of ODA Component services are watched.
+# kopf evaluates the labels filter of a handler in the operator, only settings.watching.label_selectors
+# (newer kopf) filters on the API server.
+ENDPOINTSLICE_SELECTOR = "oda.tmforum.org/componentName"
+ENDPOINTSLICE_WATCH_SELECTOR_SUPPORTED = hasattr(
+    kopf.OperatorSettings().watching, "label_selectors"
+)
+
 
 # try to recover from broken watchers https://github.com/nolar/kopf/issues/1036
 @kopf.on.startup()
 def configure(settings: kopf.OperatorSettings, **_):
     settings.watching.server_timeout = 1 * 60
+    if ENDPOINTSLICE_WATCH_SELECTOR_SUPPORTED:
+        # the API server only sends the EndpointSlices of component services
+        settings.watching.label_selectors[
+            "discovery.k8s.io", "v1", "endpointslices"
+        ] = ENDPOINTSLICE_SELECTOR
 
 
 # ------ HELPER METHODS ------ #
@@ -199,10 +234,22 @@ def apiStatus(meta, spec, status, namespace, labels, name, **kwargs):
                             "Prometheus Service Monitor",
                         )
                         createOrPatchObservability(
-                            True, spec, namespace, name, "apiStatus", componentName
+                            True,
+                            spec,
+                            namespace,
+                            name,
+                            "apiStatus",
+                            componentName,
+                            kwargs.get("servicemonitor_desired_state"),
                         )
                 return createOrPatchVirtualService(
-                    True, spec, namespace, name, "apiStatus", componentName
+                    True,
+                    spec,
+                    namespace,
+                    name,
+                    "apiStatus",
+                    componentName,
+                    kwargs.get("virtualservice_desired_state"),
                 )
 
     # if we get here then we are creating a new API
@@ -229,14 +276,28 @@ def apiStatus(meta, spec, status, namespace, labels, name, **kwargs):
                 "Prometheus Service Monitor",
             )
             createOrPatchObservability(
-                False, spec, namespace, name, "apiStatus", componentName
+                False,
+                spec,
+                namespace,
+                name,
+                "apiStatus",
+                componentName,
+                kwargs.get("servicemonitor_desired_state"),
             )
     return createOrPatchVirtualService(
-        False, spec, namespace, name, "apiStatus", componentName
+        False,
+        spec,
+        namespace,
+        name,
+        "apiStatus",
+        componentName,
+        kwargs.get("virtualservice_desired_state"),
     )
 
 
-def createOrPatchObservability(patch, spec, namespace, name, inHandler, componentName):
+def createOrPatchObservability(
+    patch, spec, namespace, name, inHandler, componentName, sm_index=None
+):
     """Helper function to switch between the different patterns for scraping Prometheus APIs.
 
     Args:
@@ -246,13 +307,14 @@ def createOrPatchObservability(patch, spec, namespace, name, inHandler, componen
         * name (String): The name of the API Custom Resource
         * inHandler (String): The name of the handler function calling this function
         * componentName (String): The name of the ODA Component that the API is part of
+        * sm_index (kopf.Index): optional `servicemonitor_desired_state` index used by the ServiceMonitor pattern
 
     Returns:
         nothing
     """
     if OPENMETRICS_IMPLEMENTATION == "ServiceMonitor":
         createOrPatchServiceMonitor(
-            patch, spec, namespace, name, inHandler, componentName
+            patch, spec, namespace, name, inHandler, componentName, sm_index
         )
     elif OPENMETRICS_IMPLEMENTATION == "PrometheusAnnotation":
         createOrPatchPrometheusAnnotation(
@@ -562,7 +624,76 @@ def createOrPatchDataDogAnnotation(
         raise kopf.TemporaryError("Exception in createOrPatchDataDogAnnotation.")
 
 
-def createOrPatchServiceMonitor(patch, spec, namespace, name, inHandler, componentName):
+def desired_state_hash(manifest):
+    """
+    Returns a hash over the desired state of a manifest (everything except metadata.annotations and metadata.resourceVersion).
+    """
+    desired_state = dict(manifest)
+    desired_state["metadata"] = {
+        key: value
+        for key, value in manifest["metadata"].items()
+        if key not in ("annotations", "resourceVersion")
+    }
+    return hashlib.sha256(
+        json.dumps(desired_state, sort_keys=True).encode()
+    ).hexdigest()
+
+
+def set_desired_state_hash(manifest):
+    """
+    Adds the desired state hash annotation to a manifest and returns the hash.
+    """
+    state_hash = desired_state_hash(manifest)
+    manifest["metadata"].setdefault("annotations", {})[
+        DESIRED_STATE_ANNOTATION
+    ] = state_hash
+    return state_hash
+
+
+def live_desired_state(state_index, namespace, name):
+    """
+    Returns (desired state hash, uid) of the live resource from a *_desired_state index, (None, None) if it is not known.
+    """
+    if state_index is None:
+        return None, None
+    for live in state_index.get((namespace, name), []):
+        return live
+    return None, None
+
+
+@kopf.index(VIRTUAL_SERVICE_GROUP, VIRTUAL_SERVICE_VERSION, VIRTUAL_SERVICE_PLURAL)
+def virtualservice_desired_state(namespace, name, annotations, uid, **kwargs):
+    """Indexing function for the desired state hash of VirtualService resources.
+
+    Returns:
+        Dict: {(namespace, name): (desired state hash, uid)}
+
+    :meta private:
+    """
+    return {(namespace, name): (annotations.get(DESIRED_STATE_ANNOTATION), uid)}
+
+
+def servicemonitor_desired_state(namespace, name, annotations, uid, **kwargs):
+    """Indexing function for the desired state hash of ServiceMonitor resources.
+
+    Returns:
+        Dict: {(namespace, name): (desired state hash, uid)}
+
+    :meta private:
+    """
+    return {(namespace, name): (annotations.get(DESIRED_STATE_ANNOTATION), uid)}
+
+
+# ServiceMonitors are only watched when they are used (the CRD is not installed otherwise)
+if OPENMETRICS_IMPLEMENTATION == "ServiceMonitor":
+    kopf.index(SERVICE_MONITOR_GROUP, SERVICE_MONITOR_VERSION, SERVICE_MONITOR_PLURAL)(
+        servicemonitor_desired_state
+    )
+
+
+def createOrPatchServiceMonitor(
+    patch, spec, namespace, name, inHandler, componentName, state_index=None
+):
     """Helper function to get API details for a prometheus metrics API and create or patch ServiceMonitor resource.
 
     Args:
@@ -572,6 +703,7 @@ def createOrPatchServiceMonitor(patch, spec, namespace, name, inHandler, compone
         * name (String): The name of the API Custom Resource
         * inHandler (String): The name of the handler function calling this function
         * componentName (String): The name of the ODA Component that the API is part of
+        * state_index (kopf.Index): Optional `servicemonitor_desired_state` index. If the live ServiceMonitor has the same desired state it is not written.
 
     Returns:
         nothing
@@ -585,11 +717,6 @@ def createOrPatchServiceMonitor(patch, spec, namespace, name, inHandler, compone
         if "hostname" in spec.keys():
             hostname = spec["hostname"]
 
-        SERVICE_MONITOR_GROUP = "monitoring.coreos.com"
-        SERVICE_MONITOR_VERSION = "v1"
-        SERVICE_MONITOR_PLURAL = "servicemonitors"
-        SERVICE_MONITOR_KIND = "ServiceMonitor"
-
         # FIX required to optionally add hostname instead of ["*"]
         body = {
             "apiVersion": SERVICE_MONITOR_GROUP + "/" + SERVICE_MONITOR_VERSION,
@@ -623,6 +750,23 @@ def createOrPatchServiceMonitor(patch, spec, namespace, name, inHandler, compone
             body,
         )
 
+        state_hash = set_desired_state_hash(body)
+        live_hash, live_uid = live_desired_state(state_index, namespace, name)
+        if live_hash == state_hash:
+            desired_state_metrics["skipped"] += 1
+            logWrapper(
+                logging.INFO,
+                "createOrPatchServiceMonitor",
+                inHandler,
+                "api/" + name,
+                componentName,
+                "Service Monitor unchanged",
+                name,
+            )
+            return
+        desired_state_metrics["writes"] += 1
+        logger.debug(f"Desired state write metrics: {desired_state_metrics}")
+
         if patch == True:
             # patch the resource
             serviceMonitorResource = custom_objects_api.patch_namespaced_custom_object(
@@ -761,7 +905,7 @@ def check_vs_conflict(vs_namespace, vs_name, gateway, hostname, path):
 
 
 def createOrPatchVirtualService(
-    patch, spec, namespace, inAPIName, inHandler, componentName
+    patch, spec, namespace, inAPIName, inHandler, componentName, state_index=None
 ):
     """Helper function to get API details and create or patch VirtualService.
 
@@ -772,6 +916,7 @@ def createOrPatchVirtualService(
         * inAPIName (String): The name of the API Custom Resource
         * inHandler (String): The name of the handler calling this function
         * componentName (String): The name of the component that owns the API resource
+        * state_index (kopf.Index): Optional `virtualservice_desired_state` index. If the live VirtualService has the same desired state it is not written.
 
     Returns:
         Dict: The updated apiStatus that will be put into the status field of the API resource.
@@ -827,7 +972,22 @@ def createOrPatchVirtualService(
             body,
         )
 
-        if patch == True:
+        state_hash = set_desired_state_hash(body)
+        live_hash, live_uid = live_desired_state(state_index, namespace, inAPIName)
+        if live_hash == state_hash:
+            # the live VirtualService is already in the desired state, only the apiStatus is rebuilt
+            desired_state_metrics["skipped"] += 1
+            virtualServiceResource = {"metadata": {"uid": live_uid}}
+            logWrapper(
+                logging.INFO,
+                "createOrPatchVirtualService",
+                inHandler,
+                "api/" + inAPIName,
+                componentName,
+                "Virtual Service unchanged",
+                inAPIName,
+            )
+        elif patch == True:
             # patch the resource
             virtualServiceResource = custom_objects_api.patch_namespaced_custom_object(
                 VIRTUAL_SERVICE_GROUP,
@@ -837,6 +997,7 @@ def createOrPatchVirtualService(
                 inAPIName,
                 body,
             )
+            desired_state_metrics["writes"] += 1
             logWrapper(
                 logging.DEBUG,
                 "createOrPatchVirtualService",
@@ -855,49 +1016,6 @@ def createOrPatchVirtualService(
                 "Virtual Service patched",
                 inAPIName,
             )
-            updateImplementationStatus(
-                namespace, spec["implementation"], inHandler, componentName
-            )
-            # update parent apiStatus
-            istioStatus = getKongIngressStatus(
-                inHandler, "api/" + inAPIName, componentName
-            )
-            loadBalancer = istioStatus["loadBalancer"]
-            ports = istioStatus["ports"]
-            apistatus = {
-                "apiStatus": {
-                    "name": inAPIName,
-                    "uid": virtualServiceResource["metadata"]["uid"],
-                    "path": spec["path"],
-                    "port": spec["port"],
-                    "implementation": spec["implementation"],
-                }
-            }
-            if "ingress" in loadBalancer.keys():
-                ingress = loadBalancer["ingress"]
-                if isinstance(ingress, list):
-                    if len(ingress) > 0:
-                        ingressTarget = ingress[0]
-                        apistatus = buildAPIStatus(
-                            spec,
-                            apistatus,
-                            ingressTarget,
-                            ports,
-                            inAPIName,
-                            inHandler,
-                            componentName,
-                        )
-                        logWrapper(
-                            logging.DEBUG,
-                            "createOrPatchVirtualService",
-                            inHandler,
-                            "api/" + inAPIName,
-                            componentName,
-                            "apiStatus",
-                            apistatus,
-                        )
-
-            return apistatus["apiStatus"]
         else:
             # create the resource
             virtualServiceResource = custom_objects_api.create_namespaced_custom_object(
@@ -907,6 +1025,7 @@ def createOrPatchVirtualService(
                 VIRTUAL_SERVICE_PLURAL,
                 body,
             )
+            desired_state_metrics["writes"] += 1
             logWrapper(
                 logging.DEBUG,
                 "createOrPatchVirtualService",
@@ -925,48 +1044,47 @@ def createOrPatchVirtualService(
                 "Virtual Service created",
                 inAPIName,
             )
-            updateImplementationStatus(
-                namespace, spec["implementation"], inHandler, componentName
-            )
-            # update parent apiStatus
-            istioStatus = getKongIngressStatus(
-                inHandler, "api/" + inAPIName, componentName
-            )
-            loadBalancer = istioStatus["loadBalancer"]
-            ports = istioStatus["ports"]
-            apistatus = {
-                "apiStatus": {
-                    "name": inAPIName,
-                    "uid": virtualServiceResource["metadata"]["uid"],
-                    "path": spec["path"],
-                    "port": spec["port"],
-                    "implementation": spec["implementation"],
-                }
+        updateImplementationStatus(
+            namespace, spec["implementation"], inHandler, componentName
+        )
+        logger.debug(f"Desired state write metrics: {desired_state_metrics}")
+        # update parent apiStatus
+        istioStatus = getKongIngressStatus(inHandler, "api/" + inAPIName, componentName)
+        loadBalancer = istioStatus["loadBalancer"]
+        ports = istioStatus["ports"]
+        apistatus = {
+            "apiStatus": {
+                "name": inAPIName,
+                "uid": virtualServiceResource["metadata"]["uid"],
+                "path": spec["path"],
+                "port": spec["port"],
+                "implementation": spec["implementation"],
             }
-            if "ingress" in loadBalancer.keys():
-                ingress = loadBalancer["ingress"]
-                if isinstance(ingress, list):
-                    if len(ingress) > 0:
-                        ingressTarget = ingress[0]
-                        apistatus = buildAPIStatus(
-                            spec,
-                            apistatus,
-                            ingressTarget,
-                            ports,
-                            inAPIName,
-                            inHandler,
-                            componentName,
-                        )
-                        logWrapper(
-                            logging.DEBUG,
-                            "createOrPatchVirtualService",
-                            inHandler,
-                            "api/" + inAPIName,
-                            componentName,
-                            "apiStatus",
-                            apistatus,
-                        )
-            return apistatus["apiStatus"]
+        }
+        if "ingress" in loadBalancer.keys():
+            ingress = loadBalancer["ingress"]
+            if isinstance(ingress, list):
+                if len(ingress) > 0:
+                    ingressTarget = ingress[0]
+                    apistatus = buildAPIStatus(
+                        spec,
+                        apistatus,
+                        ingressTarget,
+                        ports,
+                        inAPIName,
+                        inHandler,
+                        componentName,
+                    )
+                    logWrapper(
+                        logging.DEBUG,
+                        "createOrPatchVirtualService",
+                        inHandler,
+                        "api/" + inAPIName,
+                        componentName,
+                        "apiStatus",
+                        apistatus,
+                    )
+        return apistatus["apiStatus"]
     except ApiException as e:
         logWrapper(
             logging.DEBUG,
@@ -1219,13 +1337,29 @@ def buildAPIStatus(
 
 
 # When service where implementation is ready, update parent API object
-@kopf.on.create("discovery.k8s.io", "v1", "endpointslice", retries=5)
-@kopf.on.update("discovery.k8s.io", "v1", "endpointslice", retries=5)
-def implementation_status(meta, spec, status, body, namespace, labels, name, **kwargs):
+# EndpointSlices inherit the labels of their Service, only the slices of ODA Component services are handled
+@kopf.on.create(
+    "discovery.k8s.io",
+    "v1",
+    "endpointslice",
+    labels={"oda.tmforum.org/componentName": kopf.PRESENT},
+    retries=5,
+)
+@kopf.on.update(
+    "discovery.k8s.io",
+    "v1",
+    "endpointslice",
+    labels={"oda.tmforum.org/componentName": kopf.PRESENT},
+    retries=5,
+)
+async def implementation_status(
+    meta, spec, status, body, namespace, labels, name, **kwargs
+):
     """Handler function to register for status changes in EndPointSlide resources.
 
     The EndPointSlide resources show the implementation of an API linked the the API implementations Service Resource.
     When EndPointSlide updates the ready-status of the implementation, update parent API object.
+    Events for the same service are debounced, see `queueImplementationStatus`.
 
     Args:
         * meta (Dict): The metadata from the EndPointSlide Resource
@@ -1243,11 +1377,10 @@ def implementation_status(meta, spec, status, body, namespace, labels, name, **k
     """
     try:
         componentName = labels["oda.tmforum.org/componentName"]
-        createAPIImplementationStatus(
-            meta["ownerReferences"][0]["name"],
-            body["endpoints"],
+        await queueImplementationStatus(
             namespace,
-            "implementation_status",
+            meta["ownerReferences"][0]["name"],
+            body.get("endpoints"),
             componentName,
         )
     except Exception as e:
@@ -1263,6 +1396,91 @@ def implementation_status(meta, spec, status, body, namespace, labels, name, **k
         raise kopf.TemporaryError("Exception handling implementation_status.")
 
 
+def endpointsReady(endpointsArray):
+    """Helper function to check if any endpoint of an EndpointSlice is ready.
+
+    Args:
+        * endpointsArray (Array): The endpoints of the EndpointSlice, as objects or dictionaries
+
+    Returns:
+        Boolean: True if at least one endpoint is ready.
+
+    :meta private:
+    """
+    for endpoint in endpointsArray or []:
+        # endpoint could be an object or a dictionary
+        if isinstance(endpoint, dict):
+            ready = safe_get(None, endpoint, "conditions", "ready")
+        else:
+            ready = endpoint.conditions.ready
+        if ready == True:
+            return True
+    return False
+
+
+async def queueImplementationStatus(
+    namespace, serviceName, endpointsArray, componentName
+):
+    """Helper function to queue the implementation ready state of a service.
+
+    Events for the same service that arrive within IMPLEMENTATION_STATUS_DEBOUNCE seconds are merged, only the last
+    one is applied. The caller waits until it is applied, so that errors are raised in the calling handler and kopf
+    can retry it.
+
+    Args:
+        * namespace (String): The namespace for the Kubernetes Service that implements the API
+        * serviceName (String): The name of the Kubernetes Service that implements the API
+        * endpointsArray (Array): The endpoints of the EndpointSlice
+        * componentName (String): The name of the ODA Component that the API resource is owned by
+
+    Returns:
+        No return value.
+
+    :meta private:
+    """
+    key = (namespace, serviceName)
+    implementation_status_metrics["events"] += 1
+    batch = pending_implementation_status.get(key)
+    if batch is None:
+        batch = {"done": asyncio.get_running_loop().create_future()}
+        pending_implementation_status[key] = batch
+        asyncio.create_task(flushImplementationStatus(key))
+    else:
+        implementation_status_metrics["merged"] += 1
+    batch["endpoints"] = endpointsArray
+    batch["componentName"] = componentName
+    await asyncio.shield(batch["done"])
+
+
+async def flushImplementationStatus(key):
+    """Helper function to apply the queued ready state of a service after the debounce window, if it flipped.
+
+    :meta private:
+    """
+    await asyncio.sleep(IMPLEMENTATION_STATUS_DEBOUNCE)
+    batch = pending_implementation_status.pop(key)
+    namespace, serviceName = key
+    ready = endpointsReady(batch["endpoints"])
+    try:
+        if implementation_ready.get(key) == ready:
+            implementation_status_metrics["unchanged"] += 1
+        else:
+            await asyncio.to_thread(
+                createAPIImplementationStatus,
+                serviceName,
+                batch["endpoints"],
+                namespace,
+                "implementation_status",
+                batch["componentName"],
+            )
+            implementation_ready[key] = ready
+            implementation_status_metrics["applied"] += 1
+        logger.debug(f"implementation status metrics {implementation_status_metrics}")
+        batch["done"].set_result(None)
+    except Exception as e:
+        batch["done"].set_exception(e)
+
+
 def createAPIImplementationStatus(
     serviceName, endpointsArray, namespace, inHandler, componentName
 ):
@@ -1280,58 +1498,51 @@ def createAPIImplementationStatus(
 
     :meta private:
     """
-    anyEndpointReady = False
-    if endpointsArray != None:
-        for endpoint in endpointsArray:
-            # endpoint could be an object or a dictionary
-            ready = False
-            if isinstance(endpoint, dict):
-                ready = endpoint["conditions"]["ready"]
-            else:
-                ready = endpoint.conditions.ready
-            if ready == True:
-                anyEndpointReady = True
-                # find the corresponding API resource and update status
-                # query for api with spec.implementation equal to service name
-                api_instance = kubernetes.client.CustomObjectsApi()
-                api_response = api_instance.list_namespaced_custom_object(
-                    GROUP, VERSION, namespace, APIS_PLURAL
+    anyEndpointReady = endpointsReady(endpointsArray)
+    if anyEndpointReady:
+        # find the corresponding API resource and update status
+        # query for api with spec.implementation equal to service name
+        api_instance = kubernetes.client.CustomObjectsApi()
+        api_response = api_instance.list_namespaced_custom_object(
+            GROUP, VERSION, namespace, APIS_PLURAL
+        )
+        found = False
+        for api in api_response["items"]:
+            if api["spec"]["implementation"] == serviceName:
+                found = True
+                if safe_get(None, api, "status", "implementation", "ready"):
+                    continue  # already ready, nothing to patch
+                if not ("status" in api.keys()):
+                    api["status"] = {}
+                api["status"]["implementation"] = {"ready": True}
+                api_response = api_instance.patch_namespaced_custom_object(
+                    GROUP,
+                    VERSION,
+                    namespace,
+                    APIS_PLURAL,
+                    api["metadata"]["name"],
+                    api,
+                )
+                logWrapper(
+                    logging.INFO,
+                    "createAPIImplementationStatus",
+                    inHandler,
+                    "endpointslice/" + api["metadata"]["name"],
+                    componentName,
+                    "Added implementation ready status",
+                    anyEndpointReady,
                 )
-                found = False
-                for api in api_response["items"]:
-                    if api["spec"]["implementation"] == serviceName:
-                        found = True
-                        if not ("status" in api.keys()):
-                            api["status"] = {}
-                        api["status"]["implementation"] = {"ready": True}
-                        api_response = api_instance.patch_namespaced_custom_object(
-                            GROUP,
-                            VERSION,
-                            namespace,
-                            APIS_PLURAL,
-                            api["metadata"]["name"],
-                            api,
-                        )
-                        logWrapper(
-                            logging.INFO,
-                            "createAPIImplementationStatus",
-                            inHandler,
-                            "endpointslice/" + api["metadata"]["name"],
-                            componentName,
-                            "Added implementation ready status",
-                            anyEndpointReady,
-                        )
 
-                if found == False:
-                    logWrapper(
-                        logging.INFO,
-                        "createAPIImplementationStatus",
-                        inHandler,
-                        "service/" + serviceName,
-                        componentName,
-                        "Can't find API resource",
-                        serviceName,
-                    )
+        if found == False:
+            logWrapper(
+                logging.INFO,
+                "createAPIImplementationStatus",
+                inHandler,
+                "service/" + serviceName,
+                componentName,
+                "Can't find API resource",
+                serviceName,
+            )
 
 
 # When api adds url address of where api is exposed, update parent Component object
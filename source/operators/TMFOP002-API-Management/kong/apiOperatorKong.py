@@ -22,6 +22,10 @@ from kubernetes.client.rest import ApiException
 import os
 import yaml
 import requests
+import collections
+import copy
+import hashlib
+import threading
 
 logging_level = os.environ.get("LOGGING", logging.INFO)
 print("Logging set to ", logging_level)
@@ -751,50 +755,102 @@ def annotate_istio_ingress_timeouts():
         )
 
 
-def check_url(url):
-    """
-    Checks the accessibility of a URL to ensure it is reachable.
-    This function sends a HEAD request to the URL to verify if the URL is accessible without downloading the content.
-    It logs an error if the URL is not reachable or returns an unsuccessful status code.
+# Plugin templates are cached by URL and revalidated with conditional GETs (ETag / Last-Modified),
+# at most TEMPLATE_CACHE_SIZE templates are kept (least recently used are dropped first).
+TEMPLATE_CACHE_SIZE = int(os.getenv("TEMPLATE_CACHE_SIZE", "64"))
+TEMPLATE_REQUEST_TIMEOUT = float(os.getenv("TEMPLATE_REQUEST_TIMEOUT", "30"))
 
-    Parameters:
-        url (str): The URL to check for its accessibility.
+template_session = requests.Session()
+template_cache = (
+    collections.OrderedDict()
+)  # url -> (etag, last_modified, digest, documents)
+template_cache_lock = threading.Lock()
+template_url_locks = {}
+template_metrics = {"downloads": 0, "not_modified": 0, "parses": 0, "errors": 0}
+
+
+def template_url_lock(url):
+    """Returns the lock serialising the downloads of one template URL."""
+    with template_cache_lock:
+        return template_url_locks.setdefault(url, threading.Lock())
 
-    Returns:
-        bool: True for accessible URL else its False
-    """
-    try:
-        response = requests.head(url)
-        response.raise_for_status()  # Raising HTTPError if the HTTP request returned an unsuccessful
-        return True
-    except requests.RequestException as e:
-        logger.error(f"Failed to reach the given URL in CR template: {url}. Error: {e}")
-        return False
+
+def store_template(url, entry):
+    """Stores a template in the cache and drops the least recently used ones above TEMPLATE_CACHE_SIZE."""
+    with template_cache_lock:
+        template_cache[url] = entry
+        template_cache.move_to_end(url)
+        while len(template_cache) > TEMPLATE_CACHE_SIZE:
+            evicted_url, _ = template_cache.popitem(last=False)
+            template_url_locks.pop(evicted_url, None)
 
 
 def download_template(url):
     """
     Downloads and parses a YAML template from a given URL.
     This function attempts to fetch content from a specified URL expecting it to be a YAML format. It parses the content
-    into a list of documents. Using 'no-cache' headers to make sure fresh content is fetched always.
+    into a list of documents. Templates are cached by URL: a cached template is revalidated with a conditional GET
+    (If-None-Match / If-Modified-Since), so unchanged templates are neither downloaded nor parsed again.
 
     Parameters:
         url (str): The URL from which to download the YAML template.
 
     Returns:
         list or None: A list of YAML documents or None if the download fails or content is invalid.
+            The documents are a copy, the caller may modify them.
     """
-    try:
-        headers = {"Cache-Control": "no-cache", "Pragma": "no-cache"}
-        response = requests.get(url, headers=headers)
-        response.raise_for_status()
-        documents = yaml.safe_load_all(
-            response.text
-        )  # safe_load to handle one yaml and safe_load_all to handle multiple YAML documents
-        return list(documents)
-    except requests.RequestException as e:
-        logger.error(f"Failed to download URL in CR template: {url}. Error: {e}")
-        return None
+    with template_url_lock(url):
+        with template_cache_lock:
+            cached = template_cache.get(url)
+        headers = {}
+        if cached:
+            etag, last_modified, _, _ = cached
+            if etag:
+                headers["If-None-Match"] = etag
+            if last_modified:
+                headers["If-Modified-Since"] = last_modified
+        if not headers:
+            headers = {"Cache-Control": "no-cache", "Pragma": "no-cache"}
+        try:
+            response = template_session.get(
+                url, headers=headers, timeout=TEMPLATE_REQUEST_TIMEOUT
+            )
+            response.raise_for_status()
+        except requests.RequestException as e:
+            template_metrics["errors"] += 1
+            logger.error(f"Failed to download URL in CR template: {url}. Error: {e}")
+            return None
+
+        if cached and response.status_code == 304:
+            template_metrics["not_modified"] += 1
+            store_template(url, cached)
+            documents = cached[3]
+        else:
+            template_metrics["downloads"] += 1
+            digest = hashlib.sha256(response.content).hexdigest()
+            if cached and cached[2] == digest:
+                documents = cached[3]
+            else:
+                template_metrics["parses"] += 1
+                try:
+                    documents = list(
+                        yaml.safe_load_all(response.text)
+                    )  # safe_load to handle one yaml and safe_load_all to handle multiple YAML documents
+                except yaml.YAMLError as e:
+                    template_metrics["errors"] += 1
+                    logger.error(f"Invalid YAML in CR template: {url}. Error: {e}")
+                    return None
+            store_template(
+                url,
+                (
+                    response.headers.get("ETag"),
+                    response.headers.get("Last-Modified"),
+                    digest,
+                    documents,
+                ),
+            )
+    logger.debug(f"Template cache metrics: {template_metrics}")
+    return copy.deepcopy(documents)
 
 
 def apply_plugins_from_template(templates, namespace, owner_references):
@@ -885,8 +941,9 @@ def manage_plugins_from_url(spec, name, namespace, meta):
     # Manages downloading and applying plugins from a URL specified
     plugin_names = []
     template_url = spec.get("template")
-    if check_url(template_url):
-        templates = download_template(template_url)
+    # the (conditional) GET of download_template also checks that the URL is reachable
+    templates = download_template(template_url) if template_url else None
+    if templates is not None:
         if templates:
             # Prepare owner references for adoption
             owner_references = [
@@ -904,9 +961,9 @@ def manage_plugins_from_url(spec, name, namespace, meta):
             )
             logger.info(f"Plugins applied from URL and their name are: {plugin_names}")
         else:
-            logger.info("Template download failed or it was empty.")
+            logger.info("Template was empty.")
     else:
-        logger.info("Template URL is not reachable.")
+        logger.info("Template URL is not reachable or download failed.")
     return plugin_names
 
 
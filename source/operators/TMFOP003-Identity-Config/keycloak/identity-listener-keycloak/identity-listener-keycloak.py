@@ -8,10 +8,16 @@ from flask import Flask
 from flask import request
 import logging
 import os
+import queue
+import threading
+import time
 import uuid
 import datetime
+import itertools
+import zlib
+from collections import namedtuple
 
-from keycloakUtils import Keycloak
+from keycloakUtils import ClientNotFoundError, Keycloak
 
 from cloudevents.http import CloudEvent, to_structured
 
@@ -59,7 +65,43 @@ PERMISSION_SPEC_SET_CREATION = "PermissionSpecificationSetCreationNotification"
 PERMISSION_SPEC_SET_UPDATE = "PermissionSpecificationSetAttributeValueChangeNotification"
 PERMISSION_SPEC_SET_DELETION = "PermissionSpecificationSetRemoveNotification"
 
-kc = Keycloak(kcBaseURL)
+# Events are acknowledged at once and processed by EVENT_WORKERS worker threads.
+# All events of one component go to the same worker, so they are applied in order.
+EVENT_WORKERS = int(os.environ.get("EVENT_WORKERS", 4))
+EVENT_QUEUE_SIZE = int(os.environ.get("EVENT_QUEUE_SIZE", 10000))
+EVENT_BATCH_SIZE = int(os.environ.get("EVENT_BATCH_SIZE", 200))
+EVENT_BATCH_WAIT = float(os.environ.get("EVENT_BATCH_WAIT", 0.2))
+# Events that fail (e.g. Keycloak not reachable) are queued again after EVENT_RETRY_DELAY
+# seconds, doubled on each attempt, and dropped after EVENT_RETRIES attempts.
+EVENT_RETRIES = int(os.environ.get("EVENT_RETRIES", 5))
+EVENT_RETRY_DELAY = float(os.environ.get("EVENT_RETRY_DELAY", 1))
+
+kc = Keycloak(kcBaseURL, pool_maxsize=EVENT_WORKERS)
+
+# seq orders the changes of a role, attempt counts the failed attempts to apply the change
+RoleChange = namedtuple(
+    "RoleChange",
+    ["source", "component", "role", "event_type", "description", "seq", "attempt"],
+    defaults=(None, 0),
+)
+role_change_seq = itertools.count()
+# (component, role) -> [seq of the last queued change, number of queued or retried changes],
+# an entry is removed when the last of its changes is applied or dropped
+queued_role_changes = {}
+role_change_lock = threading.Lock()
+
+event_queues = [
+    queue.Queue(maxsize=max(1, EVENT_QUEUE_SIZE // EVENT_WORKERS))
+    for _ in range(EVENT_WORKERS)
+]
+event_metrics = {
+    "queued": 0,
+    "rejected": 0,
+    "batches": 0,
+    "coalesced": 0,
+    "retried": 0,
+    "dropped": 0,
+}
 
 # Flask app --------------------------------------------------------------
 
@@ -97,14 +139,14 @@ def event_listener():
     
     # Check if this is a partyRole event
     if "partyRole" in doc.get("event", {}):
-        result = handle_party_role_event(doc)
-        logger.info("=== NOTIFICATION PROCESSING COMPLETE (partyRole) ===")
-        return result
+        accepted = enqueue_role_change(party_role_change(doc))
+        logger.info("=== NOTIFICATION QUEUED (partyRole) ===")
+        return "" if accepted else ("", 503)
     # Check if this is a permissionSpecificationSet event
     elif "permissionSpecificationSet" in doc.get("event", {}):
-        handle_permission_spec_set_event(doc)
-        logger.info("=== NOTIFICATION PROCESSING COMPLETE (permissionSpecificationSet) ===")
-        return ""
+        accepted = enqueue_role_change(permission_spec_set_change(doc))
+        logger.info("=== NOTIFICATION QUEUED (permissionSpecificationSet) ===")
+        return "" if accepted else ("", 503)
     else:
         logger.warning(
             format_cloud_event(
@@ -116,197 +158,332 @@ def event_listener():
         return ""
 
 
-def handle_party_role_event(doc):
+def party_role_change(doc):
     """
-    Handle party role events and create/update/delete roles in Keycloak
+    Returns the RoleChange of a partyRole event, or None if there is nothing to do
     """
-    client = ""
     party_role = doc["event"]["partyRole"]
     logger.debug("partyRole = %s", party_role)
-    if party_role["@baseType"] == "PartyRole":
-        event_type = doc["eventType"]
-        logger.debug("security-APIListener called with eventType %s", event_type)
-        component = party_role["href"].split("/")[3]
+    if party_role["@baseType"] != "PartyRole":
+        logger.warning(
+            format_cloud_event(
+                f'@baseType was {party_role["@baseType"]} - not processed',
+                "security-APIListener called with invalid @baseType",
+            )
+        )
+        return None
+    event_type = doc["eventType"]
+    logger.debug("security-APIListener called with eventType %s", event_type)
+    if event_type == PARTY_ROLE_UPDATE:
+        logger.debug("Update Keycloak for UPDATE")
+        return None  # because we do not need to do anything for updates
+    if event_type not in (PARTY_ROLE_CREATION, PARTY_ROLE_DELETION):
+        logger.warning(
+            format_cloud_event(
+                f"eventType was {event_type} - not processed",
+                "security-APIListener called with invalid eventType",
+            )
+        )
+        return None
+    component = party_role["href"].split("/")[3]
+    return RoleChange("", component, party_role["name"], event_type, None)
+
+
+def permission_spec_set_change(doc):
+    """
+    Returns the RoleChange of a permissionSpecificationSet event, or None if there is nothing to do
+    """
+    logger.debug("security-APIListener received permissionSpecificationSet event %s", doc)
+    permission_spec_set = doc["event"]["permissionSpecificationSet"]
+    logger.debug("permissionSpecificationSet = %s", permission_spec_set)
+    if permission_spec_set["@baseType"] != "PermissionSpecificationSet":
+        logger.warning(
+            format_cloud_event(
+                f'@baseType was {permission_spec_set["@baseType"]} - not processed for permissionSpecificationSet',
+                "security-APIListener called with invalid @baseType for permissionSpecificationSet",
+            )
+        )
+        return None
+    event_type = doc["eventType"]
+    logger.debug("security-APIListener called with permissionSpecificationSet eventType %s", event_type)
+    if event_type == PERMISSION_SPEC_SET_UPDATE:
+        logger.debug("Update Keycloak for permissionSpecificationSet UPDATE")
+        return None  # because we do not need to do anything for updates
+    if event_type not in (PERMISSION_SPEC_SET_CREATION, PERMISSION_SPEC_SET_DELETION):
+        logger.warning(
+            format_cloud_event(
+                f"eventType was {event_type} - not processed for permissionSpecificationSet",
+                "security-APIListener called with invalid eventType for permissionSpecificationSet",
+            )
+        )
+        return None
+    component = permission_spec_set["href"].split("/")[1]
+    return RoleChange(
+        " permissionSpecificationSet",
+        component,
+        permission_spec_set["name"],
+        event_type,
+        permission_spec_set.get("description"),
+    )
+
+
+def enqueue_role_change(change):
+    """
+    Queues a RoleChange for the worker of its component.
+    Returns False if the queue is full, so that the sender retries later
+    """
+    if change is None:
+        return True
+    key = (change.component, change.role)
+    events = event_queues[zlib.crc32(change.component.encode()) % EVENT_WORKERS]
+    # the seq is recorded before the change is queued, so a worker never sees a change newer than the record
+    with role_change_lock:
+        change = change._replace(seq=next(role_change_seq))
+        entry = queued_role_changes.setdefault(key, [None, 0])
+        previous_seq = entry[0]
+        entry[0] = change.seq
+        entry[1] += 1
+        try:
+            events.put_nowait(change)
+            queued = True
+        except queue.Full:
+            entry[0] = previous_seq
+            forget_role_change(change)
+            queued = False
+    if not queued:
+        event_metrics["rejected"] += 1
+        logger.warning(
+            format_cloud_event(
+                f"event queue full, {change.event_type} for {change.role} in {change.component} rejected",
+                "security-APIListener event queue full",
+            )
+        )
+        return False
+    event_metrics["queued"] += 1
+    return True
+
+
+def forget_role_change(change):
+    """
+    Counts a queued change as done (applied, superseded or dropped).
+    The caller holds role_change_lock
+    """
+    key = (change.component, change.role)
+    entry = queued_role_changes[key]
+    entry[1] -= 1
+    if entry[1] == 0:
+        del queued_role_changes[key]
+
+
+def finish_role_changes(changes):
+    """
+    Counts changes as done, see forget_role_change
+    """
+    with role_change_lock:
+        for change in changes:
+            forget_role_change(change)
+
+
+def retry_role_change(events, change):
+    """
+    Queues a failed RoleChange again after a backoff delay, or drops it after
+    EVENT_RETRIES attempts
+    """
+    change = change._replace(attempt=change.attempt + 1)
+    if change.attempt > EVENT_RETRIES:
+        drop_role_change(change, "retries exhausted")
+        return
+    event_metrics["retried"] += 1
+
+    def requeue():
+        try:
+            events.put_nowait(change)
+        except queue.Full:
+            drop_role_change(change, "event queue full")
+
+    timer = threading.Timer(EVENT_RETRY_DELAY * 2 ** (change.attempt - 1), requeue)
+    timer.daemon = True
+    timer.start()
+
+
+def drop_role_change(change, reason):
+    finish_role_changes([change])
+    event_metrics["dropped"] += 1
+    logger.error(
+        format_cloud_event(
+            f"{change.event_type} for {change.role} in {change.component} dropped after "
+            f"{change.attempt} attempts: {reason}",
+            f"security-APIListener{change.source} event dropped",
+        )
+    )
+
+
+def event_worker(events):
+    """
+    Takes batches of up to EVENT_BATCH_SIZE role changes from the queue (waiting
+    at most EVENT_BATCH_WAIT seconds for more) and applies them
+    """
+    while True:
+        batch = [events.get()]
+        deadline = time.monotonic() + EVENT_BATCH_WAIT
+        while len(batch) < EVENT_BATCH_SIZE:
+            try:
+                batch.append(events.get(timeout=max(0, deadline - time.monotonic())))
+            except queue.Empty:
+                break
+        try:
+            failed = apply_role_changes(batch)
+        except Exception:
+            logger.exception("security-APIListener failed to process %d events", len(batch))
+            failed = batch
+        try:
+            retried = {change.seq for change in failed}
+            finish_role_changes(
+                [change for change in batch if change.seq not in retried]
+            )
+            for change in failed:
+                retry_role_change(events, change)
+        finally:
+            for _ in batch:
+                events.task_done()
 
-        try:  # to authenticate and get a token
-            token = kc.get_token(username, password)
+
+def apply_role_changes(batch):
+    """
+    Applies a batch of role changes in Keycloak with one token and one client
+    list. Only the last change of each role is applied.
+    Returns the changes that failed, to be retried
+    """
+    changes = {}
+    with role_change_lock:
+        for change in batch:
+            key = (change.component, change.role)
+            if queued_role_changes[key][0] != change.seq:
+                continue  # a newer change of the role was queued (e.g. while this one was retried)
+            changes[key] = change
+    event_metrics["batches"] += 1
+    event_metrics["coalesced"] += len(batch) - len(changes)
+    logger.debug("applying %d role changes, metrics %s", len(changes), event_metrics)
+
+    try:  # to authenticate and get a token
+        token = kc.get_token(username, password)
+    except RuntimeError as e:
+        logger.error(
+            format_cloud_event(
+                str(e), "security-APIListener could not GET Keycloak token"
+            )
+        )
+        return list(changes.values())
+
+    components = {change.component for change in changes.values()}
+    if len(components) > 1:
+        try:  # to get the ids of all clients at once, they are cached by get_client_id
+            kc.get_client_list(token, kcRealm)
         except RuntimeError as e:
             logger.error(
                 format_cloud_event(
-                    str(e), "security-APIListener could not GET Keycloak token"
+                    str(e), f"security-APIListener could not GET clients for {kcRealm}"
                 )
             )
-            raise
-
-        try:  # to get the list of existing clients
-            client_list = kc.get_client_list(token, kcRealm)
+    clients = {}
+    for component in components:
+        try:  # to get the id of the component's client
+            clients[component] = kc.get_client_id(component, token, kcRealm)
         except RuntimeError as e:
             logger.error(
                 format_cloud_event(
                     str(e), f"security-APIListener could not GET clients for {kcRealm}"
                 )
             )
-        else:
-            client = client_list[component]
 
+    failed = []
+    for change in changes.values():
+        client = clients.get(change.component, "")
         if client != "":
-            if event_type == PARTY_ROLE_CREATION:
-                try:  # to add the role to the client in Keycloak
-                    kc.add_role(party_role["name"], client, token, kcRealm)
-                except RuntimeError as e:
-                    logger.error(
-                        format_cloud_event(
-                            f'Keycloak role create failed for {party_role["name"]} in {component}',
-                            "security-APIListener event listener error",
-                        )
-                    )
-                else:
-                    logger.info(
-                        format_cloud_event(
-                            f'Keycloak role {party_role["name"]} added to {component}',
-                            "security-APIListener event listener success",
-                        )
-                    )
-            elif event_type == PARTY_ROLE_DELETION:
-                try:  # to delete the role from the client in Keycloak
-                    kc.del_role(party_role["name"], client, token, kcRealm)
-                except RuntimeError:
-                    logger.error(
-                        format_cloud_event(
-                            f'Keycloak role delete failed for {party_role["name"]} in {component}',
-                            "security-APIListener event listener error",
-                        )
-                    )
-                else:
-                    logger.info(
-                        format_cloud_event(
-                            f'Keycloak role {party_role["name"]} removed from {component}',
-                            "security-APIListener event listener success",
-                        )
-                    )
-            elif event_type == PARTY_ROLE_UPDATE:
-                pass  # because we do not need to do anything for updates
-                logger.debug("Update Keycloak for UPDATE")
-            else:
-                logger.warning(
-                    format_cloud_event(
-                        f"eventType was {event_type} - not processed",
-                        "security-APIListener called with invalid eventType",
-                    )
-                )
+            if not apply_role_change(change, client, token):
+                failed.append(change)
         else:
+            failed.append(change)
             logger.error(
                 format_cloud_event(
-                    f'No client found in Keycloak for {party_role["name"]}',
-                    "security-APIListener called for non-existent client",
+                    f"No client found in Keycloak for {change.role}",
+                    "security-APIListener called for non-existent client"
+                    + (" (permissionSpecificationSet)" if change.source else ""),
                 )
             )
-    else:
-        logger.warning(
-            format_cloud_event(
-                f'@baseType was {party_role["@baseType"]} - not processed',
-                "security-APIListener called with invalid @baseType",
-            )
-        )
-
-    return ""
+    return failed
 
 
-def handle_permission_spec_set_event(doc):
+def with_current_client_id(call, component, client, token):
     """
-    Handle permission specification set events and create/update/delete roles in Keycloak
+    Runs call(client id). If Keycloak does not know the cached id, because the
+    client was deleted and created again, the id is looked up again and the call
+    is retried once
     """
-    client = ""
-    logger.debug("security-APIListener received permissionSpecificationSet event %s", doc)
-    permission_spec_set = doc["event"]["permissionSpecificationSet"]
-    logger.debug("permissionSpecificationSet = %s", permission_spec_set)
-    
-    if permission_spec_set["@baseType"] == "PermissionSpecificationSet":
-        event_type = doc["eventType"]
-        logger.debug("security-APIListener called with permissionSpecificationSet eventType %s", event_type)
-        component = permission_spec_set["href"].split("/")[1]
+    try:
+        call(client)
+    except ClientNotFoundError:
+        call(kc.get_client_id(component, token, kcRealm))
 
-        try:  # to authenticate and get a token
-            token = kc.get_token(username, password)
-        except RuntimeError as e:
-            logger.error(
-                format_cloud_event(
-                    str(e), "security-APIListener could not GET Keycloak token for permissionSpecificationSet"
-                )
-            )
-            raise
 
-        try:  # to get the list of existing clients
-            client_list = kc.get_client_list(token, kcRealm)
-        except RuntimeError as e:
+def apply_role_change(change, client, token):
+    """
+    Adds or deletes one role of a client in Keycloak.
+    Returns False if it failed
+    """
+    if change.event_type in (PARTY_ROLE_CREATION, PERMISSION_SPEC_SET_CREATION):
+        try:  # to add the role to the client in Keycloak
+            with_current_client_id(
+                lambda client_id: kc.add_role(
+                    change.role, client_id, token, kcRealm, change.description
+                ),
+                change.component,
+                client,
+                token,
+            )
+        except RuntimeError:
             logger.error(
                 format_cloud_event(
-                    str(e), f"security-APIListener could not GET clients for {kcRealm} (permissionSpecificationSet)"
+                    f"Keycloak role create failed for {change.role} in {change.component}",
+                    f"security-APIListener{change.source} event listener error",
                 )
             )
+            return False
         else:
-            client = client_list[component]
-
-        if client != "":
-            if event_type == PERMISSION_SPEC_SET_CREATION:
-                try:  # to add the role to the client in Keycloak
-                    description = permission_spec_set.get("description")
-                    kc.add_role(permission_spec_set["name"], client, token, kcRealm, description)
-                except RuntimeError as e:
-                    logger.error(
-                        format_cloud_event(
-                            f'Keycloak role create failed for {permission_spec_set["name"]} in {component}',
-                            "security-APIListener permissionSpecificationSet event listener error",
-                        )
-                    )
-                else:
-                    logger.info(
-                        format_cloud_event(
-                            f'Keycloak role {permission_spec_set["name"]} added to {component}',
-                            "security-APIListener permissionSpecificationSet event listener success",
-                        )
-                    )
-            elif event_type == PERMISSION_SPEC_SET_DELETION:
-                try:  # to delete the role from the client in Keycloak
-                    kc.del_role(permission_spec_set["name"], client, token, kcRealm)
-                except RuntimeError:
-                    logger.error(
-                        format_cloud_event(
-                            f'Keycloak role delete failed for {permission_spec_set["name"]} in {component}',
-                            "security-APIListener permissionSpecificationSet event listener error",
-                        )
-                    )
-                else:
-                    logger.info(
-                        format_cloud_event(
-                            f'Keycloak role {permission_spec_set["name"]} removed from {component}',
-                            "security-APIListener permissionSpecificationSet event listener success",
-                        )
-                    )
-            elif event_type == PERMISSION_SPEC_SET_UPDATE:
-                pass  # because we do not need to do anything for updates
-                logger.debug("Update Keycloak for permissionSpecificationSet UPDATE")
-            else:
-                logger.warning(
-                    format_cloud_event(
-                        f"eventType was {event_type} - not processed for permissionSpecificationSet",
-                        "security-APIListener called with invalid eventType for permissionSpecificationSet",
-                    )
+            logger.info(
+                format_cloud_event(
+                    f"Keycloak role {change.role} added to {change.component}",
+                    f"security-APIListener{change.source} event listener success",
                 )
-        else:
+            )
+    else:
+        try:  # to delete the role from the client in Keycloak
+            with_current_client_id(
+                lambda client_id: kc.del_role(change.role, client_id, token, kcRealm),
+                change.component,
+                client,
+                token,
+            )
+        except RuntimeError:
             logger.error(
                 format_cloud_event(
-                    f'No client found in Keycloak for {permission_spec_set["name"]}',
-                    "security-APIListener called for non-existent client (permissionSpecificationSet)",
+                    f"Keycloak role delete failed for {change.role} in {change.component}",
+                    f"security-APIListener{change.source} event listener error",
                 )
             )
-    else:
-        logger.warning(
-            format_cloud_event(
-                f'@baseType was {permission_spec_set["@baseType"]} - not processed for permissionSpecificationSet',
-                "security-APIListener called with invalid @baseType for permissionSpecificationSet",
+            return False
+        else:
+            logger.info(
+                format_cloud_event(
+                    f"Keycloak role {change.role} removed from {change.component}",
+                    f"security-APIListener{change.source} event listener success",
+                )
             )
-        )
+    return True
+
+
+for events in event_queues:
+    threading.Thread(target=event_worker, args=(events,), daemon=True).start()
 
 
 @app.route("/status", methods=["GET"])
@@ -318,6 +495,8 @@ def status_endpoint():
     status_info = {
         "service": "identity-listener-keycloak",
         "status": "running",
+        "queued_events": sum(events.qsize() for events in event_queues),
+        "event_metrics": event_metrics,
         "endpoints": {
             "/listener": "POST - Receive notifications from APIs",
             "/status": "GET - View service status and health"
@@ -212,16 +212,15 @@ def identityConfig(
     else:
         logw.info(f"Client {name} created")
 
-    try:  # to get the list of existing clients and the client object for this component
-        client_list = kc.get_client_list(token, kcRealm)
+    try:  # to get the client ids of this component and of the canvassystem client
+        client = kc.get_client_id(name, token, kcRealm)
+        canvassystem_client_id = kc.get_client_id(canvassystem_client, token, kcRealm)
     except RuntimeError as e:
         logw.error(f"security-APIListener could not GET clients for {kcRealm}", str(e))
         raise kopf.TemporaryError(
             "Could not get the client from Keycloak. Will retry.", delay=10
         )
     else:
-        client = client_list[name]
-        canvassystem_client_id = client_list[canvassystem_client]
         logw.info(f"Client {name} retrieved")
 
     try:  # to create the bootstrap role and add it to the canvassystem client
@@ -1,31 +1,102 @@
+import threading
+import time
+
 import requests
+from requests.adapters import HTTPAdapter
+
+# a token is renewed when it expires within this time (seconds)
+TOKEN_REFRESH_MARGIN = 30
+# client ids are looked up again after this time (seconds)
+CLIENT_ID_CACHE_SECONDS = 300
+
+
+class ClientNotFoundError(RuntimeError):
+    """
+    Raised by the role calls when Keycloak does not know the client id,
+    e.g. because the client was deleted and created again
+    """
 
 
 class Keycloak:
 
-    def __init__(self, url):
+    def __init__(self, url, pool_maxsize=10):
         self._url = url
+        # one session for all calls, so connections to Keycloak are kept alive
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_maxsize)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+        self._session.hooks["response"].append(self._drop_tokens_on_401)
+        self._token_lock = threading.Lock()
+        self._tokens = {}  # (user, pwd) -> token response with absolute expiry times
+        self._tokens_stale = False  # set on a 401, the cached tokens are dropped by the next get_token
+        self._client_ids = {}  # (realm, clientId) -> (id, lookup time)
+
+    def _drop_tokens_on_401(self, r, *args, **kwargs):
+        # no lock here: get_token holds _token_lock while it calls the token endpoint.
+        # A 401 from the token endpoint itself is a failed login, not a stale token.
+        if r.status_code == 401 and not r.url.startswith(self._token_url()):
+            self._tokens_stale = True
+
+    def _token_url(self) -> str:
+        return self._url + "/realms/master/protocol/openid-connect/token"
 
     def get_token(self, user: str, pwd: str) -> str:
         """
         Takes the admin username and password and returns a session
         token for future Bearer authentication
 
+        The token is cached until shortly before it expires. Then it is
+        renewed with the refresh token, or with a new login if the
+        refresh token has expired too.
+
         Returns the token, or raises an exception for the caller to
         catch
         """
-        try:
-            r = requests.post(
-                self._url + "/realms/master/protocol/openid-connect/token",
-                data={
-                    "username": user,
-                    "password": pwd,
-                    "grant_type": "password",
+        key = (user, pwd)
+        with self._token_lock:
+            if self._tokens_stale:
+                self._tokens_stale = False
+                self._tokens.clear()
+            now = time.monotonic()
+            cached = self._tokens.get(key)
+            if cached is not None and now < cached["expires_at"]:
+                return cached["access_token"]
+            data = None
+            if cached is not None and now < cached["refresh_expires_at"]:
+                data = {
+                    "grant_type": "refresh_token",
+                    "refresh_token": cached["refresh_token"],
                     "client_id": "admin-cli",
-                },
-            )
+                }
+                try:
+                    token = self._request_token(data)
+                except RuntimeError:
+                    data = None  # e.g. session ended in Keycloak, login again
+            if data is None:
+                token = self._request_token(
+                    {
+                        "username": user,
+                        "password": pwd,
+                        "grant_type": "password",
+                        "client_id": "admin-cli",
+                    }
+                )
+            self._tokens[key] = {
+                "access_token": token["access_token"],
+                "expires_at": now + token.get("expires_in", 0) - TOKEN_REFRESH_MARGIN,
+                "refresh_token": token.get("refresh_token"),
+                "refresh_expires_at": now
+                + token.get("refresh_expires_in", 0)
+                - TOKEN_REFRESH_MARGIN,
+            }
+            return token["access_token"]
+
+    def _request_token(self, data: dict) -> dict:
+        try:
+            r = self._session.post(self._token_url(), data=data)
             r.raise_for_status()
-            return r.json()["access_token"]
+            return r.json()
         except requests.HTTPError as e:
             raise RuntimeError(
                 f"get_token failed with HTTP status {r.status_code}: {e}"
@@ -44,7 +115,7 @@ class Keycloak:
             json_obj = {"clientId": client, "rootUrl": url, "serviceAccountsEnabled": True}
 
         try:  # to create the client in Keycloak
-            r = requests.post(
+            r = self._session.post(
                 self._url + "/admin/realms/" + realm + "/clients",
                 json=json_obj,
                 headers={"Authorization": "Bearer " + token},
@@ -71,7 +142,7 @@ class Keycloak:
         """
 
         try:  # to GET the id of the existing client that we need to DELETE it
-            r_a = requests.get(
+            r_a = self._session.get(
                 self._url + "/admin/realms/" + realm + "/clients",
                 params={"clientId": client},
                 headers={"Authorization": "Bearer " + token},
@@ -83,11 +154,12 @@ class Keycloak:
                 f"{r_a.status_code}: {e}"
             ) from None
 
+        self._client_ids.pop((realm, client), None)
         if len(r_a.json()) > 0:  # we found a client with a matching name
             target_client_id = r_a.json()[0]["id"]
 
             try:  # to delete the client matching the id we found
-                r_b = requests.delete(
+                r_b = self._session.delete(
                     self._url
                     + "/admin/realms/"
                     + realm
@@ -118,18 +190,58 @@ class Keycloak:
         an exception for the caller to catch
         """
         try:
-            r = requests.get(
+            r = self._session.get(
                 self._url + "/admin/realms/" + realm + "/clients",
                 headers={"Authorization": "Bearer " + token},
             )
             r.raise_for_status()
             client_list = dict((d["clientId"], d["id"]) for d in r.json())
+            now = time.monotonic()
+            for client, id in client_list.items():
+                self._client_ids[(realm, client)] = (id, now)
             return client_list
         except requests.HTTPError as e:
             raise RuntimeError(
                 "get_client_list failed with HTTP status " f"{r.status_code}: {e}"
             ) from None
 
+    def get_client_id(self, client: str, token: str, realm: str) -> str:
+        """
+        GETs the id of one client by its clientId (the componentName).
+        Ids are cached, so that the realm's client list does not
+        need to be downloaded for every event
+
+        Returns the id or raises an exception for the caller to catch
+        (also if there is no such client)
+        """
+        cached = self._client_ids.get((realm, client))
+        if (
+            cached is not None
+            and time.monotonic() - cached[1] < CLIENT_ID_CACHE_SECONDS
+        ):
+            return cached[0]
+        try:
+            r = self._session.get(
+                self._url + "/admin/realms/" + realm + "/clients",
+                params={"clientId": client},
+                headers={"Authorization": "Bearer " + token},
+            )
+            r.raise_for_status()
+        except requests.HTTPError as e:
+            raise RuntimeError(
+                "get_client_id failed with HTTP status " f"{r.status_code}: {e}"
+            ) from None
+        if len(r.json()) == 0:
+            raise RuntimeError(f"get_client_id found no client {client} in {realm}")
+        id = r.json()[0]["id"]
+        self._client_ids[(realm, client)] = (id, time.monotonic())
+        return id
+
+    def _forget_client_id(self, client_id: str) -> None:
+        for key, cached in list(self._client_ids.items()):
+            if cached[0] == client_id:
+                self._client_ids.pop(key, None)
+
     def add_role(self, role: str, client_id: str, token: str, realm: str, description: str = None) -> None:
         """
         POST new roles to the right client in the right realm in
@@ -144,7 +256,7 @@ class Keycloak:
             role_data["description"] = description
 
         try:  # to add new role to Keycloak
-            r = requests.post(
+            r = self._session.post(
                 self._url
                 + "/admin/realms/"
                 + realm
@@ -158,6 +270,12 @@ class Keycloak:
         except requests.HTTPError as e:
             if r.status_code == 409:
                 pass  # because the role already exists, which is acceptable but suspicious
+            elif r.status_code == 404:
+                # the client does not exist (anymore), its cached id is stale
+                self._forget_client_id(client_id)
+                raise ClientNotFoundError(
+                    f"add_role found no client with id {client_id}"
+                ) from None
             else:
                 raise RuntimeError(
                     "add_role failed with HTTP status " f"{r.status_code}: {e}"
@@ -172,7 +290,7 @@ class Keycloak:
         """
 
         try:  # to remove role from Keycloak
-            r = requests.delete(
+            r = self._session.delete(
                 self._url
                 + "/admin/realms/"
                 + realm
@@ -184,7 +302,13 @@ class Keycloak:
             )
             r.raise_for_status()
         except requests.HTTPError as e:
-            if r.status_code == 404:
+            if r.status_code == 404 and "client" in r.text.lower():
+                # "Could not find client", the cached id is stale
+                self._forget_client_id(client)
+                raise ClientNotFoundError(
+                    f"del_role found no client with id {client}"
+                ) from None
+            elif r.status_code == 404:
                 pass  # because the role does not exist which is acceptable but suspicious
             else:
                 raise RuntimeError(
@@ -1,12 +1,18 @@
+import os
 import logging
 import traceback
 import inspect
+import json
+import functools
 
 
 def tostr(value):
     return "" if value is None else str(value)
 
 
+LOGWRAPPER_JSON = os.environ.get("LOGWRAPPER_JSON", "").lower() == "true"
+
+
 class LogWrapper:
     """Helper class to standardize logging output.
 
@@ -19,8 +25,20 @@ class LogWrapper:
     * subject (String): The subject of the log message
     * message (String | Object): The message / object to be logged
                                  - can contain relevant data
+
+    Messages are only formatted if the log level is enabled, so passing a whole resource body
+    to debug() costs nothing when DEBUG is disabled. With LOGWRAPPER_JSON=true every message is
+    logged as one JSON object (component, resource, handler, function, subject, message).
     """
 
+    __slots__ = (
+        "logger",
+        "function_name",
+        "handler_name",
+        "resource_name",
+        "component_name",
+    )
+
     _default_logger = None
 
     @classmethod
@@ -133,18 +151,39 @@ class LogWrapper:
             No return value.
         """
         if self.logger.isEnabledFor(logLevel):
-            cn = tostr(self.component_name).replace("|", "/")
-            rn = tostr(self.resource_name).replace("|", "/")
-            hn = tostr(self.handler_name).replace("|", "/")
-            fn = tostr(self.function_name).replace("]", ")")
-            sub = tostr(subject).replace(":", ";")
-            moo = tostr(message_or_object)
-            self.logger.log(
-                logLevel,
-                f"[{cn}|{rn}|{hn}|{fn}] {sub}: {moo}",
-            )
+            if LOGWRAPPER_JSON:
+                self.logger.log(
+                    logLevel, self.json_message(subject, message_or_object)
+                )
+            else:
+                cn = tostr(self.component_name).replace("|", "/")
+                rn = tostr(self.resource_name).replace("|", "/")
+                hn = tostr(self.handler_name).replace("|", "/")
+                fn = tostr(self.function_name).replace("]", ")")
+                sub = tostr(subject).replace(":", ";")
+                moo = tostr(message_or_object)
+                self.logger.log(
+                    logLevel,
+                    f"[{cn}|{rn}|{hn}|{fn}] {sub}: {moo}",
+                )
         return
 
+    def json_message(self, subject, message_or_object):
+        """Helper function to render a log message as JSON for LOGWRAPPER_JSON output.
+
+        Objects that are not JSON serializable (e.g. kopf bodies) are logged as string.
+        """
+        record = {
+            "component": self.component_name,
+            "resource": self.resource_name,
+            "handler": self.handler_name,
+            "function": self.function_name,
+            "subject": tostr(subject),
+        }
+        if message_or_object is not None:
+            record["message"] = message_or_object
+        return json.dumps(record, default=str)
+
 
 def create_child_log(logw: LogWrapper, func_name, lw_kwargs):
     if "function_name" not in lw_kwargs:
@@ -156,11 +195,17 @@ def create_child_log(logw: LogWrapper, func_name, lw_kwargs):
     return logw.childLogger(**lw_kwargs)
 
 
+@functools.lru_cache(maxsize=None)
+def logw_arg_index(func):
+    """Position of the logw argument of a decorated function (None if it has none), computed once per function."""
+    arg_names = inspect.getfullargspec(func).args
+    return arg_names.index("logw") if "logw" in arg_names else None
+
+
 def inject_logw_args(func, args, kwargs, lw_kwargs):
     func_name = func.__name__
-    arg_names = inspect.getfullargspec(func).args
-    if "logw" in arg_names:
-        logw_idx = arg_names.index("logw")
+    logw_idx = logw_arg_index(func)
+    if logw_idx is not None:
         if len(args) > logw_idx:
             logw = args[logw_idx]
             args2 = list(args)
@@ -0,0 +1,144 @@
+import importlib.util
+import os
+import queue
+import sys
+import threading
+import time
+
+import pytest
+
+pytest.importorskip("waitress")
+pytest.importorskip("flask")
+pytest.importorskip("cloudevents")
+
+KEYCLOAK_DIR = os.path.abspath(
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+)
+if KEYCLOAK_DIR not in sys.path:
+    # allow running the tests locally without setting PYTHONPATH
+    sys.path.append(KEYCLOAK_DIR)
+
+spec = importlib.util.spec_from_file_location(
+    "identity_listener_keycloak",
+    os.path.join(
+        KEYCLOAK_DIR, "identity-listener-keycloak", "identity-listener-keycloak.py"
+    ),
+)
+listener = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(listener)
+
+
+class FakeKeycloak:
+    """Records the role changes, add_role and del_role fail while fail_roles is > 0."""
+
+    def __init__(self, fail_roles=0):
+        self.fail_roles = fail_roles
+        self.calls = []
+        self.release = threading.Event()
+        self.release.set()
+
+    def get_token(self, username, password):
+        self.release.wait(5)
+        return "token"
+
+    def get_client_list(self, token, realm):
+        return []
+
+    def get_client_id(self, component, token, realm):
+        return "id-" + component
+
+    def change(self, action, role):
+        self.calls.append((action, role))
+        if self.fail_roles > 0:
+            self.fail_roles -= 1
+            raise RuntimeError("Keycloak not reachable")
+
+    def add_role(self, role, client_id, token, realm, description=None):
+        self.change("add", role)
+
+    def del_role(self, role, client_id, token, realm):
+        self.change("del", role)
+
+
+def change(role, event_type):
+    return listener.RoleChange("", "comp", role, event_type, None)
+
+
+def wait_until_done():
+    deadline = time.monotonic() + 5
+    while listener.queued_role_changes:
+        assert time.monotonic() < deadline, "role changes not done"
+        time.sleep(0.01)
+
+
+@pytest.fixture
+def kc(monkeypatch):
+    fake = FakeKeycloak()
+    monkeypatch.setattr(listener, "kc", fake)
+    monkeypatch.setattr(listener, "EVENT_RETRY_DELAY", 0.01)
+    monkeypatch.setattr(listener, "EVENT_BATCH_WAIT", 0.05)
+    yield fake
+    fake.release.set()
+    wait_until_done()
+
+
+def test_only_the_last_queued_change_of_a_role_is_applied(kc):
+    coalesced = listener.event_metrics["coalesced"]
+    kc.release.clear()
+    assert listener.enqueue_role_change(change("r1", listener.PARTY_ROLE_CREATION))
+    time.sleep(0.2)  # the worker waits for the token with the first change
+    for event_type in (
+        listener.PARTY_ROLE_DELETION,
+        listener.PARTY_ROLE_CREATION,
+        listener.PARTY_ROLE_DELETION,
+    ):
+        assert listener.enqueue_role_change(change("r1", event_type))
+    kc.release.set()
+    wait_until_done()
+    assert kc.calls == [("add", "r1"), ("del", "r1")]
+    assert listener.event_metrics["coalesced"] - coalesced == 2
+
+
+def test_failed_change_is_retried(kc):
+    retried = listener.event_metrics["retried"]
+    kc.fail_roles = 2
+    listener.enqueue_role_change(change("r2", listener.PARTY_ROLE_CREATION))
+    wait_until_done()
+    assert kc.calls == [("add", "r2")] * 3
+    assert listener.event_metrics["retried"] - retried == 2
+
+
+def test_change_is_dropped_after_the_retries(kc, monkeypatch):
+    monkeypatch.setattr(listener, "EVENT_RETRIES", 2)
+    dropped = listener.event_metrics["dropped"]
+    kc.fail_roles = 10
+    listener.enqueue_role_change(change("r3", listener.PARTY_ROLE_CREATION))
+    wait_until_done()
+    assert kc.calls == [("add", "r3")] * 3
+    assert listener.event_metrics["dropped"] - dropped == 1
+
+
+def test_retried_change_is_skipped_after_a_newer_change(kc, monkeypatch):
+    monkeypatch.setattr(listener, "EVENT_RETRY_DELAY", 0.3)
+    kc.fail_roles = 1
+    listener.enqueue_role_change(change("r4", listener.PARTY_ROLE_DELETION))
+    time.sleep(0.15)  # the delete failed and waits for its retry
+    listener.enqueue_role_change(change("r4", listener.PARTY_ROLE_CREATION))
+    wait_until_done()
+    time.sleep(0.3)
+    assert kc.calls == [("del", "r4"), ("add", "r4")]
+
+
+def test_rejected_change_is_not_recorded(monkeypatch):
+    events = queue.Queue(maxsize=1)  # not taken by a worker
+    monkeypatch.setattr(listener, "event_queues", [events] * listener.EVENT_WORKERS)
+    assert listener.enqueue_role_change(change("r5", listener.PARTY_ROLE_CREATION))
+    record = list(listener.queued_role_changes[("comp", "r5")])
+    assert not listener.enqueue_role_change(change("r5", listener.PARTY_ROLE_DELETION))
+    assert listener.queued_role_changes[("comp", "r5")] == record
+    # the queued change is still the latest one
+    queued = events.get_nowait()
+    with listener.role_change_lock:
+        assert listener.queued_role_changes[("comp", "r5")][0] == queued.seq
+        listener.forget_role_change(queued)
+    assert ("comp", "r5") not in listener.queued_role_changes
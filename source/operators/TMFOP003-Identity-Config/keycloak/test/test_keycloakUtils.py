@@ -0,0 +1,141 @@
+import json
+import os
+import sys
+import threading
+
+import pytest
+import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    import keycloakUtils
+except ModuleNotFoundError:
+    # allow running the tests locally without setting PYTHONPATH
+    sys.path.append(
+        os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+    )
+    import keycloakUtils
+
+from keycloakUtils import Keycloak
+
+BASE_URL = "http://keycloak.test"
+TOKEN = {
+    "access_token": "token",
+    "expires_in": 300,
+    "refresh_token": "refresh",
+    "refresh_expires_in": 1800,
+}
+
+
+class FakeKeycloak(HTTPAdapter):
+    """Transport adapter answering from a list of (method, path) -> (status, body) rules."""
+
+    def __init__(self, routes):
+        super().__init__()
+        self.routes = routes
+        self.requests = []
+
+    def send(self, request, **kwargs):
+        path = request.path_url.split("?")[0]
+        self.requests.append((request.method, path))
+        status, body = self.routes[(request.method, path)]
+        if callable(status):
+            status, body = status()
+        response = requests.Response()
+        response.status_code = status
+        response._content = json.dumps(body).encode()
+        response.url = request.url
+        response.request = request
+        return response
+
+
+def keycloak(routes):
+    kc = Keycloak(BASE_URL)
+    adapter = FakeKeycloak(routes)
+    kc._session.mount("http://", adapter)
+    return kc, adapter
+
+
+def call_with_timeout(func, *args):
+    result = {}
+
+    def run():
+        try:
+            result["value"] = func(*args)
+        except Exception as e:
+            result["error"] = e
+
+    thread = threading.Thread(target=run, daemon=True)
+    thread.start()
+    thread.join(5)
+    assert not thread.is_alive(), "call did not return (deadlock)"
+    return result
+
+
+def test_token_is_cached():
+    kc, adapter = keycloak(
+        {("POST", "/realms/master/protocol/openid-connect/token"): (200, TOKEN)}
+    )
+    assert kc.get_token("admin", "pwd") == "token"
+    assert kc.get_token("admin", "pwd") == "token"
+    assert len(adapter.requests) == 1
+
+
+def test_401_from_token_endpoint_does_not_deadlock():
+    kc, adapter = keycloak(
+        {("POST", "/realms/master/protocol/openid-connect/token"): (401, {})}
+    )
+    result = call_with_timeout(kc.get_token, "admin", "wrong")
+    assert isinstance(result["error"], RuntimeError)
+    # the lock was released, later callers are not blocked
+    result = call_with_timeout(kc.get_token, "admin", "wrong")
+    assert isinstance(result["error"], RuntimeError)
+
+
+def test_401_from_admin_api_renews_token():
+    kc, adapter = keycloak(
+        {
+            ("POST", "/realms/master/protocol/openid-connect/token"): (200, TOKEN),
+            ("GET", "/admin/realms/odari/clients"): (401, {}),
+        }
+    )
+    token = kc.get_token("admin", "pwd")
+    with pytest.raises(RuntimeError):
+        kc.get_client_list(token, "odari")
+    kc.get_token("admin", "pwd")
+    token_requests = [r for r in adapter.requests if r[0] == "POST"]
+    assert len(token_requests) == 2
+
+
+def test_role_call_on_stale_client_id_forgets_the_id():
+    clients = [[{"id": "old", "clientId": "comp"}]]
+    kc, adapter = keycloak(
+        {
+            ("GET", "/admin/realms/odari/clients"): (lambda: (200, clients[0]), None),
+            ("POST", "/admin/realms/odari/clients/old/roles"): (
+                404,
+                {"error": "Could not find client"},
+            ),
+            ("POST", "/admin/realms/odari/clients/new/roles"): (201, {}),
+        }
+    )
+    assert kc.get_client_id("comp", "token", "odari") == "old"
+    with pytest.raises(keycloakUtils.ClientNotFoundError):
+        kc.add_role("role", "old", "token", "odari")
+    # the client was created again with a new id
+    clients[0] = [{"id": "new", "clientId": "comp"}]
+    client_id = kc.get_client_id("comp", "token", "odari")
+    assert client_id == "new"
+    kc.add_role("role", client_id, "token", "odari")
+
+
+def test_del_role_of_missing_role_is_ignored():
+    kc, adapter = keycloak(
+        {
+            ("DELETE", "/admin/realms/odari/clients/id/roles/role"): (
+                404,
+                {"error": "Could not find role"},
+            ),
+        }
+    )
+    kc.del_role("role", "id", "token", "odari")
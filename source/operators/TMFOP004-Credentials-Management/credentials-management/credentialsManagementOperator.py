@@ -6,6 +6,8 @@ import kubernetes.client
 from kubernetes.client.rest import ApiException
 import json
 import os
+import threading
+import time
 
 # Setup logging
 logging_level = os.environ.get("LOGGING", logging.INFO)
@@ -20,11 +22,86 @@ credsOp_client_secret = os.environ.get("CLIENT_SECRET")
 kcBaseurl = os.environ.get("KEYCLOAK_BASE")
 kcRealm = os.environ.get("KEYCLOAK_REALM")
 
+# "perClient" (default): the secret of each component client is queried from Keycloak on its own.
+# "batched": the secrets of all clients are read with one query and shared by the IdentityConfigs processed in the next SECRET_BATCH_SECONDS.
+secret_lookup_mode = os.environ.get("SECRET_LOOKUP_MODE", "perClient")
+SECRET_BATCH_SECONDS = float(os.environ.get("SECRET_BATCH_SECONDS", "10"))
+logger.info("Secret lookup mode %s", secret_lookup_mode)
+
+# a token is renewed when it expires within this time (seconds)
+TOKEN_REFRESH_MARGIN = 30
+
+# one session for all Keycloak calls, so connections are kept alive
+session = requests.Session()
+lock = threading.Lock()
+token_cache = {"access_token": None, "expires_at": 0}
+client_secrets_cache = {"secrets": {}, "fetched_at": 0}
+
 GROUP = "oda.tmforum.org"
 VERSION = "v1"
 IDENTITYCONFIG_VERSION = "v1"
 IDENTITYCONFIG_PLURAL = "identityconfigs"
 
+# Helper functions ----------
+
+def get_token():
+    """Returns the client-credentials token of the credentialsOperator, cached until shortly before it expires"""
+    with lock:
+        if time.monotonic() < token_cache["expires_at"]:
+            return token_cache["access_token"]
+        # Takes the clientId and secret of credentialsOperator client to authenticate and get a token
+        r = session.post(
+                kcBaseurl + "/realms/"+ kcRealm +"/protocol/openid-connect/token",
+                headers = {
+                    'Content-Type': 'application/x-www-form-urlencoded'
+                },
+                data={
+                    "client_id": credsOp_client_id,
+                    "client_secret":credsOp_client_secret,
+                    "grant_type": "client_credentials",
+                },
+            )
+
+        r.raise_for_status()
+        token_cache["access_token"] = r.json()["access_token"]
+        token_cache["expires_at"] = time.monotonic() + r.json().get("expires_in", 0) - TOKEN_REFRESH_MARGIN
+        logger.info( "token retrieved" )
+        return token_cache["access_token"]
+
+
+def drop_token():
+    with lock:
+        token_cache["expires_at"] = 0
+
+
+def get_client_secret(token, client_id):
+    """Returns the secret of the client, in batched mode from the shared list of all clients if it is there"""
+    if secret_lookup_mode == "batched":
+        with lock:
+            if time.monotonic() - client_secrets_cache["fetched_at"] >= SECRET_BATCH_SECONDS:
+                r = session.get(
+                        kcBaseurl + "/admin/realms/" + kcRealm + "/clients",
+                        headers={"Authorization": "Bearer " + token},
+                    )
+                r.raise_for_status()
+                client_secrets_cache["secrets"] = {client["clientId"]: client.get("secret") for client in r.json()}
+                client_secrets_cache["fetched_at"] = time.monotonic()
+                logger.info( f'client secrets of {len(client_secrets_cache["secrets"])} clients retrieved' )
+            client_secret = client_secrets_cache["secrets"].get(client_id)
+        if client_secret:
+            return client_secret
+        # client was created after the list was read
+
+    # to get the list of existing clients and the client secret for this component
+    r = session.get(
+            kcBaseurl + "/admin/realms/" + kcRealm + "/clients",
+            params={"clientId": client_id},
+            headers={"Authorization": "Bearer " + token},
+        )
+
+    r.raise_for_status()
+    return r.json()[0]["secret"]
+
 # Kopf handlers -------------
 
 # try to recover from broken watchers https://github.com/nolar/kopf/issues/1036
@@ -45,45 +122,23 @@ def credentialsOperator(
     # del unused-arguments for linting
     del status, labels, kwargs
 
-    # Takes the clientId and secret of credentialsOperator client to authenticate and get a token
     try:
-        r = requests.post(
-                kcBaseurl + "/realms/"+ kcRealm +"/protocol/openid-connect/token",
-                headers = {
-                    'Content-Type': 'application/x-www-form-urlencoded'
-                },
-                data={
-                    "client_id": credsOp_client_id,
-                    "client_secret":credsOp_client_secret,
-                    "grant_type": "client_credentials",
-                },
-            )
-
-        r.raise_for_status()
-        token = r.json()["access_token"]
+        token = get_token()
     except requests.exceptions.RequestException as e:
         raise kopf.TemporaryError(
-            f"request for token failed with HTTP status {r.status_code}: {e}"
+            f"request for token failed: {e}"
         ) 
-    else:
-        logger.info( "token retrieved" )
 
     # clientId of component which kubernetes secret is to be created
     client_id = name
 
-    # to get the list of existing clients and the client secret for this component
     try:
-        r = requests.get(
-                kcBaseurl + "/admin/realms/" + kcRealm + "/clients",
-                params={"clientId": client_id},
-                headers={"Authorization": "Bearer " + token},
-            )
-            
-        r.raise_for_status()
-        client_secret = r.json()[0]["secret"]
+        client_secret = get_client_secret(token, client_id)
     except requests.exceptions.RequestException as e:
+        if e.response is not None and e.response.status_code == 401:
+            drop_token()
         raise kopf.TemporaryError(
-            f"request for client_secret failed with HTTP status {r.status_code}: {e}"
+            f"request for client_secret failed: {e}"
         )
     else:
         logger.info( f'client secret retrieved' )
@@ -8,6 +8,7 @@ from kubernetes.client.rest import ApiException
 from service_inventory_client import ServiceInventoryAPI
 
 from log_wrapper import LogWrapper, logwrapper
+import k8s_async
 
 
 DEPAPI_GROUP = "oda.tmforum.org"
@@ -105,10 +106,40 @@ def get_expapi(logw: LogWrapper):
             )
 
 
+@kopf.index(DEPAPI_GROUP, DEPAPI_VERSION, API_PLURAL)
+def exposedapi_by_spec_url(spec, status, **kwargs):
+    """long-lived cache of openapi ExposedAPIs, keyed by (specification url, ready).
+    The value is the url where the ExposedAPI is exposed.
+    """
+    specification_url = safe_get(None, spec, "specification", "url")
+    if safe_get(None, spec, "apiType") != "openapi" or specification_url is None:
+        return None
+    ready = safe_get(False, status or {}, "implementation", "ready") == True
+    return {
+        (specification_url, ready): safe_get(None, status or {}, "apiStatus", "url")
+    }
+
+
+@kopf.index(DEPAPI_GROUP, DEPAPI_VERSION, DEPAPI_PLURAL)
+def waiting_dependentapis(namespace, name, spec, status, **kwargs):
+    """DependentAPIs which are not ready yet, keyed by the specification url they are waiting for."""
+    if safe_get(None, status or {}, "implementation", "ready") == True:
+        return None
+    specification_url = safe_get(None, spec, "specification", "url")
+    if specification_url is None:
+        return None
+    return {specification_url: (namespace, name)}
+
+
 @logwrapper
-def get_depapi_url(logw: LogWrapper, depapi_name, depapi_namespace):
+def get_depapi_url(logw: LogWrapper, depapi_name, depapi_namespace, expapi_index=None):
     dep_api = get_depapi_spec(logw, depapi_name, depapi_namespace)
     depapi_specification = dep_api["specification"]
+    if expapi_index is not None:
+        for url in expapi_index.get((depapi_specification["url"], True), []):
+            if url is not None:
+                return url
+        return None
     exp_apis = get_expapi()
     for exp_api in exp_apis["items"]:
         if not ("specification" in exp_api["spec"].keys()):
@@ -124,6 +155,7 @@ def get_depapi_url(logw: LogWrapper, depapi_name, depapi_namespace):
                 return exp_api["status"]["apiStatus"]["url"]
     return None
 
+
 def quick_get_comp_name(body):
     return safe_get(None, body, "metadata", "labels", componentname_label)
 
@@ -151,9 +183,57 @@ async def dependentApiCreate(
 
     # Dummy implementation set dummy url and ready status
     if not implementationReady(body):  # avoid recursion
-        url = get_depapi_url(logw, name, namespace)
+        url = await k8s_async.run_blocking(
+            get_depapi_url, logw, name, namespace, kwargs.get("exposedapi_by_spec_url")
+        )
         if url != None:
-            setDependentAPIStatus(logw, namespace, name, url)
+            await k8s_async.run_blocking(
+                setDependentAPIStatus, logw, namespace, name, url
+            )
+
+
+# triggered by every event of an oda.tmforum.org exposedapi.
+# An event handler does not store any state on the exposedapi (the operator has read-only access),
+# events of exposedapis without waiting dependentapis return without api calls.
+@kopf.on.event(DEPAPI_GROUP, DEPAPI_VERSION, API_PLURAL)
+async def exposedApiReady(
+    type,
+    meta,
+    spec,
+    status,
+    body,
+    namespace,
+    labels,
+    name,
+    waiting_dependentapis,
+    **kwargs,
+):
+    """Resolve the DependentAPIs which are waiting for an ExposedAPI as soon as it becomes ready,
+    instead of waiting for the next update of the DependentAPI.
+    """
+    if type == "DELETED":
+        return
+    logw = LogWrapper(handler_name="exposedApiReady", function_name="exposedApiReady")
+    logw.set(
+        component_name=quick_get_comp_name(body),
+        resource_name=f"ExpAPI/{name}",
+    )
+    if (
+        safe_get(None, spec, "apiType") != "openapi"
+        or safe_get(None, status, "implementation", "ready") != True
+    ):
+        return
+    url = safe_get(None, status, "apiStatus", "url")
+    specification_url = safe_get(None, spec, "specification", "url")
+    if url is None or specification_url is None:
+        return
+    for depapi_namespace, depapi_name in list(
+        waiting_dependentapis.get(specification_url, [])
+    ):
+        logw.info(f"resolving waiting dependentapi {depapi_name}.{depapi_namespace}")
+        await k8s_async.run_blocking(
+            setDependentAPIStatus, logw, depapi_namespace, depapi_name, url
+        )
 
 
 @logwrapper
@@ -181,7 +261,7 @@ async def dependentApiDelete(
     logw.debugInfo(f"Delete DepAPI {name}.{namespace}", body)
     svc_id = safe_get(None, status, "depapiStatus", "svcInvID")
     if svc_id:
-        removeServiceInventory(logw, svc_id)
+        await k8s_async.run_blocking(removeServiceInventory, logw, svc_id)
 
 
 def cavas_info_instance() -> ServiceInventoryAPI:
@@ -324,8 +404,8 @@ async def updateDepedentAPIReady(
                 parent_component_name = meta["ownerReferences"][0]["name"]
                 logw.info(f"reading component {parent_component_name}")
                 try:
-                    api_instance = kubernetes.client.CustomObjectsApi()
-                    parent_component = api_instance.get_namespaced_custom_object(
+                    api_instance = k8s_async.custom_objects_api()
+                    parent_component = await api_instance.get_namespaced_custom_object(
                         COMP_GROUP,
                         COMP_VERSION,
                         namespace,
@@ -367,7 +447,7 @@ async def updateDepedentAPIReady(
                                 "url"
                             ] = depapi_url
                             try:
-                                _ = api_instance.patch_namespaced_custom_object(
+                                _ = await api_instance.patch_namespaced_custom_object(
                                     COMP_GROUP,
                                     COMP_VERSION,
                                     namespace,
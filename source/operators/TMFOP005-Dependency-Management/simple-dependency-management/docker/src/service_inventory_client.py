@@ -7,15 +7,40 @@ from jinja2 import (
 )
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor
 import json
 import os
 
 from utils import safe_get
 
+PAYLOAD_TEMPLATE = "create-service-payload.json.jinja2"
+
 
 class ServiceInventoryAPI:
-    def __init__(self, endpoint):
+    """Client for the service inventory of the canvas-info-service.
+
+    All calls share one requests session, so connections to the service are kept alive and reused.
+    Connection errors, and 502/503/504 responses of GET, PATCH and DELETE, are retried with exponential backoff.
+    """
+
+    def __init__(self, endpoint, retries=3, backoff_factor=0.5, pool_maxsize=10):
         self.endpoint = endpoint
+        self.pool_maxsize = pool_maxsize
+        retry = Retry(
+            total=retries,
+            backoff_factor=backoff_factor,
+            status_forcelist=(502, 503, 504),
+            allowed_methods=frozenset({"GET", "PATCH", "DELETE"}),
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(
+            pool_connections=1, pool_maxsize=pool_maxsize, max_retries=retry
+        )
+        self.session = requests.Session()
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
         template_dir = os.path.join(
             os.path.dirname(os.path.realpath(__file__)), "templates"
         )
@@ -28,6 +53,20 @@ class ServiceInventoryAPI:
         #     autoescape=select_autoescape()
         # )
         # =======================================================================
+        self.payload_template = self.env.get_template(PAYLOAD_TEMPLATE)
+
+    def close(self):
+        self.session.close()
+
+    def _payload(self, componentName, dependencyName, url, specification, state):
+        payload = self.payload_template.render(
+            componentName=componentName,
+            dependencyName=dependencyName,
+            url=url,
+            specification=specification,
+            state=state,
+        )
+        return json.loads(payload)
 
     def create_service(self, componentName, dependencyName, url, specification, state):
         """
@@ -40,19 +79,13 @@ class ServiceInventoryAPI:
             ...
             }'
         """
-        template = self.env.get_template("create-service-payload.json.jinja2")
-        payload = template.render(
-            componentName=componentName,
-            dependencyName=dependencyName,
-            url=url,
-            specification=specification,
-            state=state,
+        payload_dict = self._payload(
+            componentName, dependencyName, url, specification, state
         )
-        payload_dict = json.loads(payload)
 
         url = f"{self.endpoint}/service"
         header = {"accept": "application/json", "Content-Type": "application/json"}
-        response = requests.post(url, json=payload_dict, headers=header)
+        response = self.session.post(url, json=payload_dict, headers=header)
         if response.status_code != 201:
             raise ValueError(
                 f"Unexpected http status code {response.status_code} - {response.content.decode()}"
@@ -78,7 +111,7 @@ class ServiceInventoryAPI:
             params["serviceCharacteristic.value"] = component_name
         elif dependency_name:
             params["serviceCharacteristic.value"] = dependency_name
-        response = requests.get(
+        response = self.session.get(
             url, headers=header, params=params
         )  # , auth=HTTPBasicAuth(be_auth_user, be_auth_pw))
         if response.status_code != 200:
@@ -108,7 +141,7 @@ class ServiceInventoryAPI:
         # TODO[FH]: check format of id
         url = f"{self.endpoint}/service/{id}"
         header = {"accept": "application/json"}
-        response = requests.get(url, headers=header)
+        response = self.session.get(url, headers=header)
         if response.status_code != 200:
             raise ValueError(f"Unexpected http status code {response.status_code}")
         svc = json.loads(response.content)
@@ -129,19 +162,13 @@ class ServiceInventoryAPI:
           }'
         """
 
-        template = self.env.get_template("create-service-payload.json.jinja2")
-        payload = template.render(
-            componentName=componentName,
-            dependencyName=dependencyName,
-            url=url,
-            specification=specification,
-            state=state,
+        payload_dict = self._payload(
+            componentName, dependencyName, url, specification, state
         )
-        payload_dict = json.loads(payload)
 
         url = f"{self.endpoint}/service/{id}"
         header = {"accept": "application/json", "Content-Type": "application/json"}
-        response = requests.patch(url, headers=header, json=payload_dict)
+        response = self.session.patch(url, headers=header, json=payload_dict)
         if response.status_code != 200:
             raise ValueError(
                 f"Unexpected http status code {response.status_code} - {response.content.decode()}"
@@ -159,13 +186,38 @@ class ServiceInventoryAPI:
         # TODO[FH]: check format of id
         url = f"{self.endpoint}/service/{id}"
         header = {"accept": "*/*"}
-        response = requests.delete(url, headers=header)
+        response = self.session.delete(url, headers=header)
         if response.status_code == 204:
             return True
         if ignore_not_found:
             return False
         raise ValueError(f"Unexpected http status code {response.status_code}")
 
+    def create_services(self, services):
+        """
+        create many services, e.g. all dependencies of a component.
+        services is a list of dicts with the arguments of create_service.
+        The services are created concurrently over the pooled connections.
+        Returns the created services in the order of the input list.
+        """
+        return self._bulk(self.create_service, services)
+
+    def update_services(self, services):
+        """
+        update many services, services is a list of dicts with the arguments of update_service (including id).
+        Returns the updated services in the order of the input list.
+        """
+        return self._bulk(self.update_service, services)
+
+    def _bulk(self, func, services):
+        if len(services) <= 1:
+            return [func(**service) for service in services]
+        with ThreadPoolExecutor(
+            max_workers=min(self.pool_maxsize, len(services))
+        ) as executor:
+            futures = [executor.submit(func, **service) for service in services]
+            return [future.result() for future in futures]
+
     def _shorten(self, svc: dict) -> dict:
         """
         convert this:
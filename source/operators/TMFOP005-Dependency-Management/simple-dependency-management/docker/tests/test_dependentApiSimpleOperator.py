@@ -0,0 +1,108 @@
+import asyncio
+import os
+import sys
+
+try:
+    import dependentApiSimpleOperator
+except ModuleNotFoundError:
+    # allow running component locally without setting PYTHONPATH
+    sys.path.append(
+        os.path.abspath(
+            os.path.join(os.path.dirname(os.path.abspath(__file__)), "../src")
+        )
+    )
+    import dependentApiSimpleOperator
+
+from dependentApiSimpleOperator import (
+    exposedApiReady,
+    exposedapi_by_spec_url,
+    get_depapi_url,
+    waiting_dependentapis,
+)
+from log_wrapper import LogWrapper
+
+SPEC_URL = "https://example.org/TMF620.swagger.json"
+
+
+def expapi_spec(api_type="openapi"):
+    return {"apiType": api_type, "specification": {"url": SPEC_URL}}
+
+
+def expapi_status(ready, url="https://gw/catalog"):
+    return {"implementation": {"ready": ready}, "apiStatus": {"url": url}}
+
+
+def test_exposedapi_by_spec_url():
+    assert exposedapi_by_spec_url(expapi_spec(), expapi_status(True)) == {
+        (SPEC_URL, True): "https://gw/catalog"
+    }
+    assert exposedapi_by_spec_url(expapi_spec(), None) == {(SPEC_URL, False): None}
+    assert exposedapi_by_spec_url(expapi_spec("graphql"), expapi_status(True)) is None
+
+
+def test_waiting_dependentapis():
+    spec = {"specification": {"url": SPEC_URL}}
+    assert waiting_dependentapis("ns", "dep", spec, None) == {SPEC_URL: ("ns", "dep")}
+    assert (
+        waiting_dependentapis("ns", "dep", spec, {"implementation": {"ready": True}})
+        is None
+    )
+    assert waiting_dependentapis("ns", "dep", {}, None) is None
+
+
+def test_get_depapi_url_from_index(monkeypatch):
+    monkeypatch.setattr(
+        dependentApiSimpleOperator,
+        "get_depapi_spec",
+        lambda logw, name, namespace: {"specification": {"url": SPEC_URL}},
+    )
+    index = {(SPEC_URL, False): [None], (SPEC_URL, True): ["https://gw/catalog"]}
+    assert get_depapi_url(LogWrapper(), "dep", "ns", index) == "https://gw/catalog"
+    assert (
+        get_depapi_url(LogWrapper(), "dep", "ns", {(SPEC_URL, False): [None]}) is None
+    )
+
+
+def run_exposedApiReady(monkeypatch, type, status, waiting):
+    resolved = []
+    monkeypatch.setattr(
+        dependentApiSimpleOperator,
+        "setDependentAPIStatus",
+        lambda logw, namespace, name, url: resolved.append((namespace, name, url)),
+    )
+    asyncio.run(
+        exposedApiReady(
+            type=type,
+            meta={},
+            spec=expapi_spec(),
+            status=status,
+            body={"metadata": {"name": "catalog"}},
+            namespace="components",
+            labels={},
+            name="catalog",
+            waiting_dependentapis=waiting,
+        )
+    )
+    return resolved
+
+
+def test_ready_exposedapi_resolves_waiting_dependentapis(monkeypatch):
+    waiting = {SPEC_URL: [("ns1", "dep1"), ("ns2", "dep2")]}
+    assert run_exposedApiReady(
+        monkeypatch, "MODIFIED", expapi_status(True), waiting
+    ) == [
+        ("ns1", "dep1", "https://gw/catalog"),
+        ("ns2", "dep2", "https://gw/catalog"),
+    ]
+
+
+def test_exposedapi_not_ready_or_deleted_resolves_nothing(monkeypatch):
+    waiting = {SPEC_URL: [("ns1", "dep1")]}
+    assert (
+        run_exposedApiReady(monkeypatch, "MODIFIED", expapi_status(False), waiting)
+        == []
+    )
+    assert (
+        run_exposedApiReady(monkeypatch, "DELETED", expapi_status(True), waiting) == []
+    )
+    assert run_exposedApiReady(monkeypatch, None, expapi_status(True), {}) == []
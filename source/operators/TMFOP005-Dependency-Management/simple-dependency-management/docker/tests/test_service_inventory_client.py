@@ -345,6 +345,25 @@ def test_update_service(svc_inv, rfmock):
         assert "Unexpected http status code" in e.args[0]
 
 
+def test_create_services_bulk(svc_inv, rfmock):
+    rfmock.mock_post("service", "create-svc1-listsvc", 201)
+    svc1_args = {
+        "componentName": "acme-productinventory",
+        "dependencyName": "downstreamproductcatalog",
+        "url": "http://localhost:8080/alice-productcatalogmanagement/tmf-api/productCatalogManagement/v4",
+        "specification": "https://raw.githubusercontent.com/tmforum-apis/TMF620_ProductCatalog/master/TMF620-ProductCatalog-v4.0.0.swagger.json",
+        "state": "active",
+    }
+    svcs = svc_inv.create_services([svc1_args, svc1_args, svc1_args])
+    print(f"\nCREATED SERVICES BULK:\n{json.dumps(svcs,indent=2)}\n")
+    assert len(svcs) == 3
+    for svc in svcs:
+        assert svc["componentName"] == "acme-productinventory"
+        assert svc["state"] == "active"
+
+    assert svc_inv.create_services([]) == []
+
+
 if __name__ == "__main__":
     # _clean_all()
     pytest.main(
@@ -3,6 +3,8 @@ import hvac
 import logging
 import os
 import fnmatch
+import functools
+import re
 from cryptography.fernet import Fernet
 import base64
 import kubernetes
@@ -12,8 +14,15 @@ from kubernetes.client.models.v1_replica_set import V1ReplicaSet
 from kubernetes.client.models.v1_deployment import V1Deployment
 from hvac.exceptions import InvalidPath
 import asyncio
+import bisect
+import copy
+import threading
+import time
+import requests
+from requests.adapters import HTTPAdapter
 
 from log_wrapper import LogWrapper, logwrapper
+import k8s_async
 
 SMAN_GROUP = "oda.tmforum.org"
 SMAN_VERSION = "v1"
@@ -126,6 +135,9 @@ def configure(settings: kopf.OperatorSettings, **_):
     settings.admission.server = ServiceTunnel()
     settings.admission.managed = "sman.sidecar.kopf"
     settings.watching.server_timeout = 1 * 60
+    if POD_WATCH_SELECTOR_SUPPORTED:
+        # only the labelled pods are sent by the API server to the sidecar_pods index
+        settings.watching.label_selectors["", "v1", "pods"] = SIDECAR_POD_SELECTOR
 
 
 def entryExists(dictionary, key, value):
@@ -224,75 +236,44 @@ def get_deployment_name(body):
     return safe_get(None, body, "metadata", "name")
 
 
-@logwrapper
-def inject_sidecar(logw: LogWrapper, body, patch):
+@kopf.index(SMAN_GROUP, SMAN_VERSION, SMAN_PLURAL)
+def secretsmanagement_specs(namespace, name, spec, **kwargs):
+    """Index of the secretsmanagement specs by namespace and name.
 
-    sman_name = get_comp_name(body)
-    logw.set(component_name=sman_name)
-    if not sman_name:
-        logw.info(
-            "Component name label not found, doing nothing",
-            componentname_label,
+    The values are the fields needed by the pod webhook:
+    (type, sidecar port, podSelector name, podSelector namespace, podSelector serviceaccount).
+    """
+    return {
+        (namespace, name): (
+            safe_get("sideCar", spec, "type"),
+            int(safe_get("5000", spec, "sideCar", "port")),
+            safe_get("", spec, "podSelector", "name"),
+            safe_get("", spec, "podSelector", "namespace"),
+            safe_get("", spec, "podSelector", "serviceaccount"),
         )
-        return
-    pod_name = get_pod_name(body)
-    logw.set(resource_name=f"POD/{pod_name}")
-    pod_namespace = body["metadata"]["namespace"]
-    pod_serviceAccountName = safe_get("default", body, "spec", "serviceAccountName")
-    logw.info(
-        "POD serviceaccount", f"{pod_namespace}:{pod_name}:{pod_serviceAccountName}"
-    )
-
-    # HIERWEITER deployment = find_deployment(pod_namespace, pod_name, pod-template-hash)
+    }
 
-    # TODO: not really correct to use pod_namespace, if POD runs in a different namespace then the sman cr.
-    ciid = toCIID(pod_namespace, sman_name)
 
-    sman_cr_name = f"{sman_name}"
-    logw.debug("getting secretsmanagement cr", f"{pod_namespace}:{sman_cr_name}")
-    sman_spec = get_sman_spec(sman_cr_name, pod_namespace)
-    logw.debug("secretsmanagement spec", sman_spec)
+def lookup_sman_spec(sman_name, sman_namespace, sman_index=None):
+    """Return the indexed secretsmanagement fields, falls back to reading the cr"""
+    if sman_index is not None:
+        for entry in sman_index.get((sman_namespace, sman_name), ()):
+            return entry
+    sman_spec = get_sman_spec(sman_name, sman_namespace)
     if not sman_spec:
-        raise kopf.AdmissionError(
-            f"secretsmanagement {sman_cr_name} has no spec.", code=400
-        )
+        return None
+    return secretsmanagement_specs(
+        namespace=sman_namespace, name=sman_name, spec=sman_spec
+    )[(sman_namespace, sman_name)]
 
-    smanname = sman_cr_name  # safe_get("", sman_spec, "name")
-    s_type = safe_get("sideCar", sman_spec, "type")
-    sidecar_port = int(safe_get("5000", sman_spec, "sideCar", "port"))
-    podsel_name = safe_get("", sman_spec, "podSelector", "name")
-    podsel_namespace = safe_get("", sman_spec, "podSelector", "namespace")
-    podsel_serviceaccount = safe_get("", sman_spec, "podSelector", "serviceaccount")
-    logw.debug(
-        "pod-filter",
-        f"name={podsel_name}, namespace={podsel_namespace}, serviceaccount={podsel_serviceaccount}",
-    )
-    if not smanname:
-        raise kopf.AdmissionError(
-            f"secretsmanagement {sman_cr_name}: missing name.", code=400
-        )
-    if s_type != "sideCar":
-        raise kopf.AdmissionError(
-            f"secretsmanagement {sman_cr_name}: unsupported type {s_type}.", code=400
-        )
-    if podsel_name and not fnmatch.fnmatch(pod_name, podsel_name):
-        raise kopf.AdmissionError(
-            f"secretsmanagement {sman_cr_name}: pod name does not match selector.",
-            code=400,
-        )
-    if podsel_namespace and not fnmatch.fnmatch(pod_namespace, podsel_namespace):
-        raise kopf.AdmissionError(
-            f"secretsmanagement {sman_cr_name}: pod namespace does not match selector.",
-            code=400,
-        )
-    if podsel_serviceaccount and not fnmatch.fnmatch(
-        pod_serviceAccountName, podsel_serviceaccount
-    ):
-        raise kopf.AdmissionError(
-            f"secretsmanagement {sman_cr_name}: pod serviceAccountName does not match selector.",
-            code=400,
-        )
 
+@functools.lru_cache(maxsize=256)
+def sidecar_patch_template(ciid, sidecar_port):
+    """The sidecar container and its volumes for one secretsmanagement.
+
+    Returns (container, tmp volume, kube-api-access volume). The result is cached,
+    use copy.deepcopy before adding it to a patch.
+    """
     container_smansidecar = {
         "name": "smansidecar",
         "image": sidecar_image,
@@ -363,14 +344,91 @@ def inject_sidecar(logw: LogWrapper, body, patch):
             "defaultMode": 420,
         },
     }
+    return (
+        container_smansidecar,
+        volume_smansidecar_tmp,
+        volume_smansidecar_kube_api_access,
+    )
 
-    containers = safe_get([], body, "spec", "containers")
-    vols = safe_get([], body, "spec", "volumes")
 
+@logwrapper
+def inject_sidecar(logw: LogWrapper, body, patch, sman_index=None):
+
+    containers = safe_get([], body, "spec", "containers")
     if entryExists(containers, "name", "smansidecar"):
         logw.info("smansidecar container already exists, doing nothing")
         return
 
+    sman_name = get_comp_name(body)
+    logw.set(component_name=sman_name)
+    if not sman_name:
+        logw.info(
+            "Component name label not found, doing nothing",
+            componentname_label,
+        )
+        return
+    pod_name = get_pod_name(body)
+    logw.set(resource_name=f"POD/{pod_name}")
+    pod_namespace = body["metadata"]["namespace"]
+    pod_serviceAccountName = safe_get("default", body, "spec", "serviceAccountName")
+    logw.info(
+        "POD serviceaccount", f"{pod_namespace}:{pod_name}:{pod_serviceAccountName}"
+    )
+
+    # HIERWEITER deployment = find_deployment(pod_namespace, pod_name, pod-template-hash)
+
+    # TODO: not really correct to use pod_namespace, if POD runs in a different namespace then the sman cr.
+    ciid = toCIID(pod_namespace, sman_name)
+
+    sman_cr_name = f"{sman_name}"
+    logw.debug("getting secretsmanagement cr", f"{pod_namespace}:{sman_cr_name}")
+    sman_spec = lookup_sman_spec(sman_cr_name, pod_namespace, sman_index)
+    logw.debug("secretsmanagement spec", sman_spec)
+    if not sman_spec:
+        raise kopf.AdmissionError(
+            f"secretsmanagement {sman_cr_name} has no spec.", code=400
+        )
+
+    smanname = sman_cr_name  # safe_get("", sman_spec, "name")
+    s_type, sidecar_port, podsel_name, podsel_namespace, podsel_serviceaccount = (
+        sman_spec
+    )
+    logw.debug(
+        "pod-filter",
+        f"name={podsel_name}, namespace={podsel_namespace}, serviceaccount={podsel_serviceaccount}",
+    )
+    if not smanname:
+        raise kopf.AdmissionError(
+            f"secretsmanagement {sman_cr_name}: missing name.", code=400
+        )
+    if s_type != "sideCar":
+        raise kopf.AdmissionError(
+            f"secretsmanagement {sman_cr_name}: unsupported type {s_type}.", code=400
+        )
+    if not selector_matches(podsel_name, pod_name):
+        raise kopf.AdmissionError(
+            f"secretsmanagement {sman_cr_name}: pod name does not match selector.",
+            code=400,
+        )
+    if not selector_matches(podsel_namespace, pod_namespace):
+        raise kopf.AdmissionError(
+            f"secretsmanagement {sman_cr_name}: pod namespace does not match selector.",
+            code=400,
+        )
+    if not selector_matches(podsel_serviceaccount, pod_serviceAccountName):
+        raise kopf.AdmissionError(
+            f"secretsmanagement {sman_cr_name}: pod serviceAccountName does not match selector.",
+            code=400,
+        )
+
+    (
+        container_smansidecar,
+        volume_smansidecar_tmp,
+        volume_smansidecar_kube_api_access,
+    ) = copy.deepcopy(sidecar_patch_template(ciid, sidecar_port))
+
+    vols = safe_get([], body, "spec", "volumes")
+
     containers.append(container_smansidecar)
     patch.spec["containers"] = containers
     logw.debug("injecting smansidecar container")
@@ -406,6 +464,26 @@ def label_deployment_pods(logw: LogWrapper, body, patch):
         patch.spec["template"] = {"metadata": {"labels": labels}}
 
 
+# latency histograms of the mutating webhooks, upper bounds of the buckets in seconds
+WEBHOOK_LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, float("inf"))
+webhook_latency = {
+    handler: [0] * len(WEBHOOK_LATENCY_BUCKETS)
+    for handler in ("podmutate", "deploymentmutate")
+}
+
+
+def observe_webhook_latency(handler, started):
+    """Count the time since started (time.perf_counter) in the histogram of the handler"""
+    seconds = time.perf_counter() - started
+    webhook_latency[handler][bisect.bisect_left(WEBHOOK_LATENCY_BUCKETS, seconds)] += 1
+    logger.debug(
+        "%s latency %.4fs, histogram %s",
+        handler,
+        seconds,
+        dict(zip(map(str, WEBHOOK_LATENCY_BUCKETS), webhook_latency[handler])),
+    )
+
+
 @kopf.on.mutate(
     "pods",
     labels={"oda.tmforum.org/secretsmanagement": "sidecar"},
@@ -419,8 +497,13 @@ async def podmutate(
     status,
     patch: kopf.Patch,
     warnings: list[str],
+    secretsmanagement_specs: kopf.Index = None,
     **_,
 ):
+    started = time.perf_counter()
+    # kopf registers the label filter as objectSelector of the webhook, this only guards against other callers
+    if safe_get(None, meta, "labels", secretsmanagementtype_label) != "sidecar":
+        return
     logw = LogWrapper(handler_name="podmutate", function_name="podmutate")
     try:
         logw.set(
@@ -428,13 +511,22 @@ async def podmutate(
             resource_name=f"POD/{get_pod_name(body)}",
         )
         logw.debugInfo("POD mutate called", body)
-        inject_sidecar(logw, body, patch)
+        sman_key = (safe_get(None, meta, "namespace"), quick_get_comp_name(body))
+        if secretsmanagement_specs is not None and sman_key in secretsmanagement_specs:
+            # no api calls needed with the component label and an indexed secretsmanagement
+            inject_sidecar(logw, body, patch, secretsmanagement_specs)
+        else:
+            await k8s_async.run_blocking(
+                inject_sidecar, logw, body, patch, secretsmanagement_specs
+            )
         logw.debugInfo(f"POD mutate returns patch (size {len(str(patch))})", patch)
 
     except Exception as e:
         logw.exception("Unhandled exception", e)
         warnings.append("internal error, patch not applied")
         patch.clear()
+    finally:
+        observe_webhook_latency("podmutate", started)
 
 
 @kopf.on.mutate(
@@ -453,6 +545,7 @@ async def deploymentmutate(
     logw: LogWrapper = None,
     **_,
 ):
+    started = time.perf_counter()
     logw = LogWrapper(handler_name="deploymentmutate", function_name="deploymentmutate")
     try:
         logw.set(
@@ -469,6 +562,8 @@ async def deploymentmutate(
         logw.exception("deploymentmutate failed", ex)
         warnings.append("internal error, patch not applied")
         patch.clear()
+    finally:
+        observe_webhook_latency("deploymentmutate", started)
 
 
 def decrypt(encrypted_text):
@@ -500,6 +595,67 @@ if not hvac_token_enc:
 # check encrypted token
 decrypt(hvac_token_enc)
 
+# mounts, policies and roles known to exist in vault are not checked again for this time (seconds)
+VAULT_STATE_CACHE_SECONDS = float(os.getenv("VAULT_STATE_CACHE_SECONDS", "300"))
+VAULT_POOL_MAXSIZE = 10
+
+vault_lock = threading.Lock()
+vault_client = {"client": None, "renew_at": None}
+# name -> time when it was last seen in (or written to) vault
+vault_state = {"mounts": {}, "policies": {}, "roles": {}}
+
+
+def token_renew_time(client):
+    """time when the token should be renewed (at half of its ttl), None for tokens which do not expire (e.g. root)"""
+    data = client.auth.token.lookup_self()["data"]
+    if not data.get("renewable") or not data.get("ttl"):
+        return None
+    return time.monotonic() + data["ttl"] / 2
+
+
+def get_vault_client():
+    """long-lived vault client, sharing one pool of keep-alive connections, the token is renewed before it expires"""
+    with vault_lock:
+        client = vault_client["client"]
+        if client is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=VAULT_POOL_MAXSIZE)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            client = hvac.Client(
+                url=vault_addr,
+                verify=not vault_skip_verify,
+                token=decrypt(hvac_token_enc),
+                strict_http=True,  # workaround BadRequest for LIST method (https://github.com/hvac/hvac/issues/773)
+                session=session,
+            )
+            vault_client["client"] = client
+            vault_client["renew_at"] = token_renew_time(client)
+        elif (
+            vault_client["renew_at"] is not None
+            and time.monotonic() >= vault_client["renew_at"]
+        ):
+            client.auth.token.renew_self()
+            vault_client["renew_at"] = token_renew_time(client)
+        return client
+
+
+def reset_vault_client():
+    """after an error the client is created again and the known vault state is read again"""
+    with vault_lock:
+        vault_client["client"] = None
+        for known in vault_state.values():
+            known.clear()
+
+
+def is_known(kind, name):
+    seen = vault_state[kind].get(name)
+    return seen is not None and time.monotonic() - seen < VAULT_STATE_CACHE_SECONDS
+
+
+def set_known(kind, name):
+    vault_state[kind][name] = time.monotonic()
+
 
 @logwrapper
 def setupSecretsManagement(
@@ -527,14 +683,15 @@ def setupSecretsManagement(
         logw.info("secrets_mount", secrets_mount)
         logw.info("secrets_base_path", secrets_base_path)
 
-        token = decrypt(hvac_token_enc)
-        # Authentication
-        client = hvac.Client(
-            url=vault_addr,
-            verify=not vault_skip_verify,
-            token=token,
-            strict_http=True,  # workaround BadRequest for LIST method (https://github.com/hvac/hvac/issues/773)
-        )
+        if (
+            is_known("mounts", secrets_mount)
+            and is_known("policies", policy_name)
+            and is_known("roles", login_role)
+        ):
+            logw.info("  KV v2 engine, policy and role already exist (cached)", ciid)
+            return
+
+        client = get_vault_client()
 
         # == enable KV v2 engine
         # https://hvac.readthedocs.io/en/stable/source/hvac_api_system_backend.html?highlight=mount#hvac.api.system_backend.Mount.enable_secrets_engine
@@ -553,6 +710,7 @@ def setupSecretsManagement(
                     "description": f"ODA SecretsManagement for {sman_namespace}:{sman_name}",
                 },
             )
+        set_known("mounts", secrets_mount)
 
         # == create policy
         # https://hvac.readthedocs.io/en/stable/usage/system_backend/policy.html#create-or-update-policy
@@ -573,6 +731,7 @@ def setupSecretsManagement(
                 name=policy_name,
                 policy=policy,
             )
+        set_known("policies", policy_name)
 
         # == create role
         # https://hvac.readthedocs.io/en/stable/usage/auth_methods/jwt-oidc.html#create-role
@@ -612,9 +771,11 @@ def setupSecretsManagement(
                 allowed_redirect_uris=allowed_redirect_uris,  # why mandatory?
                 path=auth_path,
             )
+        set_known("roles", login_role)
 
     except Exception as e:
         logw.exception("ERROR setup vault {sman_name}.{sman_namespace} failed!", e)
+        reset_vault_client()
         raise kopf.TemporaryError(e)
 
 
@@ -632,15 +793,13 @@ def deleteSecretsManagement(logw: LogWrapper, sman_namespace: str, sman_name: st
         logw.info("login_role", login_role)
         logw.info("secrets_mount", secrets_mount)
 
-        token = decrypt(hvac_token_enc)
-        # Authentication
-        client = hvac.Client(
-            url=vault_addr,
-            verify=not vault_skip_verify,
-            token=token,
-        )
+        vault_state["mounts"].pop(secrets_mount, None)
+        vault_state["policies"].pop(policy_name, None)
+        vault_state["roles"].pop(login_role, None)
+        client = get_vault_client()
     except Exception as e:
         logw.exception(f"ERRPR delete vault {sman_name} failed!", e)
+        reset_vault_client()
         raise kopf.TemporaryError(e)  # allow the operator to retry
 
     # == disable KV secrets engine
@@ -651,6 +810,7 @@ def deleteSecretsManagement(logw: LogWrapper, sman_namespace: str, sman_name: st
         client.sys.disable_secrets_engine(secrets_mount)
     except Exception as e:
         logw.exception(f"ERRPR disable secrets {secrets_mount} failed!", e)
+        reset_vault_client()
         raise kopf.TemporaryError(e)  # allow the operator to retry
 
     # == delete role
@@ -669,45 +829,114 @@ def deleteSecretsManagement(logw: LogWrapper, sman_namespace: str, sman_name: st
     client.sys.delete_policy(name=policy_name)
 
 
+# pods without sidecar are restarted in batches of this size, waiting RESTART_BATCH_INTERVAL seconds between the batches
+RESTART_BATCH_SIZE = int(os.getenv("RESTART_BATCH_SIZE", "5"))
+RESTART_BATCH_INTERVAL = float(os.getenv("RESTART_BATCH_INTERVAL", "2"))
+
+
+SIDECAR_POD_SELECTOR = f"{secretsmanagementtype_label}=sidecar"
+# kopf filters handler labels in the operator, only settings.watching.label_selectors (newer kopf) filters
+# on the API server. Without it the pods are listed when needed instead of watching every pod.
+POD_WATCH_SELECTOR_SUPPORTED = hasattr(
+    kopf.OperatorSettings().watching, "label_selectors"
+)
+
+
+def sidecar_pods(namespace, name, spec, **kwargs):
+    """Index of the pods with the secretsmanagement label by namespace and service account.
+
+    The values are (pod name, has smansidecar container).
+    """
+    has_sidecar = any(
+        container.get("name") == "smansidecar"
+        for container in spec.get("containers", [])
+    )
+    return {(namespace, spec.get("serviceAccountName")): (name, has_sidecar)}
+
+
+if POD_WATCH_SELECTOR_SUPPORTED:
+    kopf.index("", "v1", "pods", labels={secretsmanagementtype_label: "sidecar"})(
+        sidecar_pods
+    )
+
+
+@functools.lru_cache(maxsize=256)
+def compile_pod_selector(pattern):
+    """Compiled fnmatch pattern of a podSelector field, None matches everything"""
+    if not pattern:
+        return None
+    return re.compile(fnmatch.translate(pattern))
+
+
+def selector_matches(pattern, value):
+    selector = compile_pod_selector(pattern)
+    return selector is None or (value is not None and selector.match(value) is not None)
+
+
 @logwrapper
-def restart_pods_with_missing_sidecar(
-    logw: LogWrapper, namespace, podsel_name, podsel_namespace, podsel_serviceaccount
+async def restart_pods_with_missing_sidecar(
+    logw: LogWrapper,
+    namespace,
+    podsel_name,
+    podsel_namespace,
+    podsel_serviceaccount,
+    pod_index=None,
 ):
-    label_selector = "oda.tmforum.org/secretsmanagement=sidecar"
+    label_selector = SIDECAR_POD_SELECTOR
     logw.info(
         f"searching for PODs to restart in namespace {namespace} with label {label_selector}"
     )
-    v1 = kubernetes.client.CoreV1Api()
-    pod_list = v1.list_namespaced_pod(namespace, label_selector=label_selector)
-    for pod in pod_list.items:
-        pod_namespace = pod.metadata.namespace
-        pod_name = pod.metadata.name
-        pod_serviceAccountName = pod.spec.service_account_name
-        matches = True
-        if podsel_name and not fnmatch.fnmatch(pod_name, podsel_name):
-            logw.debug(f"name {pod_name} does not match {podsel_name}")
-            matches = False
-        if podsel_namespace and not fnmatch.fnmatch(pod_namespace, podsel_namespace):
-            logw.debug(f"namespace {pod_namespace} does not match {podsel_namespace}")
-            matches = False
-        if podsel_serviceaccount and not fnmatch.fnmatch(
-            pod_serviceAccountName, podsel_serviceaccount
-        ):
-            logw.debug(
-                f"serviceaccount {pod_serviceAccountName} does not match {podsel_serviceaccount}"
+    core_v1_api = k8s_async.core_v1_api()
+    if pod_index is None:
+        pod_list = await core_v1_api.list_namespaced_pod(
+            namespace, label_selector=label_selector
+        )
+        pods = [
+            (
+                pod.metadata.namespace,
+                pod.spec.service_account_name,
+                pod.metadata.name,
+                has_container(pod, "smansidecar"),
             )
-            matches = False
-
-        has_sidecar = has_container(pod, "smansidecar")
-
+            for pod in pod_list.items
+        ]
+    else:
+        pods = [
+            (pod_namespace, pod_serviceAccountName, pod_name, has_sidecar)
+            for (pod_namespace, pod_serviceAccountName), entries in pod_index.items()
+            if pod_namespace == namespace
+            and selector_matches(podsel_serviceaccount, pod_serviceAccountName)
+            for pod_name, has_sidecar in entries
+        ]
+
+    to_restart = []
+    for pod_namespace, pod_serviceAccountName, pod_name, has_sidecar in pods:
+        matches = (
+            selector_matches(podsel_name, pod_name)
+            and selector_matches(podsel_namespace, pod_namespace)
+            and selector_matches(podsel_serviceaccount, pod_serviceAccountName)
+        )
         logw.info(
             "INFO FOR POD",
             f"{pod_namespace}:{pod_name}:{pod_serviceAccountName}, matches: {matches}, has sidecar: {has_sidecar}",
         )
         if matches and not has_sidecar:
+            to_restart.append((pod_namespace, pod_name))
+
+    for batch_start in range(0, len(to_restart), RESTART_BATCH_SIZE):
+        if batch_start > 0:
+            await asyncio.sleep(RESTART_BATCH_INTERVAL)
+        batch = to_restart[batch_start : batch_start + RESTART_BATCH_SIZE]
+        for pod_namespace, pod_name in batch:
             logw.info("RESTARTING POD", f"{pod_namespace}:{pod_name}")
-            body = kubernetes.client.V1DeleteOptions()
-            v1.delete_namespaced_pod(pod_name, pod_namespace, body=body)
+        await asyncio.gather(
+            *[
+                core_v1_api.delete_namespaced_pod(
+                    pod_name, pod_namespace, body=kubernetes.client.V1DeleteOptions()
+                )
+                for pod_namespace, pod_name in batch
+            ]
+        )
 
 
 # when an oda.tmforum.org secretsmanagement resource is created or updated, configure policy and role
@@ -733,15 +962,28 @@ async def secretsmanagementCreate(
     pod_namespace = safe_get(None, spec, "podSelector", "namespace")
     pod_service_account = safe_get(None, spec, "podSelector", "serviceaccount")
 
-    setupSecretsManagement(
-        logw, sman_namespace, sman_name, pod_name, pod_namespace, pod_service_account
+    await k8s_async.run_blocking(
+        setupSecretsManagement,
+        logw,
+        sman_namespace,
+        sman_name,
+        pod_name,
+        pod_namespace,
+        pod_service_account,
     )
 
     if not implementationReady(body):
-        setSecretsManagementReady(logw, sman_namespace, sman_name)
+        await k8s_async.run_blocking(
+            setSecretsManagementReady, logw, sman_namespace, sman_name
+        )
 
-    restart_pods_with_missing_sidecar(
-        logw, sman_namespace, pod_name, pod_namespace, pod_service_account
+    await restart_pods_with_missing_sidecar(
+        logw,
+        sman_namespace,
+        pod_name,
+        pod_namespace,
+        pod_service_account,
+        kwargs.get("sidecar_pods"),
     )
 
 
@@ -763,7 +1005,9 @@ async def secretsmanagementDelete(
     sman_name = name  # spec['name']
     sman_namespace = namespace
 
-    deleteSecretsManagement(logw, sman_namespace, sman_name)
+    await k8s_async.run_blocking(
+        deleteSecretsManagement, logw, sman_namespace, sman_name
+    )
 
 
 @logwrapper
@@ -864,8 +1108,8 @@ async def patch_securitySecretsManagement_ready(
             await asyncio.sleep(delay)
         logw.info("reading component", parent_component_name)
         try:
-            api_instance = kubernetes.client.CustomObjectsApi()
-            parent_component = api_instance.get_namespaced_custom_object(
+            api_instance = k8s_async.custom_objects_api()
+            parent_component = await api_instance.get_namespaced_custom_object(
                 COMP_GROUP,
                 COMP_VERSION,
                 namespace,
@@ -896,7 +1140,7 @@ async def patch_securitySecretsManagement_ready(
         )
         sman_status["ready"] = True
         try:
-            _ = api_instance.patch_namespaced_custom_object(
+            _ = await api_instance.patch_namespaced_custom_object(
                 COMP_GROUP,
                 COMP_VERSION,
                 namespace,
@@ -4,6 +4,9 @@ import os
 import re
 import base64
 import urllib.parse
+import hashlib
+import json
+import time
 
 import kubernetes
 import kubernetes.client
@@ -70,8 +73,16 @@ logger.info("ENVOY_SECRET_NAME=%s", ENVOY_SECRET_NAME)
 
 componentname_label = os.getenv("COMPONENTNAME_LABEL", "oda.tmforum.org/componentName")
 
+# the services of a component are fetched from canvas-info-service once within this time (seconds) and shared by all its DependentAPIs
+SERVICES_CACHE_SECONDS = float(os.getenv("SERVICES_CACHE_SECONDS", "30"))
+# the envoy filter resources are rewritten after this time (seconds) even if nothing changed, to repair manual changes
+ENVOYFILTER_RESYNC_SECONDS = float(os.getenv("ENVOYFILTER_RESYNC_SECONDS", "600"))
+
 INSTANCES = {}
 
+component_services_cache = {}  # component name -> (fetch time, services)
+timer_metrics = {"ticks": 0, "processed": 0, "skipped": 0, "inventory_fetches": 0}
+
 
 @kopf.on.startup()
 def configure(settings: kopf.OperatorSettings, memo: kopf.Memo, **_):
@@ -87,6 +98,28 @@ def cavas_info_instance() -> ServiceInventoryAPI:
     return INSTANCES["svc_inv"]
 
 
+def get_component_services(comp_name):
+    """services of the component from canvas-info-service, shared by all DependentAPIs of the component for SERVICES_CACHE_SECONDS"""
+    cached = component_services_cache.get(comp_name)
+    if cached is not None and time.monotonic() - cached[0] < SERVICES_CACHE_SECONDS:
+        return cached[1]
+    svcs = cavas_info_instance().list_services(component_name=comp_name)
+    timer_metrics["inventory_fetches"] += 1
+    component_services_cache[comp_name] = (time.monotonic(), svcs)
+    return svcs
+
+
+def desired_state_hash(svcs, client_id, client_secret):
+    """hash over everything the envoy filter resources are generated from"""
+    desired_state = {
+        "services": sorted((svc["id"], svc["componentName"], svc["dependencyName"], svc["url"]) for svc in svcs),
+        "client_id": client_id,
+        "client_secret": client_secret,
+        "token_endpoint": OAUTH2_TOKEN_ENDPOINT,
+    }
+    return hashlib.sha256(json.dumps(desired_state).encode()).hexdigest()
+
+
 def quick_get_comp_name(body):
     return safe_get(None, body, "metadata", "labels", componentname_label)
 
@@ -429,9 +462,21 @@ async def depapi_timer(meta, spec, body, namespace, labels, name, status, memo:
     memo.counter = memo.get("counter", 0) + 1
     logw.debug("memo counter", f"called {memo.counter} times")
 
-    svc_info = cavas_info_instance()
-    svcs = svc_info.list_services(component_name=comp_name)
+    timer_metrics["ticks"] += 1
+    svcs = get_component_services(comp_name)
     logw.debug(f"querying services for componenent {comp_name} from canvas-info-service", len(svcs))
+
+    # skip all writes, if neither the services nor the client credentials have changed since the last successful run
+    if svcs:
+        (client_id, client_secret) = read_credentials(namespace, comp_name)
+    else:
+        (client_id, client_secret) = (None, None)
+    state_hash = desired_state_hash(svcs, client_id, client_secret)
+    if memo.get("desired_state_hash") == state_hash and time.monotonic() - memo.get("desired_state_time", 0) < ENVOYFILTER_RESYNC_SECONDS:
+        timer_metrics["skipped"] += 1
+        logw.debug("services and credentials unchanged, skipping", timer_metrics)
+        return
+
     for svc in svcs:
         id = svc["id"]
         logw.debug(f'svcid {svc["id"]}', svc)
@@ -445,3 +490,7 @@ async def depapi_timer(meta, spec, body, namespace, labels, name, status, memo:
             )
             raise ValueError("componentName '{componentName}' does not match filter criteria '{comp_name}' for service id {id}")
         process_envoy_filter(logw, namespace, id, componentName, dependencyName, url)
+    memo.desired_state_hash = state_hash
+    memo.desired_state_time = time.monotonic()
+    timer_metrics["processed"] += 1
+    logw.debug("timer metrics", timer_metrics)
@@ -7,15 +7,39 @@ from jinja2 import (
 )
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor
 import json
 import os
 
 from utils import safe_get
 
 
+PAYLOAD_TEMPLATE = "create-service-payload.json.jinja2"
+
+
 class ServiceInventoryAPI:
-    def __init__(self, endpoint):
+    """Client for the service inventory of the canvas-info-service.
+
+    All calls share one requests session, so connections to the service are kept alive and reused.
+    Connection errors, and 502/503/504 responses of GET and PATCH, are retried with exponential backoff.
+    """
+
+    def __init__(self, endpoint, retries=3, backoff_factor=0.5, pool_maxsize=10):
         self.endpoint = endpoint
+        self.pool_maxsize = pool_maxsize
+        retry = Retry(
+            total=retries,
+            backoff_factor=backoff_factor,
+            status_forcelist=(502, 503, 504),
+            allowed_methods=frozenset({"GET", "PATCH"}),
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_maxsize, max_retries=retry)
+        self.session = requests.Session()
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
         template_dir = os.path.join(os.path.dirname(os.path.realpath(__file__)), "templates")
         # print(template_dir)
         loader = FileSystemLoader(template_dir)
@@ -26,6 +50,10 @@ class ServiceInventoryAPI:
         #     autoescape=select_autoescape()
         # )
         # =======================================================================
+        self.payload_template = None  # compiled on first use
+
+    def close(self):
+        self.session.close()
 
     def list_services(self, component_name=None, dependency_name=None, state="active"):
         """
@@ -43,7 +71,7 @@ class ServiceInventoryAPI:
             params["serviceCharacteristic.value"] = component_name
         elif dependency_name:
             params["serviceCharacteristic.value"] = dependency_name
-        response = requests.get(url, headers=header, params=params)  # , auth=HTTPBasicAuth(be_auth_user, be_auth_pw))
+        response = self.session.get(url, headers=header, params=params)  # , auth=HTTPBasicAuth(be_auth_user, be_auth_pw))
         if response.status_code != 200:
             raise ValueError(f"Unexpected http status code {response.status_code}")
         svc_list = json.loads(response.content)
@@ -63,7 +91,7 @@ class ServiceInventoryAPI:
         # TODO[FH]: check format of id
         url = f"{self.endpoint}/service/{id}"
         header = {"accept": "application/json"}
-        response = requests.get(url, headers=header)
+        response = self.session.get(url, headers=header)
         if response.status_code != 200:
             raise ValueError(f"Unexpected http status code {response.status_code}")
         svc = json.loads(response.content)
@@ -82,8 +110,9 @@ class ServiceInventoryAPI:
           }'
         """
 
-        template = self.env.get_template("create-service-payload.json.jinja2")
-        payload = template.render(
+        if self.payload_template is None:
+            self.payload_template = self.env.get_template(PAYLOAD_TEMPLATE)
+        payload = self.payload_template.render(
             componentName=componentName,
             dependencyName=dependencyName,
             url=url,
@@ -94,13 +123,25 @@ class ServiceInventoryAPI:
 
         url = f"{self.endpoint}/service/{id}"
         header = {"accept": "application/json", "Content-Type": "application/json"}
-        response = requests.patch(url, headers=header, json=payload_dict)
+        response = self.session.patch(url, headers=header, json=payload_dict)
         if response.status_code != 200:
             raise ValueError(f"Unexpected http status code {response.status_code} - {response.content.decode()}")
         svc = json.loads(response.content)
         result = self._shorten(svc)
         return result
 
+    def update_services(self, services):
+        """
+        update many services, services is a list of dicts with the arguments of update_service (including id).
+        The services are updated concurrently over the pooled connections.
+        Returns the updated services in the order of the input list.
+        """
+        if len(services) <= 1:
+            return [self.update_service(**service) for service in services]
+        with ThreadPoolExecutor(max_workers=min(self.pool_maxsize, len(services))) as executor:
+            futures = [executor.submit(self.update_service, **service) for service in services]
+            return [future.result() for future in futures]
+
     def _shorten(self, svc: dict) -> dict:
         """
         convert this:
@@ -16,7 +16,7 @@ import subprocess
 import tempfile
 import time
 import yaml
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Set, Tuple
 from dataclasses import dataclass
 from enum import Enum
 
@@ -25,7 +25,8 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 # Constants
-HELM_COMMAND_DELAY = 2.0  # seconds
+HELM_RELEASE_POLL_SECONDS = float(os.getenv("HELM_RELEASE_POLL_SECONDS", "15"))
+HELM_MAX_CONCURRENT_COMMANDS = int(os.getenv("HELM_MAX_CONCURRENT_COMMANDS", "4"))
 DEFAULT_HELM_REPO_NAME = "oda-components"
 DEFAULT_HELM_REPO_URL = "https://tmforum-oda.github.io/reference-example-components"
 
@@ -66,6 +67,171 @@ class HelmAPIError(Exception):
     pass
 
 
+class HelmReleaseCache:
+    """
+    Cache of the Helm releases in all namespaces, shared by all HelmAPI instances.
+
+    The releases are read with `helm list -A -o json` by a background task every
+    HELM_RELEASE_POLL_SECONDS, and right after every install, upgrade and uninstall.
+    If helm may not list the releases of all namespaces (e.g. RBAC limited to some
+    namespaces), the releases are listed with `helm list -n` for every namespace asked for.
+    The output of `helm status` is cached per release until the release changes
+    (revision, status or update time in the release list).
+
+    Changes of a release are serialised with a lock per release, independent releases
+    are installed and upgraded concurrently (at most HELM_MAX_CONCURRENT_COMMANDS helm
+    processes at a time).
+    """
+
+    def __init__(self):
+        self.releases: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        self.release_status: Dict[Tuple[str, str], Tuple[tuple, Dict[str, Any]]] = {}
+        self.updated = 0.0
+        self.metrics = {"hits": 0, "refreshes": 0, "status_hits": 0, "status_misses": 0}
+        # None until `helm list -A` was tried, False if it failed before it ever succeeded
+        self.all_namespaces: Optional[bool] = None
+        # namespaces asked for, and the namespaces in the last refresh (None if all)
+        self.namespaces: Set[str] = set()
+        self.listed_namespaces: Optional[Set[str]] = set()
+        self._loop = None
+
+    def _bind_loop(self):
+        """Create the asyncio primitives for the running event loop."""
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            self._loop = loop
+            self._refresh_lock = asyncio.Lock()
+            self._release_locks: Dict[Tuple[str, str], asyncio.Lock] = {}
+            self._semaphore = asyncio.Semaphore(HELM_MAX_CONCURRENT_COMMANDS)
+            self._poller = None
+            self.updated = 0.0
+
+    @property
+    def semaphore(self) -> asyncio.Semaphore:
+        """Limits the number of concurrently running helm processes."""
+        self._bind_loop()
+        return self._semaphore
+
+    def release_lock(self, release_name: str, namespace: str) -> asyncio.Lock:
+        """Lock serialising the changes of one release."""
+        self._bind_loop()
+        return self._release_locks.setdefault((namespace, release_name), asyncio.Lock())
+
+    def covers(self, namespace: str) -> bool:
+        """Whether the last refresh has listed the releases of the namespace."""
+        return self.listed_namespaces is None or namespace in self.listed_namespaces
+
+    async def refresh(self, helm_api: "HelmAPI", max_age: float = 0.0, namespace: Optional[str] = None):
+        """
+        Read the releases of all namespaces with `helm list`.
+
+        Args:
+            helm_api: HelmAPI instance used to run helm
+            max_age: Skip the refresh if the cache is younger (seconds), e.g. because
+                a concurrent caller has refreshed it while this one was waiting
+            namespace: Namespace that must be listed, also if the cache is younger than max_age
+        """
+        self._bind_loop()
+        if namespace is not None:
+            self.namespaces.add(namespace)
+        async with self._refresh_lock:
+            if time.monotonic() - self.updated < max_age and (namespace is None or self.covers(namespace)):
+                return
+            releases_data = await self._list_releases(helm_api)
+            self.releases = {
+                (release["namespace"], release["name"]): release
+                for release in releases_data
+            }
+            self.updated = time.monotonic()
+            self.metrics["refreshes"] += 1
+            logger.debug(f"Helm release cache refreshed, {len(self.releases)} releases, metrics {self.metrics}")
+
+    async def _list_releases(self, helm_api: "HelmAPI") -> List[Dict[str, Any]]:
+        """Run `helm list -A`, or `helm list -n` per namespace if helm may not list all namespaces."""
+        if self.all_namespaces is not False:
+            try:
+                output = await helm_api._execute_helm_command(
+                    ["list", "-A", "--max", "0", "-o", "json"], log_output=False
+                )
+                self.all_namespaces = True
+                self.listed_namespaces = None
+                return json.loads(output) if output.strip() else []
+            except HelmAPIError as e:
+                logger.warning(f"Failed to list the Helm releases of all namespaces, listing per namespace: {e}")
+                if self.all_namespaces is None:
+                    self.all_namespaces = False
+
+        namespaces = set(self.namespaces)
+        outputs = await asyncio.gather(
+            *(
+                helm_api._execute_helm_command(
+                    ["list", "-n", namespace, "--max", "0", "-o", "json"], log_output=False
+                )
+                for namespace in sorted(namespaces)
+            )
+        )
+        self.listed_namespaces = namespaces
+        return [release for output in outputs if output.strip() for release in json.loads(output)]
+
+    async def _poll(self, helm_api: "HelmAPI"):
+        """Background task refreshing the cache every HELM_RELEASE_POLL_SECONDS."""
+        while True:
+            await asyncio.sleep(HELM_RELEASE_POLL_SECONDS)
+            try:
+                await self.refresh(helm_api, max_age=HELM_RELEASE_POLL_SECONDS / 2)
+            except (HelmAPIError, json.JSONDecodeError) as e:
+                logger.warning(f"Failed to refresh Helm release cache: {e}")
+
+    async def get_releases(self, helm_api: "HelmAPI", namespace: str) -> List[Dict[str, Any]]:
+        """
+        Releases of a namespace, from the cache.
+
+        The background poll is started on first use. The cache is refreshed before
+        answering only if the poll has not updated it for HELM_RELEASE_POLL_SECONDS,
+        or if the namespace has not been listed yet (see _list_releases).
+        """
+        self._bind_loop()
+        if self._poller is None or self._poller.done():
+            self._poller = asyncio.create_task(self._poll(helm_api))
+        if time.monotonic() - self.updated >= HELM_RELEASE_POLL_SECONDS or not self.covers(namespace):
+            await self.refresh(helm_api, max_age=HELM_RELEASE_POLL_SECONDS, namespace=namespace)
+        else:
+            self.metrics["hits"] += 1
+        return [
+            release
+            for (release_namespace, _), release in self.releases.items()
+            if release_namespace == namespace
+        ]
+
+    def get_status(self, release_name: str, namespace: str) -> Optional[Dict[str, Any]]:
+        """Cached `helm status` of a release, None if unknown or the release has changed since."""
+        key = (namespace, release_name)
+        cached = self.release_status.get(key)
+        if cached and cached[0] == self._status_key(key):
+            self.metrics["status_hits"] += 1
+            return cached[1]
+        self.metrics["status_misses"] += 1
+        return None
+
+    def set_status(self, release_name: str, namespace: str, status_data: Dict[str, Any]):
+        """Cache the `helm status` of a release, as long as it is in the release list."""
+        key = (namespace, release_name)
+        status_key = self._status_key(key)
+        if status_key is None:
+            self.release_status.pop(key, None)
+        else:
+            self.release_status[key] = (status_key, status_data)
+
+    def _status_key(self, key: Tuple[str, str]) -> Optional[tuple]:
+        release = self.releases.get(key)
+        if release is None:
+            return None
+        return (release.get("revision"), release.get("status"), release.get("updated"))
+
+
+release_cache = HelmReleaseCache()
+
+
 class HelmAPI:
     """
     Python wrapper for Helm CLI commands specifically designed for 
@@ -82,13 +248,16 @@ class HelmAPI:
         self.helm_command = helm_command
         self.logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
 
-    async def _execute_helm_command(self, command: List[str], capture_output: bool = True) -> str:
+    async def _execute_helm_command(self, command: List[str], capture_output: bool = True, log_output: bool = True) -> str:
         """
         Execute a Helm command asynchronously.
         
+        At most HELM_MAX_CONCURRENT_COMMANDS helm processes run at the same time.
+        
         Args:
             command: List of command parts
             capture_output: Whether to capture and return output
+            log_output: Whether to log the command and its output at info level (else debug)
             
         Returns:
             Command output as string
@@ -99,16 +268,18 @@ class HelmAPI:
         full_command = [self.helm_command] + command
         command_str = " ".join(full_command)
         
-        self.logger.info(f"Executing: {command_str}")
+        log_level = logging.INFO if log_output else logging.DEBUG
+        self.logger.log(log_level, f"Executing: {command_str}")
         
         try:
             if capture_output:
-                process = await asyncio.create_subprocess_exec(
-                    *full_command,
-                    stdout=asyncio.subprocess.PIPE,
-                    stderr=asyncio.subprocess.PIPE
-                )
-                stdout, stderr = await process.communicate()
+                async with release_cache.semaphore:
+                    process = await asyncio.create_subprocess_exec(
+                        *full_command,
+                        stdout=asyncio.subprocess.PIPE,
+                        stderr=asyncio.subprocess.PIPE
+                    )
+                    stdout, stderr = await process.communicate()
                 
                 if process.returncode != 0:
                     error_msg = f"Helm command failed: {command_str}\nError: {stderr.decode()}"
@@ -116,22 +287,19 @@ class HelmAPI:
                     raise HelmAPIError(error_msg)
                 
                 output = stdout.decode().strip()
-                self.logger.info(f"Helm output: {output}")
-                
-                # Add delay to avoid race conditions
-                await asyncio.sleep(HELM_COMMAND_DELAY)
+                self.logger.log(log_level, f"Helm output: {output}")
                 
                 return output
             else:
-                process = await asyncio.create_subprocess_exec(*full_command)
-                await process.wait()
+                async with release_cache.semaphore:
+                    process = await asyncio.create_subprocess_exec(*full_command)
+                    await process.wait()
                 
                 if process.returncode != 0:
                     error_msg = f"Helm command failed: {command_str}"
                     self.logger.error(error_msg)
                     raise HelmAPIError(error_msg)
                 
-                await asyncio.sleep(HELM_COMMAND_DELAY)
                 return ""
                 
         except FileNotFoundError:
@@ -293,18 +461,17 @@ class HelmAPI:
         """
         List Helm releases in a namespace.
         
+        The releases are served from the shared release cache (see HelmReleaseCache).
+        
         Args:
             namespace: Kubernetes namespace
             
         Returns:
             List of HelmRelease objects
         """
+        namespace = namespace or "components"
         try:
-            output = await self._execute_helm_command(["list", "-o", "json", "-n", namespace])
-            if not output.strip():
-                return []
-            
-            releases_data = json.loads(output)
+            releases_data = await release_cache.get_releases(self, namespace)
             releases = [
                 HelmRelease(
                     name=release["name"],
@@ -352,6 +519,22 @@ class HelmAPI:
         Returns:
             Dictionary with operation result
         """
+        async with release_cache.release_lock(release_name, namespace):
+            return await self._install_chart(
+                release_name, chart_name, namespace, repository, values, create_namespace, chart_version
+            )
+
+    async def _install_chart(
+        self,
+        release_name: str,
+        chart_name: str,
+        namespace: str,
+        repository: Optional[str],
+        values: Optional[Dict[str, Any]],
+        create_namespace: bool,
+        chart_version: Optional[str]
+    ) -> Dict[str, Any]:
+        """Install a Helm chart, the caller holds the lock of the release."""
         try:
             # Check if release already exists
             existing_releases = await self.list_releases(namespace)
@@ -400,6 +583,7 @@ class HelmAPI:
             try:
                 await self._execute_helm_command(command)
             finally:
+                await self._refresh_release_cache()
                 # Clean up temporary values file if created
                 if values_file_path and os.path.exists(values_file_path):
                     try:
@@ -453,6 +637,21 @@ class HelmAPI:
         Returns:
             Dictionary with operation result
         """
+        async with release_cache.release_lock(release_name, namespace):
+            return await self._upgrade_chart(
+                release_name, chart_name, namespace, repository, values, chart_version
+            )
+
+    async def _upgrade_chart(
+        self,
+        release_name: str,
+        chart_name: str,
+        namespace: str,
+        repository: Optional[str],
+        values: Optional[Dict[str, Any]],
+        chart_version: Optional[str]
+    ) -> Dict[str, Any]:
+        """Upgrade a Helm release, the caller holds the lock of the release."""
         try:
             # Check if release exists
             existing_releases = await self.list_releases(namespace)
@@ -498,6 +697,7 @@ class HelmAPI:
             try:
                 await self._execute_helm_command(command)
             finally:
+                await self._refresh_release_cache()
                 # Clean up temporary values file if created
                 if values_file_path and os.path.exists(values_file_path):
                     try:
@@ -539,6 +739,11 @@ class HelmAPI:
         Returns:
             Dictionary with operation result
         """
+        async with release_cache.release_lock(release_name, namespace):
+            return await self._uninstall_release(release_name, namespace)
+
+    async def _uninstall_release(self, release_name: str, namespace: str) -> Dict[str, Any]:
+        """Uninstall a Helm release, the caller holds the lock of the release."""
         try:
             # Check if release exists
             existing_releases = await self.list_releases(namespace)
@@ -552,7 +757,10 @@ class HelmAPI:
                     "namespace": namespace
                 }
             
-            await self._execute_helm_command(["uninstall", release_name, "-n", namespace])
+            try:
+                await self._execute_helm_command(["uninstall", release_name, "-n", namespace])
+            finally:
+                await self._refresh_release_cache()
             
             message = f"Successfully uninstalled release '{release_name}'"
             self.logger.info(message)
@@ -578,6 +786,8 @@ class HelmAPI:
         """
         Get the status of a Helm release.
         
+        The status is cached until the release changes (see HelmReleaseCache).
+        
         Args:
             release_name: Name of the release
             namespace: Kubernetes namespace
@@ -586,8 +796,12 @@ class HelmAPI:
             Dictionary with release status information
         """
         try:
-            output = await self._execute_helm_command(["status", release_name, "-n", namespace, "-o", "json"])
-            status_data = json.loads(output)
+            await release_cache.get_releases(self, namespace)
+            status_data = release_cache.get_status(release_name, namespace)
+            if status_data is None:
+                output = await self._execute_helm_command(["status", release_name, "-n", namespace, "-o", "json"])
+                status_data = json.loads(output)
+                release_cache.set_status(release_name, namespace, status_data)
             
             return {
                 "success": True,
@@ -672,6 +886,13 @@ class HelmAPI:
                 "namespace": namespace
             }
 
+    async def _refresh_release_cache(self):
+        """Refresh the release cache after a change, failures are left to the background poll."""
+        try:
+            await release_cache.refresh(self)
+        except (HelmAPIError, json.JSONDecodeError) as e:
+            self.logger.warning(f"Failed to refresh Helm release cache: {e}")
+
     def _flatten_dict(self, d: Dict[str, Any], parent_key: str = '', sep: str = '.') -> Dict[str, str]:
         """
         Flatten a nested dictionary for use with Helm --set flags.
@@ -1,10 +1,12 @@
 # Resource Inventory API module for making requests to Resource Inventory Component
 import logging
 from pathlib import Path
+import asyncio
+import importlib.util
 import json
 import httpx
 from httpx import Timeout
-from typing import Any, List, Dict
+from typing import Any, AsyncIterator, List, Dict
 from dotenv import load_dotenv
 import os
 import datetime
@@ -33,37 +35,80 @@ else:
     API_URL = f"http://{RELEASE_NAME}-resinv:8639/tmf-api/resourceInventoryManagement/v5"
 logger.info(f"API URL: {API_URL}")
 
+# Page size and number of pages requested ahead when iterating over all resources.
+# The TMF639 API caps the limit at its QUERY_LIMIT (250 by default), larger pages are shortened by the API.
+RESOURCE_PAGE_SIZE = int(os.environ.get("RESOURCE_PAGE_SIZE", "250"))
+RESOURCE_PREFETCH_PAGES = int(os.environ.get("RESOURCE_PREFETCH_PAGES", "2"))
 
-async def get_resource(
-    resource_id: str = None,
+# HTTP/2 needs the h2 package, installed with the httpx[http2] dependency.
+# Installs without it (e.g. a plain pip install httpx) fall back to HTTP/1.1.
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+HEADERS = {
+    "Content-Type": "application/json;charset=utf-8",
+    "Accept": "application/json;charset=utf-8",
+}
+
+# Configure timeouts (in seconds)
+TIMEOUT = Timeout(
+    connect=10.0,  # connection timeout
+    read=30.0,  # read timeout
+    write=10.0,  # write timeout
+    pool=5.0,  # pool timeout
+)
+
+_client: httpx.AsyncClient | None = None
+
+
+def get_client() -> httpx.AsyncClient:
+    """
+    Get the shared HTTP client, which keeps the connections to the API alive between requests.
+    
+    Returns:
+        The module-level httpx.AsyncClient, created on first use
+    """
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            headers=HEADERS,
+            timeout=TIMEOUT,
+            limits=httpx.Limits(
+                max_keepalive_connections=5,
+                max_connections=10,
+                keepalive_expiry=30.0,
+            ),
+            http2=HTTP2_AVAILABLE,
+            verify=VALIDATE_SSL,  # SSL certificate verification
+        )
+    return _client
+
+
+async def close_client():
+    """Close the shared HTTP client."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
+def build_params(
     fields: str = None,
     offset: int = None,
     limit: int = None,
     filter: dict = None,
-) -> dict[str, Any] | None:
+) -> dict:
     """
-    Get resource(s) from the Resource Inventory Management API.
+    Build the query parameters of a resource list request.
     
     Args:
-        resource_id: Specific resource ID to retrieve. If None, lists all resources.
         fields: Comma-separated list of fields to return
         offset: Pagination offset
         limit: Maximum number of items to return
         filter: Filter parameters as a dictionary
         
     Returns:
-        Dictionary containing the resource(s) or None if error
+        Dictionary of query parameters
     """
-    base_url = f"{API_URL}/resource"
-    
-    if resource_id:
-        url = f"{base_url}/{resource_id}"
-        logger.info(f"Getting resource with ID: {resource_id}")
-    else:
-        url = base_url
-        logger.info("Listing resources")
-
-    # Add query parameters if provided
     params = {}
     if fields:
         params["fields"] = fields
@@ -77,71 +122,169 @@ async def get_resource(
         for key, value in filter.items():
             # Format as per TMF API filtering convention
             params[key] = value
+    return params
+
+
+async def get_resource(
+    resource_id: str = None,
+    fields: str = None,
+    offset: int = None,
+    limit: int = None,
+    filter: dict = None,
+) -> dict[str, Any] | None:
+    """
+    Get resource(s) from the Resource Inventory Management API.
+    
+    Args:
+        resource_id: Specific resource ID to retrieve. If None, lists all resources.
+        fields: Comma-separated list of fields to return
+        offset: Pagination offset
+        limit: Maximum number of items to return
+        filter: Filter parameters as a dictionary
+        
+    Returns:
+        Dictionary containing the resource(s) or None if error
+    """
+    if resource_id:
+        url = f"{API_URL}/resource/{resource_id}"
+        logger.info(f"Getting resource with ID: {resource_id}")
+    else:
+        url = f"{API_URL}/resource"
+        logger.info("Listing resources")
+
+    # Add query parameters if provided
+    params = build_params(fields, offset, limit, filter)
+    if filter:
         logger.info(f"Applied filters: {filter}")
 
     if params:
         logger.info(f"With parameters: {params}")
 
-    headers = {
-        "Content-Type": "application/json;charset=utf-8",
-        "Accept": "application/json;charset=utf-8",
-    }
-    
-    # Configure timeouts (in seconds)
-    timeout = Timeout(
-        connect=10.0,  # connection timeout
-        read=30.0,  # read timeout
-        write=10.0,  # write timeout
-        pool=5.0,  # pool timeout
-    )
-
     # Make the request
     try:
-        async with httpx.AsyncClient(
-            timeout=timeout,
-            limits=httpx.Limits(max_keepalive_connections=5, max_connections=10),
-            verify=VALIDATE_SSL,  # SSL certificate verification
-        ) as client:
-            try:
-                logger.info(f"Sending GET request to: {url}")
-                logger.info(f"Headers: {headers}")
-
-                response = await client.get(url, headers=headers, params=params)
-                logger.info(f"Response status: {response.status_code}")
-                response.raise_for_status()
-
-                if response.status_code == 200:
-                    try:
-                        response_json = response.json()
-                        logger.info("Response received successfully")
-                        return response_json
-                    except json.JSONDecodeError as e:
-                        logger.error(f"Failed to decode JSON response: {e}")
-                        return None
-                else:
-                    logger.warning(f"Unexpected status code: {response.status_code}")
-                    return None
+        client = get_client()
+        try:
+            logger.info(f"Sending GET request to: {url}")
+            logger.info(f"Headers: {HEADERS}")
 
-            except httpx.TimeoutException as e:
-                logger.error(
-                    f"Timeout Error: Request timed out after {timeout.read} seconds"
-                )
-                return None
-            except httpx.HTTPStatusError as e:
-                logger.error(
-                    f"HTTP Status Error: {e.response.status_code} - {e.response.text}"
-                )
-                return None
-            except httpx.HTTPError as e:
-                logger.error(f"HTTP Error: {e}")
+            response = await client.get(url, params=params)
+            logger.info(f"Response status: {response.status_code}")
+            response.raise_for_status()
+
+            if response.status_code == 200:
+                try:
+                    response_json = response.json()
+                    logger.info("Response received successfully")
+                    return response_json
+                except json.JSONDecodeError as e:
+                    logger.error(f"Failed to decode JSON response: {e}")
+                    return None
+            else:
+                logger.warning(f"Unexpected status code: {response.status_code}")
                 return None
 
+        except httpx.TimeoutException as e:
+            logger.error(
+                f"Timeout Error: Request timed out after {TIMEOUT.read} seconds"
+            )
+            return None
+        except httpx.HTTPStatusError as e:
+            logger.error(
+                f"HTTP Status Error: {e.response.status_code} - {e.response.text}"
+            )
+            return None
+        except httpx.HTTPError as e:
+            logger.error(f"HTTP Error: {e}")
+            return None
+
     except Exception as e:
         logger.error(f"Unexpected error: {str(e)}")
         logger.exception("Stack trace:")
         return None
 
 
+async def iter_resources(
+    fields: str = None,
+    filter: dict = None,
+    offset: int = 0,
+    max_items: int = None,
+    page_size: int = RESOURCE_PAGE_SIZE,
+    prefetch: int = RESOURCE_PREFETCH_PAGES,
+) -> AsyncIterator[dict[str, Any]]:
+    """
+    Iterate over all resources matching the filter, following offset/limit pages.
+    
+    While the resources of one page are consumed, up to `prefetch` following pages
+    are already requested, so only a bounded number of pages is held in memory.
+    The iteration ends on an empty page or when the X-Total-Count header of the API
+    is reached. If the API returns fewer resources than requested (its QUERY_LIMIT is
+    lower than page_size), the page size is reduced and the prefetched pages are requested again.
+    
+    Args:
+        fields: Comma-separated list of fields to return (projection done by the API)
+        filter: Filter parameters as a dictionary
+        offset: Offset of the first resource
+        max_items: Maximum number of resources to return (None for all)
+        page_size: Number of resources requested per page
+        prefetch: Number of pages requested ahead of the consumer
+        
+    Yields:
+        The resources, one at a time
+        
+    Raises:
+        httpx.HTTPError: If a page cannot be retrieved
+    """
+    client = get_client()
+    url = f"{API_URL}/resource"
+    logger.info(f"Iterating resources with fields: {fields}, filter: {filter}, page size: {page_size}")
+
+    async def fetch_page(page_offset: int, limit: int) -> tuple[list, int | None]:
+        if max_items is not None:
+            limit = min(limit, offset + max_items - page_offset)
+        response = await client.get(
+            url, params=build_params(fields, page_offset, limit, filter)
+        )
+        response.raise_for_status()
+        total = response.headers.get("X-Total-Count")
+        return response.json(), int(total) if total else None
+
+    async def cancel(tasks: list):
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    pending = []
+    next_offset = offset
+    position = offset
+    try:
+        while True:
+            # keep up to prefetch + 1 page requests in flight
+            while len(pending) <= prefetch and (
+                max_items is None or next_offset < offset + max_items
+            ):
+                pending.append(asyncio.create_task(fetch_page(next_offset, page_size)))
+                next_offset += page_size
+            if not pending:
+                break
+            page, total = await pending.pop(0)
+            for resource in page:
+                yield resource
+            position += len(page)
+            if not page or (total is not None and position >= total):
+                break
+            if len(page) < page_size:
+                # the API capped the limit, the prefetched pages start at the wrong offsets
+                logger.debug(f"Page size reduced from {page_size} to {len(page)}")
+                page_size = len(page)
+                await cancel(pending)
+                pending = []
+                next_offset = position
+        logger.info(f"Iterated {position - offset} resources")
+    finally:
+        await cancel(pending)
+
+
 async def main():
     """Main function to demonstrate getting resources using example parameters."""
     logger.info("Starting Resource Inventory API demonstration")
@@ -23,7 +23,8 @@ import uvicorn
 
 
 # Import API functionality
-from resource_inventory_api import get_resource
+from resource_inventory_api import get_resource, iter_resources
+import httpx
 
 # Import Helm API functionality
 from helm_api import HelmAPI, HelmAPIError
@@ -65,6 +66,7 @@ async def resource_get(
     offset: int = None,
     limit: int = None,
     filter: dict = None,
+    all_pages: bool = False,
 ) -> dict:
     """Retrieve resource information from the TM Forum Resource Inventory Management API.
 
@@ -76,8 +78,14 @@ async def resource_get(
         fields: Optional comma-separated list of fields to include in the response.
         offset: Optional starting position for paginated results.
         limit: Optional maximum number of results to return.
-        filter: Optional dictionary of filter criteria to apply to the search.    Returns:
-        A dictionary containing the resource(s) information or an error message.
+        filter: Optional dictionary of filter criteria to apply to the search.
+        all_pages: Optional, if true, all matching resources are retrieved page by page (starting at
+            offset, at most limit resources). For very large inventories use limit to bound the number
+            of resources and fields to reduce the size of each resource.
+
+    Returns:
+        A dictionary containing the resource(s) information or an error message. With all_pages the
+        dictionary holds the resources in "items" and their number in "count".
     """
     if filter:
         logger.info(f"MCP Tool - Getting resources with filter: {filter}")
@@ -86,6 +94,22 @@ async def resource_get(
             f"MCP Tool - Getting resource with ID: {resource_id if resource_id else 'ALL'}"
         )
     
+    if all_pages and not resource_id:
+        try:
+            items = [
+                resource
+                async for resource in iter_resources(
+                    fields=fields,
+                    filter=filter,
+                    offset=offset or 0,
+                    max_items=limit,
+                )
+            ]
+            return {"items": items, "count": len(items)}
+        except httpx.HTTPError as e:
+            logger.warning(f"Failed to retrieve resource data: {e}")
+            return {"error": "Failed to retrieve resource data"}
+
     result = await get_resource(
         resource_id=resource_id,
         fields=fields,
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the Helm release cache in helm_api.py.
+
+The helm binary is not needed, HelmAPI._execute_helm_command is replaced by a fake.
+"""
+
+import asyncio
+import json
+import os
+import sys
+
+import pytest
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+import helm_api
+from helm_api import HelmAPI, HelmAPIError, HelmReleaseCache
+
+
+class FakeHelm(HelmAPI):
+    """HelmAPI recording the helm commands, with an in-memory list of releases.
+
+    With list_all=False `helm list -A` fails, like with RBAC limited to some namespaces.
+    """
+
+    def __init__(self, list_all=True):
+        super().__init__()
+        self.list_all = list_all
+        self.commands = []
+        self.releases = {("components", "r1"): 1}
+        self.running = 0
+        self.max_running = 0
+
+    async def _execute_helm_command(self, command, capture_output=True, log_output=True):
+        self.commands.append(command)
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        try:
+            if command[0] in ("install", "upgrade"):
+                await asyncio.sleep(0.05)
+                key = (command[command.index("-n") + 1], command[1])
+                self.releases[key] = self.releases.get(key, 0) + 1
+                return ""
+            if command[0] == "list":
+                if "-A" in command and not self.list_all:
+                    raise HelmAPIError("cannot list releases at the cluster scope")
+                namespaces = [command[command.index("-n") + 1]] if "-n" in command else None
+                return json.dumps(
+                    [
+                        {
+                            "name": name,
+                            "namespace": namespace,
+                            "revision": str(revision),
+                            "updated": "",
+                            "status": "deployed",
+                            "chart": "c-1.0.0",
+                        }
+                        for (namespace, name), revision in self.releases.items()
+                        if namespaces is None or namespace in namespaces
+                    ]
+                )
+            if command[0] == "status":
+                return json.dumps({"name": command[1], "version": self.releases[("components", command[1])]})
+            return ""
+        finally:
+            self.running -= 1
+
+
+@pytest.fixture
+def helm(monkeypatch):
+    monkeypatch.setattr(helm_api, "release_cache", HelmReleaseCache())
+    return FakeHelm()
+
+
+def count(helm, verb):
+    return sum(1 for command in helm.commands if command[0] == verb)
+
+
+async def test_reads_are_served_from_cache(helm):
+    for _ in range(10):
+        releases = await helm.list_releases("components")
+        status = await helm.get_release_status("r1", "components")
+    assert [release.name for release in releases] == ["r1"]
+    assert status["status"]["version"] == 1
+    assert count(helm, "list") == 1
+    assert count(helm, "status") == 1
+
+
+async def test_upgrade_refreshes_cache_and_status(helm):
+    await helm.get_release_status("r1", "components")
+    result = await helm.upgrade_chart("r1", "c", namespace="components")
+    status = await helm.get_release_status("r1", "components")
+    assert result["success"]
+    assert status["status"]["version"] == 2
+    assert count(helm, "status") == 2
+
+
+async def test_independent_installs_run_concurrently(helm):
+    results = await asyncio.gather(
+        *(helm.install_chart(f"new{i}", "c", namespace="components") for i in range(3))
+    )
+    assert all(result["success"] for result in results)
+    assert helm.max_running > 1
+    assert {release.name for release in await helm.list_releases("components")} == {"r1", "new0", "new1", "new2"}
+
+
+async def test_installs_of_one_release_are_serialised(helm):
+    results = await asyncio.gather(
+        helm.install_chart("new", "c", namespace="components"),
+        helm.install_chart("new", "c", namespace="components"),
+    )
+    assert sorted(result["success"] for result in results) == [False, True]
+    assert count(helm, "install") == 1
+
+
+async def test_lists_per_namespace_if_not_allowed_cluster_wide(helm):
+    helm = FakeHelm(list_all=False)
+    assert [release.name for release in await helm.list_releases("components")] == ["r1"]
+    result = await helm.install_chart("new", "c", namespace="other")
+    assert result["success"]
+    assert [release.name for release in await helm.list_releases("other")] == ["new"]
+    result = await helm.install_chart("new", "c", namespace="other")
+    assert not result["success"]
+    assert sum(1 for command in helm.commands if command[0] == "list" and "-A" in command) == 1
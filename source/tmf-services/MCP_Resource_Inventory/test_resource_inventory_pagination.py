@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the shared client and the paginated iteration in resource_inventory_api.py.
+
+The TMF639 API is replaced by an httpx.MockTransport serving an in-memory inventory.
+"""
+
+import os
+import sys
+
+import httpx
+import pytest
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+import resource_inventory_api
+from resource_inventory_api import get_client, get_resource, iter_resources
+
+INVENTORY = [{"id": str(i), "name": f"resource-{i}", "category": "Component"} for i in range(23)]
+
+
+class FakeInventory:
+    """Serves INVENTORY with offset/limit/fields like the TMF639 API.
+
+    query_limit caps the limit like the QUERY_LIMIT of the API, total_count adds the X-Total-Count header.
+    """
+
+    def __init__(self, query_limit: int = None, total_count: bool = False):
+        self.requests = []
+        self.query_limit = query_limit
+        self.total_count = total_count
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        params = request.url.params
+        offset = int(params.get("offset", 0))
+        limit = int(params.get("limit", len(INVENTORY)))
+        if self.query_limit:
+            limit = min(limit, self.query_limit)
+        page = INVENTORY[offset:offset + limit]
+        if "fields" in params:
+            fields = params["fields"].split(",")
+            page = [{key: value for key, value in resource.items() if key in fields} for resource in page]
+        headers = {"X-Total-Count": str(len(INVENTORY))} if self.total_count else {}
+        return httpx.Response(200, json=page, headers=headers)
+
+
+@pytest.fixture
+async def serve(monkeypatch):
+    clients = []
+
+    def serve(fake: FakeInventory) -> FakeInventory:
+        client = httpx.AsyncClient(transport=httpx.MockTransport(fake))
+        monkeypatch.setattr(resource_inventory_api, "_client", client)
+        clients.append(client)
+        return fake
+
+    yield serve
+    for client in clients:
+        await client.aclose()
+
+
+@pytest.fixture
+async def inventory(serve):
+    return serve(FakeInventory())
+
+
+async def test_client_is_shared(inventory):
+    assert get_client() is get_client()
+    await get_resource(limit=2)
+    await get_resource(resource_id="1")
+    assert len(inventory.requests) == 2
+
+
+async def test_iter_resources_follows_pages(inventory):
+    resources = [resource async for resource in iter_resources(page_size=5, prefetch=2)]
+    assert [resource["id"] for resource in resources] == [resource["id"] for resource in INVENTORY]
+
+
+async def test_iter_resources_projects_fields(inventory):
+    resources = [resource async for resource in iter_resources(fields="id", page_size=10)]
+    assert resources[0] == {"id": "0"}
+    assert all(request.url.params["fields"] == "id" for request in inventory.requests)
+
+
+async def test_iter_resources_offset_and_max_items(inventory):
+    resources = [resource async for resource in iter_resources(offset=3, max_items=7, page_size=5)]
+    assert [resource["id"] for resource in resources] == [str(i) for i in range(3, 10)]
+    assert max(int(request.url.params["offset"]) for request in inventory.requests) < 10
+
+
+async def test_iter_resources_with_capped_limit(serve):
+    serve(FakeInventory(query_limit=4))
+    resources = [resource async for resource in iter_resources(page_size=10, prefetch=2)]
+    assert [resource["id"] for resource in resources] == [resource["id"] for resource in INVENTORY]
+
+
+async def test_iter_resources_stops_at_total_count(serve):
+    inventory = serve(FakeInventory(total_count=True))
+    resources = [resource async for resource in iter_resources(page_size=5, prefetch=0)]
+    assert len(resources) == len(INVENTORY)
+    assert len(inventory.requests) == 5
+
+
+async def test_resource_get_all_pages(inventory):
+    pytest.importorskip("mcp.server.fastmcp")
+    from resource_inventory_mcp_server import resource_get
+
+    result = await resource_get(fields="id", offset=20, all_pages=True)
+    assert result == {"items": [{"id": "20"}, {"id": "21"}, {"id": "22"}], "count": 3}
@@ -1,5 +1,6 @@
+import os
 import sys
-import fileinput
+import time
 import datetime
 import argparse
 from rich.tree import Tree
@@ -50,13 +51,67 @@ def nvl(obj, none_value):
         return str(obj)
 
 
-def parse_log(lines):
-    result = []
-    last_entry = {"message": ""}
+# yielded instead of a line when no new input arrived within FOLLOW_POLL_SECONDS (only with --follow)
+IDLE = None
+FOLLOW_POLL_SECONDS = 1.0
+
+
+def read_log_lines(filename, follow):
+    """Yield the input lines one by one, without reading the whole input into memory.
+
+    With follow the input is read like "tail -f" and IDLE is yielded whenever there is no new input.
+    """
+    if filename == "-":  # stdin
+        if follow:
+            sysinq = config["sysinq"]
+            while True:
+                try:
+                    yield sysinq.get(timeout=FOLLOW_POLL_SECONDS)
+                except Empty:
+                    yield IDLE
+        else:
+            for line in sys.stdin:
+                yield line.rstrip("\n")
+        return
+    with open(filename, encoding="utf-8", errors="replace") as f:
+        if not follow:
+            for line in f:
+                yield line.rstrip("\n")
+            return
+        partial = ""
+        while True:
+            line = f.readline()
+            if line.endswith("\n"):
+                yield (partial + line).rstrip("\n")
+                partial = ""
+                continue
+            partial += line  # incomplete last line, wait for the rest
+            if os.path.getsize(filename) < f.tell():  # file was truncated
+                f.seek(0)
+                partial = ""
+            yield IDLE
+            time.sleep(FOLLOW_POLL_SECONDS)
+
+
+def iter_log_entries(lines):
+    """Parse log lines incrementally.
+
+    Lines that do not start a new entry are continuation lines of the previous message, so an entry is
+    yielded when the next entry starts, at IDLE or at the end of the input. IDLE is passed through.
+    """
+    pending = None
     for line in lines:
+        if line is IDLE:
+            if pending is not None:
+                yield pending
+                pending = None
+            yield IDLE
+            continue
         m = LINE_RX.match(line)
         if m:
-            entry = {
+            if pending is not None:
+                yield pending
+            pending = {
                 "time": m.group("time"),
                 "logger": m.group("logger"),
                 "level": m.group("level"),
@@ -67,11 +122,14 @@ def parse_log(lines):
                 "subject": nvl(m.group("subject"), ""),
                 "message": m.group("message"),
             }
-            result.append(entry)
-            last_entry = entry
-        else:
-            last_entry["message"] = f"{last_entry['message']}\n{line}"
-    return result
+        elif pending is not None:
+            pending["message"] = f"{pending['message']}\n{line}"
+    if pending is not None:
+        yield pending
+
+
+def parse_log(lines):
+    return list(entry for entry in iter_log_entries(lines) if entry is not IDLE)
 
 
 def checkCompFilter(compname, compfilter):
@@ -103,97 +161,90 @@ def calc_mintime_filter():
     return mintime.strftime(datetimeformat)
 
 
-def create_log_tree():
-    filename = config["filename"]
-    compfilter = config["compfilter"]
-    mintimefilter = calc_mintime_filter()
-    if filename == "-":  # stdin
-        if config["follow"]:
-            sysinq = config["sysinq"]
-            lines = []
-            try:
-                while True:
-                    line = sysinq.get(timeout=1.0)
-                    lines.append(line)
-            except Empty:
-                pass
-        else:
-            lines = list(fileinput.input(files=[]))
+def entry_text(entry):
+    message = (
+        f'{entry["subject"]}: {entry["message"]}'
+        if entry["subject"]
+        else entry["message"]
+    )
+
+    text = Text()
+    text.append(entry["time"] + " ", style="#808080")
+    if entry["function"]:
+        text.append(entry["function"] + ": ")
+    if entry["level"] == "INFO":
+        text.append(message, style="green")
+    elif entry["level"] == "ERROR":
+        text.append(message, style="red")
+    elif entry["level"] == "WARNING":
+        text.append(message, style="yellow")
+    elif entry["level"] == "DEBUG":
+        text.append(message, style="lightblue")
     else:
-        if config["follow"]:
-            raise ValueError("--follow not yet supported with file inputs")
-        lines = list(fileinput.input(files=[filename]))
-    entries = parse_log(lines)
-    logTree = {}
-    for entry in entries:
-        if not checkCompFilter(entry["component"], compfilter):
-            continue
-        if not checkTimeFilter(entry["time"], mintimefilter):
-            continue
-        next = logTree
-        if entry["component"] not in next:
-            next[entry["component"]] = {}
-        next = next[entry["component"]]
-        if entry["resource"] not in next:
-            next[entry["resource"]] = {}
-        next = next[entry["resource"]]
-        if entry["logger"] not in next:
-            next[entry["logger"]] = {}
-        next = next[entry["logger"]]
-        if entry["handler"] not in next:
-            next[entry["handler"]] = {}
-        next = next[entry["handler"]]
-        if entry["function"] not in next:
-            next[entry["function"]] = []
-        next = next[entry["function"]]
-        message = (
-            f'{entry["subject"]}: {entry["message"]}'
-            if entry["subject"]
-            else entry["message"]
-        )
-
-        text = Text()
-        text.append(entry["time"] + " ", style="#808080")
-        if entry["function"]:
-            text.append(entry["function"] + ": ")
-        if entry["level"] == "INFO":
-            text.append(message, style="green")
-        elif entry["level"] == "ERROR":
-            text.append(message, style="red")
-        elif entry["level"] == "WARNING":
-            text.append(message, style="yellow")
-        elif entry["level"] == "DEBUG":
-            text.append(message, style="lightblue")
-        else:
-            text.append(message)
-        next.append(text)
-    return logTree
+        text.append(message)
+    return text
 
 
-def recursive_build_tree(input_tree, output_tree):
-    if isinstance(input_tree, list):
-        for line in input_tree:
-            output_tree.add(line)
-        return
-    for k, v in input_tree.items():
-        if k:
-            child = output_tree.add(k)
-        else:
-            child = output_tree
-        recursive_build_tree(v, child)
+class LogTree:
+    """rich Tree of log entries grouped by component, resource, logger, handler and function.
+
+    New entries are appended to the existing nodes, the tree is never rebuilt.
+    """
+
+    TREE_LEVELS = ("component", "resource", "logger", "handler", "function")
+
+    def __init__(self):
+        self.tree = Tree(f'[green]Canvas Log Viewer ({config["filename"]})')
+        self.nodes = {}  # path of labels -> tree node
+        self.size = 0
+
+    def add(self, entry):
+        node = self.tree
+        path = ()
+        for level in self.TREE_LEVELS:
+            label = entry[level]
+            if not label:  # empty labels get no node of their own
+                continue
+            path = path + (label,)
+            child = self.nodes.get(path)
+            if child is None:
+                child = node.add(label)
+                self.nodes[path] = child
+            node = child
+        node.add(entry_text(entry))
+        self.size += 1
 
 
 def show_log_tree():
-    first_time = True
-    while True:
-        logTree = create_log_tree()
-        if first_time or logTree:
-            tree = Tree(f'[green]Canvas Log Viewer ({config["filename"]})')
-            recursive_build_tree(logTree, tree)
-            rich_print(tree)
-        if not config["follow"]:
-            break
-        first_time = False
+    """Read, filter and print the log tree.
+
+    Without --stream and --follow one tree with all entries is printed at the end of the input.
+    With --stream <n> a tree is printed every n entries and then started again, so memory stays bounded for large logs.
+    With --follow a tree with the new entries is printed whenever the input is idle.
+    """
+    compfilter = config["compfilter"]
+    stream = config["stream"]
+    mintimefilter = calc_mintime_filter()
+    logTree = LogTree()
+    shown = False
+    for entry in iter_log_entries(
+        read_log_lines(config["filename"], config["follow"])
+    ):
+        if entry is IDLE or (stream and logTree.size >= stream):
+            if logTree.size or not shown:
+                rich_print(logTree.tree)
+                shown = True
+                logTree = LogTree()
+            mintimefilter = calc_mintime_filter()
+            if entry is IDLE:
+                continue
+        if not checkCompFilter(entry["component"], compfilter):
+            continue
+        if not checkTimeFilter(entry["time"], mintimefilter):
+            continue
+        logTree.add(entry)
+    if logTree.size or not shown:
+        rich_print(logTree.tree)
 
 
 def sysinreader():
@@ -241,6 +292,13 @@ if __name__ == "__main__":
         help="use file as input instead of stdin",
         default="-",
     )
+    parser.add_argument(
+        "-s",
+        "--stream",
+        type=int,
+        required=False,
+        help="print the tree every n entries instead of once at the end of the input (for large logs)",
+    )
     parser.add_argument(
         "-t",
         "--time-shift-hours",
@@ -260,8 +318,9 @@ if __name__ == "__main__":
     config["lasthours"] = args.last_hours
     config["filename"] = args.input_file
     config["tshifth"] = args.time_shift_hours
+    config["stream"] = args.stream
 
-    if config["follow"]:
+    if config["follow"] and config["filename"] == "-":
         config["sysinq"] = queue.Queue()
         threading.Thread(target=sysinreader, daemon=True).start()
     show_log_tree()